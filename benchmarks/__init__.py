@@ -0,0 +1,5 @@
+"""
+Micro-benchmarks for the per-call overhead of consumer methods.
+
+Run the suite with ``python -m benchmarks`` from the repository root.
+"""
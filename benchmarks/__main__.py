@@ -0,0 +1,106 @@
+"""
+Usage::
+
+    python -m benchmarks [-k PATTERN] [--save FILE] [--compare FILE]
+                         [--no-import-time]
+"""
+
+# Standard library imports
+import argparse
+import sys
+
+# Local imports
+from benchmarks import cases, importtime, runner
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Measure the per-call overhead of consumer methods.",
+    )
+    parser.add_argument(
+        "-k",
+        dest="pattern",
+        default="",
+        help="only run cases whose name contains this substring",
+    )
+    parser.add_argument(
+        "-n",
+        "--number",
+        type=int,
+        default=2000,
+        help="calls per timing round (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="timing rounds; the fastest is reported (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-import-time",
+        dest="import_time",
+        action="store_false",
+        help="skip measuring how long `import uplink` takes",
+    )
+    parser.add_argument(
+        "--save", metavar="FILE", help="save the results as a baseline"
+    )
+    parser.add_argument(
+        "--compare", metavar="FILE", help="compare against a saved baseline"
+    )
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        metavar="PERCENT",
+        help="exit with an error if any case is slower than the baseline "
+        "by more than this percentage",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    baseline, baseline_import_time = None, None
+    if args.compare:
+        baseline, baseline_import_time = runner.load(args.compare)
+
+    results = []
+    for case in cases.CASES:
+        if args.pattern not in case.name:
+            continue
+        try:
+            results.append(runner.measure(case, args.number, args.repeat))
+        except ImportError as error:
+            print("Skipping %s: %s" % (case.name, error), file=sys.stderr)
+
+    slowdowns = runner.report(results, baseline)
+
+    import_time = None
+    if args.import_time:
+        import_time = importtime.measure(repeat=args.repeat)
+        print()
+        importtime.report(import_time, baseline_import_time)
+        if baseline_import_time:
+            change = import_time.seconds / baseline_import_time - 1
+            slowdowns.append(("import uplink", change))
+        import_time = import_time.seconds
+
+    if args.save:
+        runner.save(results, args.save, import_time)
+
+    if args.max_slowdown is not None:
+        threshold = args.max_slowdown / 100.0
+        regressions = [name for name, s in slowdowns if s > threshold]
+        if regressions:
+            print(
+                "Slower than baseline: %s" % ", ".join(regressions),
+                file=sys.stderr,
+            )
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""
+Representative consumer method shapes to benchmark.
+
+Each case is a setup function that builds a consumer backed by the
+in-memory transport and returns a zero-argument callable that performs
+a single request. Cases that depend on an optional library are skipped
+when that library isn't installed.
+"""
+
+# Standard library imports
+import collections
+import typing
+
+# Local imports
+from uplink import (
+    Body,
+    Consumer,
+    QueryMap,
+    get,
+    json,
+    post,
+    ratelimit,
+    retry,
+    returns,
+)
+
+from benchmarks.transport import CannedResponse, InMemoryClient
+
+BASE_URL = "https://api.example.com/"
+
+USER = {"id": 140232, "login": "prkumar", "name": "P. Raj Kumar"}
+USERS = [dict(USER, id=i) for i in range(10)]
+
+Case = collections.namedtuple("Case", ["name", "setup"])
+
+CASES = []
+
+
+def case(name):
+    def decorator(setup):
+        CASES.append(Case(name, setup))
+        return setup
+
+    return decorator
+
+
+def _build(consumer_cls, body=USER):
+    client = InMemoryClient(CannedResponse(json=body))
+    return consumer_cls(base_url=BASE_URL, client=client)
+
+
+@case("static_path")
+def static_path():
+    class Service(Consumer):
+        @get("users")
+        def list_users(self):
+            pass
+
+    service = _build(Service)
+    return service.list_users
+
+
+@case("path_variables")
+def path_variables():
+    class Service(Consumer):
+        @get("users/{user}/repos/{repo}")
+        def get_repo(self, user, repo):
+            pass
+
+    service = _build(Service)
+    return lambda: service.get_repo("prkumar", "uplink")
+
+
+@case("query_map")
+def query_map():
+    class Service(Consumer):
+        @get("search/repositories")
+        def search(self, params: QueryMap):
+            pass
+
+    service = _build(Service)
+    params = {"q": "uplink", "sort": "stars", "order": "desc", "page": 2}
+    return lambda: service.search(params)
+
+
+@case("json_body")
+def json_body():
+    class Service(Consumer):
+        @json
+        @post("users")
+        def create_user(self, user: Body):
+            pass
+
+    service = _build(Service)
+    return lambda: service.create_user(USER)
+
+
+@case("returns_json")
+def returns_json():
+    class Service(Consumer):
+        @returns.json
+        @get("users/{user}")
+        def get_user(self, user):
+            pass
+
+    service = _build(Service)
+    return lambda: service.get_user("prkumar")
+
+
+@case("returns_json_typing")
+def returns_json_typing():
+    class Service(Consumer):
+        @returns.json
+        @get("users")
+        def list_users(self) -> typing.List[typing.Dict[str, str]]:
+            pass
+
+    service = _build(Service, body=USERS)
+    return service.list_users
+
+
+@case("returns_json_pydantic")
+def returns_json_pydantic():
+    import pydantic
+
+    class User(pydantic.BaseModel):
+        id: int
+        login: str
+        name: str
+
+    class Service(Consumer):
+        @returns.json
+        @get("users/{user}")
+        def get_user(self, user) -> User:
+            pass
+
+    service = _build(Service)
+    return lambda: service.get_user("prkumar")
+
+
+@case("returns_json_marshmallow")
+def returns_json_marshmallow():
+    import marshmallow
+
+    class UserSchema(marshmallow.Schema):
+        id = marshmallow.fields.Int()
+        login = marshmallow.fields.Str()
+        name = marshmallow.fields.Str()
+
+    class Service(Consumer):
+        @returns.json
+        @get("users/{user}")
+        def get_user(self, user) -> UserSchema():
+            pass
+
+    service = _build(Service)
+    return lambda: service.get_user("prkumar")
+
+
+@case("retry")
+def retry_():
+    class Service(Consumer):
+        @retry(max_attempts=3)
+        @get("users/{user}")
+        def get_user(self, user):
+            pass
+
+    service = _build(Service)
+    return lambda: service.get_user("prkumar")
+
+
+@case("ratelimit")
+def ratelimit_():
+    class Service(Consumer):
+        @ratelimit(calls=10**9, period=1)
+        @get("users/{user}")
+        def get_user(self, user):
+            pass
+
+    service = _build(Service)
+    return lambda: service.get_user("prkumar")
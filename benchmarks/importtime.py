@@ -0,0 +1,68 @@
+"""
+Measures how long ``import uplink`` takes in a fresh interpreter, using
+Python's ``-X importtime`` option.
+"""
+
+# Standard library imports
+import collections
+import subprocess
+import sys
+
+ImportTime = collections.namedtuple("ImportTime", ["seconds", "slowest"])
+
+
+def _parse(output):
+    # Each line looks like: "import time: self [us] | cumulative | name",
+    # where the name is indented to show nesting.
+    prefix = "import time:"
+    timings = {}
+    for line in output.splitlines():
+        if not line.startswith(prefix):
+            continue
+        _, cumulative, name = line[len(prefix) :].split("|")
+        try:
+            timings[name.strip()] = int(cumulative)
+        except ValueError:  # The header line
+            continue
+    return timings
+
+
+def _run(module):
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import %s" % module],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    return _parse(process.stderr)
+
+
+def measure(module="uplink", repeat=5, top=10):
+    """
+    Imports the module in several fresh interpreters and returns the
+    fastest total import time, along with the slowest dependencies
+    (measured by cumulative time) from that run.
+    """
+    best = None
+    for _ in range(repeat):
+        timings = _run(module)
+        if best is None or timings[module] < best[module]:
+            best = timings
+    slowest = sorted(
+        ((name, us / 1e6) for name, us in best.items() if name != module),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    return ImportTime(best[module] / 1e6, slowest[:top])
+
+
+def report(import_time, baseline=None, stream=None):
+    line = "import uplink: %.1f ms" % (import_time.seconds * 1e3)
+    if baseline:
+        line += " (%+.1f%% vs. baseline)" % (
+            100.0 * (import_time.seconds - baseline) / baseline
+        )
+    lines = [line, "", "Slowest imports (cumulative):"]
+    for name, seconds in import_time.slowest:
+        lines.append("  %-40s %8.1f ms" % (name, seconds * 1e3))
+    print("\n".join(lines), file=stream)
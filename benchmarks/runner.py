@@ -0,0 +1,122 @@
+"""Measures and reports the per-call cost of the benchmark cases."""
+
+# Standard library imports
+import collections
+import json
+import platform
+import timeit
+import tracemalloc
+
+Result = collections.namedtuple(
+    "Result", ["name", "ops_per_sec", "peak_bytes", "retained_blocks"]
+)
+
+
+def _measure_speed(func, number, repeat):
+    timer = timeit.Timer(func)
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return number / best
+
+
+def _measure_memory(func, number):
+    # Python doesn't expose a per-call allocation counter, so we report
+    # the peak memory allocated while a single call is in flight, along
+    # with the number of memory blocks that calls leave behind (e.g.,
+    # caches that grow on every call).
+    tracemalloc.start()
+    try:
+        peak = 0
+        for _ in range(number):
+            # Clearing the traces also resets the peak.
+            tracemalloc.clear_traces()
+            func()
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+
+        tracemalloc.clear_traces()
+        for _ in range(number):
+            func()
+        snapshot = tracemalloc.take_snapshot()
+        retained = sum(stat.count for stat in snapshot.statistics("filename"))
+    finally:
+        tracemalloc.stop()
+    return peak, retained / float(number)
+
+
+def measure(case, number, repeat):
+    func = case.setup()
+
+    # Warm up any caches populated by the first calls.
+    for _ in range(10):
+        func()
+
+    ops_per_sec = _measure_speed(func, number, repeat)
+    peak_bytes, retained_blocks = _measure_memory(func, min(number, 100))
+    return Result(case.name, ops_per_sec, peak_bytes, retained_blocks)
+
+
+def save(results, path, import_time=None):
+    data = {
+        "python": platform.python_version(),
+        "results": dict(
+            (r.name, {"ops_per_sec": r.ops_per_sec, "peak_bytes": r.peak_bytes})
+            for r in results
+        ),
+        "import_time": import_time,
+    }
+    with open(path, "w") as fp:
+        json.dump(data, fp, indent=2, sort_keys=True)
+
+
+def load(path):
+    """Returns the per-call results and import time of a baseline."""
+    with open(path) as fp:
+        data = json.load(fp)
+    return data["results"], data.get("import_time")
+
+
+def _format_change(current, previous):
+    if not previous:
+        return "n/a"
+    return "%+.1f%%" % (100.0 * (current - previous) / previous)
+
+
+def report(results, baseline=None, stream=None):
+    """
+    Writes a table of results to the given stream, comparing each
+    result against the baseline, if one is given.
+
+    Returns:
+        The names of cases that are slower than the baseline, paired
+        with the relative slowdown (e.g., 0.1 for 10%).
+    """
+    header = "%-28s %14s %14s %14s" % (
+        "case",
+        "ops/sec",
+        "peak B/call",
+        "blocks/call",
+    )
+    if baseline is not None:
+        header += " %12s %12s" % ("speed", "memory")
+    lines = [header, "-" * len(header)]
+    slowdowns = []
+    for result in results:
+        line = "%-28s %14s %14s %14.2f" % (
+            result.name,
+            "{:,.1f}".format(result.ops_per_sec),
+            "{:,}".format(result.peak_bytes),
+            result.retained_blocks,
+        )
+        previous = (baseline or {}).get(result.name)
+        if previous is not None:
+            line += " %12s %12s" % (
+                _format_change(result.ops_per_sec, previous["ops_per_sec"]),
+                _format_change(result.peak_bytes, previous["peak_bytes"]),
+            )
+            change = 1 - result.ops_per_sec / previous["ops_per_sec"]
+            if change > 0:
+                slowdowns.append((result.name, change))
+        elif baseline is not None:
+            line += " %12s %12s" % ("new", "new")
+        lines.append(line)
+    print("\n".join(lines), file=stream)
+    return slowdowns
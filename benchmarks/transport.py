@@ -0,0 +1,42 @@
+"""
+An in-memory HTTP client that serves canned responses, so that the
+benchmarks measure Uplink's own overhead rather than socket I/O.
+"""
+
+# Local imports
+from uplink.clients import interfaces, io
+
+
+class CannedResponse(object):
+    """A minimal stand-in for :py:class:`requests.Response`."""
+
+    def __init__(self, json=None, status_code=200, headers=None):
+        self._json = json
+        self.status_code = status_code
+        self.headers = headers if headers is not None else {}
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def json(self):
+        return self._json
+
+    def raise_for_status(self):
+        pass
+
+
+class InMemoryClient(interfaces.HttpClientAdapter):
+    """Returns the same response for every request, without any I/O."""
+
+    def __init__(self, response=None):
+        self._response = CannedResponse() if response is None else response
+
+    def io(self):
+        return io.BlockingStrategy()
+
+    def apply_callback(self, callback, response):
+        return callback(response)
+
+    def send(self, request):
+        return self._response
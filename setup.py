@@ -54,7 +54,9 @@ metadata = {
         "Programming Language :: Python :: Implementation :: PyPy",
     ],
     "keywords": "http api rest client retrofit",
-    "packages": find_packages(exclude=("tests", "tests.*")),
+    "packages": find_packages(
+        exclude=("tests", "tests.*", "benchmarks", "benchmarks.*")
+    ),
     "install_requires": install_requires,
     "extras_require": extras_require,
 }
@@ -111,3 +111,47 @@ def test_handle_client_exceptions(mock_client):
 
     with pytest.raises(service.exceptions.BaseClientException):
         service.list_repos("prkumar")
+
+
+class CustomInitService(uplink.Consumer):
+    def __init__(self, user, **kwargs):
+        super(CustomInitService, self).__init__(**kwargs)
+        self.user = user
+
+    @uplink.get("/users/{user}")
+    def get_user(self, user):
+        pass
+
+
+class AnnotatedInitService(CustomInitService):
+    @uplink.args(token=uplink.Header("Authorization"))
+    def __init__(self, token, **kwargs):
+        super(AnnotatedInitService, self).__init__("prkumar", **kwargs)
+
+
+@pytest.mark.parametrize("service_cls", [GitHubService, CustomInitService])
+def test_plain_get_skips_request_execution(mocker, mock_client, service_cls):
+    # Setup
+    execution_builder = mocker.patch.object(
+        uplink.clients.io, "RequestExecutionBuilder"
+    )
+    kwargs = {"base_url": BASE_URL, "client": mock_client}
+    if service_cls is CustomInitService:
+        service = service_cls("prkumar", **kwargs)
+        service.get_user("prkumar")
+    else:
+        service = service_cls(**kwargs)
+        service.forward("/users/prkumar/repos")
+
+    # Verify
+    assert len(mock_client.history) == 1
+    execution_builder.assert_not_called()
+
+
+def test_annotated_init_argument_audits_requests(mock_client):
+    service = AnnotatedInitService(
+        "token", base_url=BASE_URL, client=mock_client
+    )
+    service.get_user("prkumar")
+    request = mock_client.history[0]
+    assert request.headers == {"Authorization": "token"}
@@ -0,0 +1,116 @@
+# Third-party imports
+import pytest
+
+# Local imports
+from uplink import Consumer, circuit_breaker, get, retry
+from uplink.circuit_breaker import CircuitBreakerOpen
+
+# Constants
+OTHER_BASE_URL = "https://example.com/"
+
+
+def _base_url(request):
+    # The circuit breakers track each host separately, so give each test
+    # its own host.
+    return "https://%s.example.com/" % request.node.name.replace("_", "-")
+
+
+class GitHub(Consumer):
+    @circuit_breaker(failure_threshold=2, recovery_timeout=0.05)
+    @get("/users/{user}")
+    def get_user(self, user):
+        pass
+
+    @retry(max_attempts=5, backoff=retry.backoff.fixed(0))
+    @circuit_breaker(failure_threshold=2, recovery_timeout=10)
+    @get("/repos/{user}/{repo}")
+    def get_repo(self, user, repo):
+        pass
+
+    @circuit_breaker(
+        failure_threshold=1, recovery_timeout=10, when=retry.when.status(503)
+    )
+    @get("/orgs/{org}")
+    def get_org(self, org):
+        pass
+
+
+def test_circuit_breaker(request, mock_client):
+    # Setup
+    mock_client.with_side_effect(IOError)
+    github = GitHub(base_url=_base_url(request), client=mock_client)
+
+    # Run
+    for _ in range(2):
+        with pytest.raises(IOError):
+            github.get_user("prkumar")
+
+    # Verify: the request fails fast, without being sent
+    with pytest.raises(CircuitBreakerOpen):
+        github.get_user("prkumar")
+    assert len(mock_client.history) == 2
+
+
+def test_circuit_breaker_recovers(request, mock_client, mock_response):
+    import time
+
+    # Setup
+    mock_response.status_code = 200
+    mock_client.with_side_effect([IOError, IOError, mock_response])
+    github = GitHub(base_url=_base_url(request), client=mock_client)
+    for _ in range(2):
+        with pytest.raises(IOError):
+            github.get_user("prkumar")
+
+    # Run
+    time.sleep(0.05)
+    response = github.get_user("prkumar")
+
+    # Verify: the probe succeeded, so the circuit breaker closed
+    assert response is mock_response
+    mock_client.with_side_effect(None)
+    mock_client.with_response(mock_response)
+    assert github.get_user("prkumar") is mock_response
+
+
+def test_circuit_breaker_by_host(request, mock_client):
+    # Setup
+    mock_client.with_side_effect(IOError)
+    github = GitHub(base_url=_base_url(request), client=mock_client)
+    other = GitHub(base_url=OTHER_BASE_URL, client=mock_client)
+    for _ in range(2):
+        with pytest.raises(IOError):
+            github.get_user("prkumar")
+
+    # Verify: requests to another host are still sent
+    with pytest.raises(IOError):
+        other.get_user("prkumar")
+
+
+def test_circuit_breaker_stops_retries(request, mock_client):
+    # Setup
+    mock_client.with_side_effect(IOError)
+    github = GitHub(base_url=_base_url(request), client=mock_client)
+
+    # Run
+    with pytest.raises(CircuitBreakerOpen):
+        github.get_repo("prkumar", "uplink")
+
+    # Verify: the open circuit breaker ended the retries
+    assert len(mock_client.history) == 2
+
+
+def test_circuit_breaker_with_predicate(request, mock_client, mocker):
+    # Setup
+    not_found = mocker.Mock(status_code=404)
+    unavailable = mocker.Mock(status_code=503)
+    mock_client.with_side_effect([not_found, unavailable])
+    github = GitHub(base_url=_base_url(request), client=mock_client)
+
+    # Run
+    assert github.get_org("prkumar") is not_found
+    assert github.get_org("prkumar") is unavailable
+
+    # Verify
+    with pytest.raises(CircuitBreakerOpen):
+        github.get_org("prkumar")
@@ -0,0 +1,237 @@
+# Standard library imports
+import threading
+import time
+
+# Third-party imports
+import pytest
+import pytest_twisted
+
+# Local imports
+from uplink import coalesce, get, post, Consumer, Query
+from uplink.clients import io
+from tests import requires_python34
+
+# Constants
+BASE_URL = "https://api.github.com/"
+
+
+class GitHub(Consumer):
+    @coalesce
+    @get("/users/{user}")
+    def get_user(self, user, page: Query = None):
+        pass
+
+    @coalesce
+    @post("/users/{user}")
+    def update_user(self, user):
+        pass
+
+
+@coalesce()
+class CoalescedGitHub(Consumer):
+    @get("/users/{user}")
+    def get_user(self, user):
+        pass
+
+    @post("/users/{user}")
+    def update_user(self, user):
+        pass
+
+
+def _call_concurrently(func, args_list):
+    # Starts the calls at once, and waits for all of them to finish.
+    results = [None] * len(args_list)
+    barrier = threading.Barrier(len(args_list))
+
+    def call(index, args):
+        barrier.wait()
+        try:
+            results[index] = func(*args)
+        except Exception as error:
+            results[index] = error
+
+    threads = [
+        threading.Thread(target=call, args=item)
+        for item in enumerate(args_list)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_coalesce_with_threads(mock_client, mock_response):
+    # Setup
+    def send(*args):
+        # Hold the request in flight until all callers have called.
+        time.sleep(0.2)
+        return mock_response
+
+    mock_client.with_side_effect(send)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    results = _call_concurrently(github.get_user, [("prkumar",)] * 4)
+
+    # Verify
+    assert results == [mock_response] * 4
+    assert len(mock_client.history) == 1
+
+
+def test_coalesce_shares_failure(mock_client):
+    # Setup
+    error = IOError("connection reset")
+
+    def send(*args):
+        time.sleep(0.2)
+        raise error
+
+    mock_client.with_side_effect(send)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    results = _call_concurrently(github.get_user, [("prkumar",)] * 3)
+
+    # Verify
+    assert results == [error] * 3
+    assert len(mock_client.history) == 1
+
+
+def test_coalesce_different_requests(mock_client, mock_response):
+    # Setup
+    def send(*args):
+        time.sleep(0.1)
+        return mock_response
+
+    mock_client.with_side_effect(send)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    _call_concurrently(
+        github.get_user, [("prkumar",), ("brandon",), ("prkumar",)]
+    )
+    github.get_user("prkumar", page=2)
+
+    # Verify: requests differing in URL or params aren't coalesced
+    endpoints = sorted(call.endpoint for call in mock_client.history)
+    assert endpoints == ["/users/brandon", "/users/prkumar", "/users/prkumar"]
+    assert mock_client.history[-1].params == {"page": "2"}
+
+
+def test_coalesce_sends_again_once_finished(mock_client, mock_response):
+    # Setup
+    mock_client.with_response(mock_response)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    github.get_user("prkumar")
+    github.get_user("prkumar")
+
+    # Verify
+    assert len(mock_client.history) == 2
+
+
+@pytest.mark.parametrize("consumer_cls", [GitHub, CoalescedGitHub])
+def test_coalesce_ignores_unsafe_methods(
+    consumer_cls, mock_client, mock_response
+):
+    # Setup
+    def send(*args):
+        time.sleep(0.1)
+        return mock_response
+
+    mock_client.with_side_effect(send)
+    github = consumer_cls(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    _call_concurrently(github.update_user, [("prkumar",)] * 3)
+
+    # Verify
+    assert len(mock_client.history) == 3
+
+
+def test_coalesce_class_decorator(mock_client, mock_response):
+    # Setup
+    def send(*args):
+        time.sleep(0.2)
+        return mock_response
+
+    mock_client.with_side_effect(send)
+    github = CoalescedGitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    results = _call_concurrently(github.get_user, [("prkumar",)] * 3)
+
+    # Verify
+    assert results == [mock_response] * 3
+    assert len(mock_client.history) == 1
+
+
+@requires_python34
+def test_coalesce_with_asyncio(mock_client, mock_response):
+    import asyncio
+
+    # Setup
+    async def send(*args):
+        await asyncio.sleep(0.01)
+        return mock_response
+
+    mock_client.with_side_effect(send)
+    mock_client.with_io(io.AsyncioStrategy())
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    awaitable = asyncio.gather(*[github.get_user("prkumar") for _ in range(3)])
+    loop = asyncio.get_event_loop()
+    responses = loop.run_until_complete(awaitable)
+
+    # Verify
+    assert responses == [mock_response] * 3
+    assert len(mock_client.history) == 1
+
+
+@requires_python34
+def test_coalesce_with_asyncio_failure(mock_client):
+    import asyncio
+
+    # Setup
+    async def send(*args):
+        await asyncio.sleep(0.01)
+        raise IOError()
+
+    mock_client.with_side_effect(send)
+    mock_client.with_io(io.AsyncioStrategy())
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    awaitable = asyncio.gather(
+        *[github.get_user("prkumar") for _ in range(3)], return_exceptions=True
+    )
+    loop = asyncio.get_event_loop()
+    responses = loop.run_until_complete(awaitable)
+
+    # Verify
+    assert [type(r) for r in responses] == [IOError] * 3
+    assert len(mock_client.history) == 1
+
+
+@pytest_twisted.inlineCallbacks
+def test_coalesce_with_twisted(mock_client, mock_response):
+    from twisted.internet import defer, reactor, task
+
+    # Setup
+    mock_client.with_side_effect(
+        lambda *args: task.deferLater(reactor, 0.01, lambda: mock_response)
+    )
+    mock_client.with_io(io.TwistedStrategy())
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    responses = yield defer.gatherResults(
+        [github.get_user("prkumar") for _ in range(3)]
+    )
+
+    # Verify
+    assert responses == [mock_response] * 3
+    assert len(mock_client.history) == 1
@@ -0,0 +1,266 @@
+# Standard library imports
+import threading
+import time
+
+# Third-party imports
+import pytest
+import pytest_twisted
+
+# Local imports
+from uplink import Consumer, concurrency_limit, get, retry
+from uplink.clients import io
+from uplink.concurrency_limit import ConcurrencyLimitExceeded
+from tests import requires_python34
+
+# Constants
+BASE_URL = "https://api.github.com/"
+
+
+class GitHub(Consumer):
+    @concurrency_limit(max_in_flight=2)
+    @get("/users/{user}")
+    def get_user(self, user):
+        pass
+
+    @retry(max_attempts=2, backoff=retry.backoff.fixed(0.05))
+    @concurrency_limit(max_in_flight=1)
+    @get("/repos/{user}/{repo}")
+    def get_repo(self, user, repo):
+        pass
+
+    @concurrency_limit(max_in_flight=1, raise_on_limit=True)
+    @get("/orgs/{org}")
+    def get_org(self, org):
+        pass
+
+
+class _Tracker(object):
+    # Tracks the peak number of requests in flight.
+    def __init__(self, response, delay=0.05):
+        self._response = response
+        self._delay = delay
+        self._lock = threading.Lock()
+        self.in_flight = self.peak = 0
+
+    def _enter(self):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+
+    def _exit(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def __call__(self, *args):
+        self._enter()
+        try:
+            time.sleep(self._delay)
+            if isinstance(self._response, Exception):
+                raise self._response
+            return self._response
+        finally:
+            self._exit()
+
+
+def _call_concurrently(func, args_list):
+    results = [None] * len(args_list)
+
+    def call(index, args):
+        try:
+            results[index] = func(*args)
+        except Exception as error:
+            results[index] = error
+
+    threads = [
+        threading.Thread(target=call, args=item)
+        for item in enumerate(args_list)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrency_limit(mock_client, mock_response):
+    # Setup
+    tracker = _Tracker(mock_response)
+    mock_client.with_side_effect(tracker)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    results = _call_concurrently(github.get_user, [("prkumar",)] * 6)
+
+    # Verify
+    assert results == [mock_response] * 6
+    assert tracker.peak == 2
+
+
+def test_concurrency_limit_by_host(mock_client, mock_response):
+    # Setup
+    tracker = _Tracker(mock_response)
+    mock_client.with_side_effect(tracker)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+    other = GitHub(base_url="https://example.com/", client=mock_client)
+
+    # Run
+    _call_concurrently(
+        lambda consumer: consumer.get_user("prkumar"),
+        [(github,), (github,), (other,), (other,)],
+    )
+
+    # Verify: each host gets its own slots
+    assert tracker.peak == 4
+
+
+def test_concurrency_limit_releases_slot_while_retrying(mock_client):
+    # Setup: the first request fails and waits to be retried
+    sent = []
+
+    def send(method, url, extras):
+        sent.append(url)
+        if len(sent) == 1:
+            time.sleep(0.02)
+            raise IOError()
+        return url
+
+    mock_client.with_side_effect(send)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    results = _call_concurrently(
+        github.get_repo, [("prkumar", "a"), ("prkumar", "b")]
+    )
+
+    # Verify: the other request was sent during the retry's backoff
+    assert len(sent) == 3
+    assert sent[1] != sent[0]
+    assert sent[2] == sent[0]
+    assert sorted(results) == sorted(set(sent))
+
+
+def test_concurrency_limit_releases_slot_on_failure(mock_client):
+    # Setup
+    mock_client.with_side_effect(IOError)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run & Verify: a failed request doesn't keep its slot
+    for _ in range(3):
+        with pytest.raises(IOError):
+            github.get_org("prkumar")
+
+
+def test_concurrency_limit_raise_on_limit(mock_client, mock_response):
+    # Setup
+    tracker = _Tracker(mock_response, delay=0.2)
+    mock_client.with_side_effect(tracker)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    results = _call_concurrently(github.get_org, [("prkumar",)] * 3)
+
+    # Verify
+    assert results.count(mock_response) >= 1
+    assert any(isinstance(r, ConcurrencyLimitExceeded) for r in results)
+    assert tracker.peak == 1
+
+
+def test_concurrency_limit_raise_on_limit_is_atomic(
+    mocker, mock_client, mock_response
+):
+    # Setup: every caller sees a free slot, as if they all checked the
+    # limit before any of them took the permit.
+    mocker.patch.object(io.Semaphore, "locked", return_value=False)
+    tracker = _Tracker(mock_response, delay=0.2)
+    mock_client.with_side_effect(tracker)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    results = _call_concurrently(github.get_org, [("prkumar",)] * 3)
+
+    # Verify: the other callers are rejected instead of waiting
+    assert results.count(mock_response) == 1
+    assert len(mock_client.history) == 1
+
+
+@requires_python34
+def test_concurrency_limit_with_asyncio(mock_client, mock_response):
+    import asyncio
+
+    # Setup
+    in_flight, peak = [0], [0]
+
+    async def send(*args):
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        return mock_response
+
+    mock_client.with_side_effect(send)
+    mock_client.with_io(io.AsyncioStrategy())
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    awaitable = asyncio.gather(*[github.get_user("prkumar") for _ in range(6)])
+    loop = asyncio.get_event_loop()
+    responses = loop.run_until_complete(awaitable)
+
+    # Verify
+    assert responses == [mock_response] * 6
+    assert peak[0] == 2
+
+
+@pytest_twisted.inlineCallbacks
+def test_concurrency_limit_with_twisted(mock_client, mock_response):
+    from twisted.internet import defer, reactor, task
+
+    # Setup
+    in_flight, peak = [0], [0]
+
+    def finish():
+        in_flight[0] -= 1
+        return mock_response
+
+    def send(*args):
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        return task.deferLater(reactor, 0.01, finish)
+
+    mock_client.with_side_effect(send)
+    mock_client.with_io(io.TwistedStrategy())
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    responses = yield defer.gatherResults(
+        [github.get_user("prkumar") for _ in range(6)]
+    )
+
+    # Verify
+    assert responses == [mock_response] * 6
+    assert peak[0] == 2
+
+
+@pytest_twisted.inlineCallbacks
+def test_call_with_permit_cancelled_with_twisted():
+    from twisted.internet import defer, reactor, task
+
+    # Setup
+    strategy = io.TwistedStrategy()
+    semaphore = io.Semaphore(1)
+    holder = strategy.call_with_permit(
+        semaphore, task.deferLater, (reactor, 0.01, lambda: "holder")
+    )
+    waiter = strategy.call_with_permit(semaphore, defer.succeed, ("waiter",))
+    waiter.addErrback(lambda failure: failure.trap(defer.CancelledError))
+
+    # Run
+    waiter.cancel()
+    assert (yield holder) == "holder"
+    result = yield strategy.call_with_permit(
+        semaphore, defer.succeed, ("next",)
+    ).addTimeout(1, reactor)
+
+    # Verify: the cancelled waiter doesn't keep a permit
+    assert result == "next"
+    assert not semaphore.locked()
@@ -0,0 +1,227 @@
+# Standard library imports
+import time
+
+# Third-party imports
+import pytest
+import pytest_twisted
+
+# Local imports
+from uplink import (
+    deadline,
+    get,
+    retry,
+    timeout,
+    Consumer,
+    Deadline,
+    Timeout,
+)
+from uplink.clients import io
+from uplink.deadline import DeadlineExceeded
+from tests import requires_python34
+
+# Constants
+BASE_URL = "https://api.github.com/"
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.time = 0
+
+    def __call__(self):
+        return self.time
+
+
+clock = FakeClock()
+
+
+class GitHub(Consumer):
+    @deadline(5, clock=clock)
+    @get("/users/{user}")
+    def get_user(self, user):
+        pass
+
+    @deadline(5, clock=clock)
+    @timeout(2)
+    @get("/users/{user}/repos")
+    def get_repos(self, user):
+        pass
+
+    @deadline(5, clock=clock)
+    @timeout((10, 1))
+    @get("/users/{user}/gists")
+    def get_gists(self, user):
+        pass
+
+    @deadline(5, clock=clock)
+    @get("/users/{user}/orgs")
+    def get_orgs(self, user, timeout: Timeout):
+        pass
+
+    @deadline(5, clock=clock)
+    @retry(stop=retry.stop.NEVER, backoff=retry.backoff.fixed(0.01))
+    @get("repos/{user}/{repo}")
+    def get_repo(self, user, repo):
+        pass
+
+    @deadline(0.25, clock=clock)
+    @retry(stop=retry.stop.NEVER, backoff=retry.backoff.fixed(0.1))
+    @get("repos/{user}/{repo}/issues")
+    def get_issues(self, user, repo):
+        pass
+
+    @retry(max_attempts=3, backoff=retry.backoff.fixed(0))
+    @get("repos/{user}/{repo}/releases")
+    def get_releases(self, user, repo, deadline: Deadline() = None):
+        pass
+
+
+@deadline(0.15)
+@retry(stop=retry.stop.NEVER, backoff=retry.backoff.fixed(0.05))
+class RetryingGitHub(Consumer):
+    @get("/users/{user}")
+    def get_user(self, user):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def reset_clock():
+    clock.time = 0
+
+
+def _failing_send(elapsed):
+    # Each request takes the given number of seconds to fail.
+    def send(*args):
+        clock.time += elapsed
+        raise Exception
+
+    return send
+
+
+def test_deadline_caps_timeout(mock_client, mock_response):
+    # Setup
+    mock_client.with_response(mock_response)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    github.get_user("prkumar")
+    github.get_repos("prkumar")
+    github.get_gists("prkumar")
+
+    # Verify
+    timeouts = [request.timeout for request in mock_client.history]
+    assert timeouts == [5, 2, (5, 1)]
+
+
+def test_deadline_caps_aiohttp_timeout(mock_client, mock_response):
+    aiohttp = pytest.importorskip("aiohttp")
+
+    # Setup
+    mock_client.with_response(mock_response)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    github.get_orgs("prkumar", aiohttp.ClientTimeout(total=10, connect=1))
+    github.get_orgs("prkumar", aiohttp.ClientTimeout(connect=1))
+
+    # Verify
+    timeouts = [request.timeout for request in mock_client.history]
+    assert timeouts == [
+        aiohttp.ClientTimeout(total=5, connect=1),
+        aiohttp.ClientTimeout(total=5, connect=1),
+    ]
+
+
+def test_deadline_bounds_retries(mock_client):
+    # Setup
+    mock_client.with_side_effect(_failing_send(2))
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    with pytest.raises(DeadlineExceeded):
+        github.get_repo("prkumar", "uplink")
+
+    # Verify: each retry gets the time that's left until the deadline
+    timeouts = [request.timeout for request in mock_client.history]
+    assert timeouts == [5, 3, 1]
+
+
+def test_deadline_skips_sleep_past_deadline(mock_client):
+    # Setup
+    mock_client.with_side_effect(_failing_send(0.1))
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    start = time.time()
+    with pytest.raises(DeadlineExceeded):
+        github.get_issues("prkumar", "uplink")
+    elapsed = time.time() - start
+
+    # Verify: the call fails instead of sleeping after the second
+    # request, since the deadline would pass in the meantime
+    assert len(mock_client.history) == 2
+    assert elapsed < 0.2
+
+
+def test_deadline_argument(mock_client, mock_response):
+    # Setup
+    mock_client.with_side_effect([Exception, mock_response])
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    response = github.get_releases("prkumar", "uplink", deadline=2)
+
+    # Verify
+    assert response == mock_response
+    assert len(mock_client.history) == 2
+    assert all(0 < request.timeout <= 2 for request in mock_client.history)
+
+
+def test_deadline_argument_omitted(mock_client, mock_response):
+    # Setup
+    mock_client.with_response(mock_response)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    github.get_releases("prkumar", "uplink")
+
+    # Verify
+    assert "timeout" not in mock_client.history[0]._extras
+
+
+@requires_python34
+def test_deadline_with_asyncio(mock_client):
+    import asyncio
+
+    # Setup
+    async def send(*args):
+        raise Exception
+
+    mock_client.with_side_effect(send)
+    mock_client.with_io(io.AsyncioStrategy())
+    github = RetryingGitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    awaitable = github.get_user("prkumar")
+    loop = asyncio.get_event_loop()
+    with pytest.raises(DeadlineExceeded):
+        loop.run_until_complete(awaitable)
+
+    # Verify
+    assert 1 < len(mock_client.history) <= 4
+
+
+@pytest_twisted.inlineCallbacks
+def test_deadline_with_twisted(mock_client):
+    from twisted.internet import defer
+
+    # Setup
+    mock_client.with_side_effect(lambda *args: defer.fail(Exception()))
+    mock_client.with_io(io.TwistedStrategy())
+    github = RetryingGitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    with pytest.raises(DeadlineExceeded):
+        yield github.get_user("prkumar")
+
+    # Verify
+    assert 1 < len(mock_client.history) <= 4
@@ -28,6 +28,12 @@ def handle_error_with_consumer(consumer, exc_type, exc_value, exc_tb):
     raise WrappedException(exc_value)
 
 
+@uplink.response_handler(requires_consumer=True)
+def handle_response_with_request(consumer, response):
+    # Sends another request, with a request template, from the handler.
+    return (response, consumer.get_user_with_retry(1))
+
+
 @uplink.error_handler
 def handle_error(exc_type, exc_value, exc_tb):
     raise WrappedException(exc_value)
@@ -55,6 +61,16 @@ class Calendar(uplink.Consumer):
     def get_user(self, user_id):
         pass
 
+    @uplink.retry(max_attempts=2)
+    @uplink.get("users/{user_id}")
+    def get_user_with_retry(self, user_id):
+        pass
+
+    @handle_response_with_request
+    @uplink.get("months/{name}/todos")
+    def get_month_with_user(self, name):
+        pass
+
     @handle_error
     @uplink.get("events/{event_id}")
     def get_event(self, event_id):
@@ -93,6 +109,19 @@ def test_multiple_response_handlers(mock_client):
     assert calendar.flagged
 
 
+def test_response_handler_sends_request(mock_client, mock_response):
+    # Setup
+    mock_client.with_response(mock_response)
+    calendar = Calendar(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    response = calendar.get_month_with_user("September")
+
+    # Verify: the nested call ran to completion inside the handler
+    assert response == (mock_response, mock_response)
+    assert len(mock_client.history) == 2
+
+
 def test_error_handler_with_consumer(mock_client):
     # Setup: raise specific exception
     expected_error = IOError()
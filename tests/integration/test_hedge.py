@@ -0,0 +1,226 @@
+# Standard library imports
+import time
+
+# Third-party imports
+import pytest_twisted
+
+# Local imports
+from uplink import hedge, get, post, Consumer
+from uplink.clients import io
+from uplink.hedge import LatencyTracker
+from tests import requires_python34
+
+# Constants
+BASE_URL = "https://api.github.com/"
+
+
+class GitHub(Consumer):
+    @hedge(after=0.05)
+    @get("/users/{user}")
+    def get_user(self, user):
+        pass
+
+    @hedge(after=0.05, max_extra=2)
+    @get("/users/{user}/repos")
+    def get_repos(self, user):
+        pass
+
+    @hedge(after=0.05)
+    @post("/users/{user}")
+    def update_user(self, user):
+        pass
+
+
+@hedge
+class TrackedGitHub(Consumer):
+    @get("/users/{user}")
+    def get_user(self, user):
+        pass
+
+    @get("/repos/{user}/{repo}")
+    def get_repo(self, user, repo):
+        pass
+
+
+def _slow_first(responses, delay=0.5):
+    # The first request stalls, as if it hit a slow replica.
+    sent = []
+
+    def send(*args):
+        sent.append(args)
+        if len(sent) == 1:
+            time.sleep(delay)
+        return responses[len(sent) - 1]
+
+    return sent, send
+
+
+def test_hedge(mock_client):
+    # Setup
+    responses = [object(), object()]
+    sent, send = _slow_first(responses)
+    mock_client.with_side_effect(send)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    start = time.time()
+    response = github.get_user("prkumar")
+    elapsed = time.time() - start
+
+    # Verify: the duplicate's response arrives first
+    assert response is responses[1]
+    assert len(sent) == 2
+    assert elapsed < 0.5
+
+
+def test_hedge_fast_response(mock_client, mock_response):
+    # Setup
+    mock_client.with_response(mock_response)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    response = github.get_user("prkumar")
+
+    # Verify: no duplicate is sent
+    assert response is mock_response
+    assert len(mock_client.history) == 1
+
+
+def test_hedge_max_extra(mock_client):
+    # Setup: both the request and its first duplicate stall
+    responses = [object(), object(), object()]
+    sent = []
+
+    def send(*args):
+        sent.append(args)
+        if len(sent) < 3:
+            time.sleep(0.5)
+        return responses[len(sent) - 1]
+
+    mock_client.with_side_effect(send)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    response = github.get_repos("prkumar")
+
+    # Verify
+    assert response is responses[2]
+    assert len(sent) == 3
+
+
+def test_hedge_unsafe_method(mock_client):
+    # Setup
+    responses = [object(), object()]
+    sent, send = _slow_first(responses, delay=0.1)
+    mock_client.with_side_effect(send)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    response = github.update_user("prkumar")
+
+    # Verify: a request that isn't idempotent is never duplicated
+    assert response is responses[0]
+    assert len(sent) == 1
+
+
+def test_hedge_after_percentile(mock_client):
+    # Setup: warm up the latency tracker with fast requests
+    responses = [object() for _ in range(13)]
+    sent = []
+
+    def send(*args):
+        sent.append(args)
+        if len(sent) == 11:
+            time.sleep(0.5)
+        return responses[len(sent) - 1]
+
+    mock_client.with_side_effect(send)
+    github = TrackedGitHub(base_url=BASE_URL, client=mock_client)
+    for _ in range(10):
+        github.get_user("prkumar")
+
+    # Run
+    response = github.get_user("prkumar")
+
+    # Verify: the slow request is hedged after the recent p95
+    assert response is responses[11]
+
+    # Verify: each method tracks its latencies separately, so another
+    # method isn't hedged until it has its own
+    assert github.get_repo("prkumar", "uplink") is responses[12]
+
+
+def test_latency_tracker():
+    tracker = LatencyTracker(size=100, min_samples=10)
+    for latency in range(1, 10):
+        tracker.add(latency)
+    assert tracker.percentile(95) is None
+
+    tracker.add(10)
+    assert tracker.percentile(95) == 10
+    assert tracker.percentile(50) == 5
+
+
+@requires_python34
+def test_hedge_with_asyncio(mock_client):
+    import asyncio
+
+    # Setup
+    responses = [object(), object()]
+    sent, cancelled = [], []
+
+    async def send(*args):
+        sent.append(args)
+        index = len(sent) - 1
+        try:
+            await asyncio.sleep(1 if index == 0 else 0)
+        except asyncio.CancelledError:
+            cancelled.append(index)
+            raise
+        return responses[index]
+
+    mock_client.with_side_effect(send)
+    mock_client.with_io(io.AsyncioStrategy())
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    async def run():
+        result = await github.get_user("prkumar")
+        await asyncio.sleep(0)
+        return result
+
+    # Run
+    response = asyncio.get_event_loop().run_until_complete(run())
+
+    # Verify: the stalled request is cancelled
+    assert response is responses[1]
+    assert cancelled == [0]
+
+
+@pytest_twisted.inlineCallbacks
+def test_hedge_with_twisted(mock_client):
+    from twisted.internet import defer, reactor, task
+
+    # Setup
+    responses = [object(), object()]
+    sent, cancelled = [], []
+
+    def send(*args):
+        sent.append(args)
+        index = len(sent) - 1
+        deferred = task.deferLater(
+            reactor, 1 if index == 0 else 0, lambda: responses[index]
+        )
+        deferred.addErrback(lambda failure: cancelled.append(index) or failure)
+        return deferred
+
+    mock_client.with_side_effect(send)
+    mock_client.with_io(io.TwistedStrategy())
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    response = yield github.get_user("prkumar")
+
+    # Verify: the stalled request is cancelled
+    assert response is responses[1]
+    assert cancelled == [0]
+    yield defer.succeed(None)
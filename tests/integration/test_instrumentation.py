@@ -0,0 +1,211 @@
+# Third-party imports
+import pytest
+import pytest_twisted
+
+# Local imports
+from uplink import Consumer, get, response_handler, retry, returns
+from uplink.clients import io
+from tests import requires_python34
+
+# Constants
+BASE_URL = "https://api.github.com/"
+
+
+def backoff_once():
+    yield 0.01
+
+
+def user_name(response):
+    return response.json()["name"]
+
+
+class GitHub(Consumer):
+    @retry(max_attempts=2, backoff=backoff_once)
+    @get("/users/{user}")
+    def get_user(self, user):
+        pass
+
+    @returns.json(key="name")
+    @get("/users/{user}")
+    def get_user_name(self, user):
+        pass
+
+    @response_handler(user_name)
+    @get("/users/{user}")
+    def get_user_name_with_handler(self, user):
+        pass
+
+    @get("/users/{user}")
+    def get_user_directly(self, user):
+        pass
+
+
+@pytest.fixture
+def timings():
+    return []
+
+
+@pytest.fixture
+def github(mock_client, timings):
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+    github.session.timing_sink = timings.append
+    return github
+
+
+def test_timings_with_retry(mock_client, mock_response, github, timings):
+    # Setup
+    mock_client.with_side_effect([Exception, mock_response])
+
+    # Run
+    response = github.get_user("prkumar")
+
+    # Verify
+    assert response is mock_response
+    assert len(timings) == 1
+    record = timings[0]
+    assert record.method == "GET"
+    assert record.url == BASE_URL + "users/prkumar"
+    assert record.exception is None
+    assert record.phases["sleep"] >= 0.01
+    assert record.phases["send"] > 0
+    assert record.phases["templates"] > 0
+    assert record.total >= sum(record.phases.values())
+
+
+def test_timings_with_converter(mock_client, mock_response, github, timings):
+    # Setup
+    mock_response.with_json({"id": 123, "name": "prkumar"})
+    mock_client.with_response(mock_response)
+
+    # Run
+    assert github.get_user_name("prkumar") == "prkumar"
+
+    # Verify
+    assert len(timings) == 1
+    assert timings[0].phases["converters"] > 0
+    assert timings[0].phases["handlers"] > 0
+    assert timings[0].phases["sleep"] == 0
+
+
+def test_timings_with_handler(mock_client, mock_response, github, timings):
+    # Setup
+    mock_response.with_json({"id": 123, "name": "prkumar"})
+    mock_client.with_response(mock_response)
+
+    # Run
+    assert github.get_user_name_with_handler("prkumar") == "prkumar"
+
+    # Verify
+    assert len(timings) == 1
+    assert timings[0].phases["handlers"] > 0
+    assert timings[0].phases["converters"] == 0
+
+
+def test_timings_sent_directly(mock_client, mock_response, github, timings):
+    # Setup
+    mock_client.with_response(mock_response)
+
+    # Run
+    assert github.get_user_directly("prkumar") is mock_response
+
+    # Verify
+    assert len(timings) == 1
+    assert timings[0].phases["arguments"] > 0
+    assert timings[0].phases["send"] > 0
+
+
+def test_timings_with_failure(mock_client, github, timings):
+    # Setup
+    error = IOError()
+    mock_client.with_side_effect(error)
+
+    # Run
+    with pytest.raises(IOError):
+        github.get_user_directly("prkumar")
+
+    # Verify
+    assert len(timings) == 1
+    assert timings[0].exception is error
+
+
+def test_timings_disabled(mock_client, mock_response, github, timings):
+    # Setup
+    mock_client.with_response(mock_response)
+    github.session.timing_sink = None
+
+    # Run
+    github.get_user_directly("prkumar")
+
+    # Verify
+    assert timings == []
+
+
+@requires_python34
+def test_timings_with_asyncio(mock_client, mock_response, github, timings):
+    import asyncio
+
+    # Setup
+    mock_client.with_side_effect([Exception, asyncio.sleep(0, mock_response)])
+    mock_client.with_io(io.AsyncioStrategy())
+
+    # Run
+    awaitable = github.get_user("prkumar")
+    assert timings == []
+    loop = asyncio.get_event_loop()
+    response = loop.run_until_complete(asyncio.ensure_future(awaitable))
+
+    # Verify
+    assert response is mock_response
+    assert len(timings) == 1
+    assert timings[0].phases["sleep"] >= 0.01
+    assert timings[0].total >= sum(timings[0].phases.values())
+
+
+@requires_python34
+@pytest.mark.parametrize("timed", [True, False])
+def test_asyncio_call_is_coroutine(
+    mock_client, mock_response, github, timings, timed
+):
+    import asyncio
+
+    async def send(*args):
+        return mock_response
+
+    # Setup
+    mock_client.with_side_effect(send)
+    mock_client.with_io(io.AsyncioStrategy())
+    if not timed:
+        github.session.timing_sink = None
+
+    async def run():
+        return await asyncio.create_task(github.get_user_directly("prkumar"))
+
+    # Run
+    loop = asyncio.get_event_loop()
+    response = loop.run_until_complete(run())
+
+    # Verify
+    assert response is mock_response
+    assert len(timings) == int(timed)
+
+
+@pytest_twisted.inlineCallbacks
+def test_timings_with_twisted(mock_client, mock_response, github, timings):
+    from twisted.internet import defer
+
+    @defer.inlineCallbacks
+    def return_response():
+        yield
+        defer.returnValue(mock_response)
+
+    # Setup
+    mock_client.with_side_effect([Exception, return_response()])
+    mock_client.with_io(io.TwistedStrategy())
+
+    # Run
+    response = yield github.get_user("prkumar")
+
+    # Verify
+    assert response is mock_response
+    assert len(timings) == 1
+    assert timings[0].phases["sleep"] >= 0.01
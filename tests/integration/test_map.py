@@ -0,0 +1,142 @@
+# Third-party imports
+import pytest
+import pytest_twisted
+
+# Local imports
+from uplink import get, Consumer, retry
+from uplink.clients import io
+from tests import requires_python34
+
+# Constants
+BASE_URL = "https://api.github.com/"
+
+
+class GitHub(Consumer):
+    @get("/users/{user}")
+    def get_user(self, user):
+        pass
+
+    @retry(max_attempts=2, backoff=retry.backoff.fixed(0))
+    @get("repos/{user}/{repo}")
+    def get_repo(self, user, repo):
+        pass
+
+
+def test_map(mock_client, mock_response):
+    # Setup
+    mock_client.with_response(mock_response)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    responses = github.get_user.map(["a", "b", "c"], concurrency=2)
+
+    # Verify
+    assert responses == [mock_response] * 3
+    endpoints = sorted(call.endpoint for call in mock_client.history)
+    assert endpoints == ["/users/a", "/users/b", "/users/c"]
+
+
+def test_map_with_retry(mock_client, mock_response):
+    # Setup
+    mock_client.with_side_effect([IOError, mock_response, mock_response])
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    responses = github.get_repo.map(["a", "b"], ["x", "y"], concurrency=1)
+
+    # Verify
+    assert responses == [mock_response, mock_response]
+    assert [call.endpoint for call in mock_client.history] == [
+        "/repos/a/x",
+        "/repos/a/x",
+        "/repos/b/y",
+    ]
+
+
+def test_map_failure(mock_client, mock_response):
+    # Setup
+    mock_client.with_side_effect([mock_response, IOError, mock_response])
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run & Verify: the remaining calls aren't sent
+    with pytest.raises(IOError):
+        github.get_user.map(["a", "b", "c"], concurrency=1)
+    assert len(mock_client.history) == 2
+
+
+def test_map_with_return_exceptions(mock_client, mock_response):
+    # Setup
+    error = IOError()
+    mock_client.with_side_effect([mock_response, error])
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    responses = github.get_user.map(
+        ["a", "b"], concurrency=1, return_exceptions=True
+    )
+
+    # Verify
+    assert responses == [mock_response, error]
+
+
+@requires_python34
+def test_map_with_asyncio(mock_client, mock_response):
+    import asyncio
+
+    # Setup
+    mock_client.with_side_effect(
+        [
+            IOError,
+            asyncio.sleep(0, mock_response),
+            asyncio.sleep(0, mock_response),
+        ]
+    )
+    mock_client.with_io(io.AsyncioStrategy())
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    awaitable = github.get_repo.map(["a", "b"], ["x", "y"], concurrency=2)
+    loop = asyncio.get_event_loop()
+    responses = loop.run_until_complete(asyncio.ensure_future(awaitable))
+
+    # Verify
+    assert responses == [mock_response, mock_response]
+    assert len(mock_client.history) == 3
+
+
+@pytest_twisted.inlineCallbacks
+def test_map_with_twisted(mock_client, mock_response):
+    from twisted.internet import defer
+
+    # Setup
+    mock_client.with_side_effect(
+        [defer.succeed(mock_response), IOError, defer.succeed(mock_response)]
+    )
+    mock_client.with_io(io.TwistedStrategy())
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    responses = yield github.get_repo.map(["a", "b"], ["x", "y"])
+
+    # Verify
+    assert responses == [mock_response, mock_response]
+    assert len(mock_client.history) == 3
+
+
+def test_map_with_futures(mock_client, mock_response):
+    from concurrent import futures
+
+    # Setup
+    mock_client.with_side_effect([IOError, mock_response, mock_response])
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    with futures.ThreadPoolExecutor(max_workers=2) as executor:
+        mock_client.with_io(io.FuturesStrategy(executor))
+
+        # Run
+        future = github.get_repo.map(["a", "b"], ["x", "y"], concurrency=1)
+        responses = future.result()
+
+    # Verify
+    assert responses == [mock_response, mock_response]
+    assert len(mock_client.history) == 3
@@ -3,7 +3,9 @@ import pytest
 
 # Local imports.
 import uplink
+from uplink.clients import io
 from uplink.ratelimit import RateLimitExceeded, now
+from tests import requires_python34
 
 # Constants
 BASE_URL = "https://api.github.com/"
@@ -44,6 +46,32 @@ class GitHub(uplink.Consumer):
     def get_issue(self, user, repo, issue):
         pass
 
+    @uplink.ratelimit(
+        calls=10, period=1, algorithm=uplink.ratelimit.TOKEN_BUCKET
+    )
+    @uplink.get("repos/{user}/{repo}/contributors")
+    def get_contributors(self, user, repo):
+        pass
+
+    @uplink.ratelimit(calls=20, period=1, algorithm=uplink.ratelimit.GCRA)
+    @uplink.get("repos/{user}/{repo}/events")
+    def get_events(self, user, repo):
+        pass
+
+    @uplink.ratelimit(calls=10, period=1, raise_on_limit=True, adaptive=True)
+    @uplink.get("repos/{user}/{repo}/releases")
+    def get_releases(self, user, repo):
+        pass
+
+    @uplink.retry(
+        when=uplink.retry.when.status(429),
+        backoff=uplink.retry.backoff.fixed(0),
+    )
+    @uplink.ratelimit(calls=10, period=1, adaptive=True)
+    @uplink.get("repos/{user}/{repo}/tags")
+    def get_tags(self, user, repo):
+        pass
+
 
 # Tests
 
@@ -83,6 +111,20 @@ def test_exceeded_limit_wait(mock_client):
     assert elapsed >= 1
 
 
+def test_limit_wait_for_next_permit(mock_client):
+    # Setup
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    start = now()
+    github.get_contributors("prkumar", "uplink")
+    github.get_contributors("prkumar", "uplink")
+    elapsed = now() - start
+
+    # Verify: waits for the next token, rather than the whole period
+    assert 0.1 <= elapsed < 0.5
+
+
 def test_limit_with_group_by_None(mock_client):
     # Setup: consumers pointing to separate hosts
     github1 = GitHub(base_url=BASE_URL, client=mock_client)
@@ -107,3 +149,69 @@ def test_limit_with_group_by_host_and_port(mock_client):
     # Verify: the rate limit should be applied separately by host-port,
     # so this request should be fine.
     github2.get_issue("prkumar", "uplink", "issue2")
+
+
+@requires_python34
+def test_limit_with_asyncio(mock_client, mock_response):
+    import asyncio
+
+    # Setup
+    sent = []
+
+    async def send(method, url, extras):
+        sent.append((url, now()))
+        return mock_response
+
+    mock_client.with_side_effect(send)
+    mock_client.with_io(io.AsyncioStrategy())
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+    repos = ["repo%s" % i for i in range(5)]
+
+    # Run
+    awaitable = asyncio.gather(
+        *[github.get_events("prkumar", repo) for repo in repos]
+    )
+    asyncio.get_event_loop().run_until_complete(awaitable)
+
+    # Verify: requests are sent in order, each once its permit is due
+    assert [url.split("/")[-2] for url, _ in sent] == repos
+    times = [t for _, t in sent]
+    assert times[-1] - times[0] >= 0.2
+    assert len(mock_client.history) == 5
+
+
+def test_adaptive_limit_from_headers(mock_client, mock_response):
+    # Setup: the server reports that its quota is exhausted
+    mock_response.status_code = 200
+    mock_response.headers = {
+        "X-RateLimit-Remaining": "0",
+        "X-RateLimit-Reset": "60",
+    }
+    mock_client.with_response(mock_response)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    github.get_releases("prkumar", "uplink")
+
+    # Verify: the client follows the server's quota, not its own
+    with pytest.raises(RateLimitExceeded):
+        github.get_releases("prkumar", "uplink")
+
+
+def test_adaptive_limit_with_retry_after(mock_client, mocker):
+    # Setup: the server first rejects the request, asking the client to
+    # wait before retrying
+    too_many_requests = mocker.Mock(status_code=429)
+    too_many_requests.headers = {"Retry-After": "0.2"}
+    ok = mocker.Mock(status_code=200, headers={})
+    mock_client.with_side_effect([too_many_requests, ok])
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    start = now()
+    response = github.get_tags("prkumar", "uplink")
+    elapsed = now() - start
+
+    # Verify: the retry waited for the server's quota to reset
+    assert response is ok
+    assert elapsed >= 0.2
@@ -1,9 +1,14 @@
+# Standard library imports
+import threading
+import time
+
 # Third-party imports
 import pytest
 import pytest_twisted
 
 # Local imports.
 from uplink import get, Consumer, retry
+from uplink.retry import RetryBudget
 from uplink.clients import io
 from tests import requires_python34
 
@@ -39,6 +44,30 @@ class GitHub(Consumer):
     def get_issues(self, user, repo):
         pass
 
+    @retry(
+        when=retry.when.status(429, 503),
+        stop=retry.stop.after_delay(1),
+        backoff=retry.backoff.from_response(fallback=retry.backoff.fixed(0)),
+    )
+    @get("repos/{user}/{repo}/releases")
+    def get_releases(self, user, repo):
+        pass
+
+
+@retry(
+    max_attempts=3,
+    backoff=retry.backoff.fixed(0),
+    budget=RetryBudget(ratio=0.1, min_retries_per_second=0.1),
+)
+class BudgetedGitHub(Consumer):
+    @get("/users/{user}")
+    def get_user(self, user):
+        pass
+
+    @get("repos/{user}/{repo}")
+    def get_repo(self, user, repo):
+        pass
+
 
 # Tests
 
@@ -57,6 +86,46 @@ def test_retry(mock_client, mock_response):
     assert response.json() == {"id": 123, "name": "prkumar"}
 
 
+def _response(mocker, status_code, retry_after=None):
+    headers = {} if retry_after is None else {"Retry-After": retry_after}
+    return mocker.Mock(status_code=status_code, headers=headers)
+
+
+def test_retry_after(mock_client, mocker):
+    # Setup
+    responses = [
+        _response(mocker, 429, "0.2"),
+        _response(mocker, 503),
+        _response(mocker, 200),
+    ]
+    mock_client.with_side_effect(responses)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    start = time.time()
+    response = github.get_releases("prkumar", "uplink")
+    elapsed = time.time() - start
+
+    # Verify: waited as long as the server asked, then used the fallback
+    assert response is responses[-1]
+    assert len(mock_client.history) == 3
+    assert 0.2 <= elapsed < 1
+
+
+def test_retry_after_exceeds_stop(mock_client, mocker):
+    # Setup: the server asks for a longer delay than the stop allows
+    responses = [_response(mocker, 503, "120"), _response(mocker, 200)]
+    mock_client.with_side_effect(responses)
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    # Run
+    response = github.get_releases("prkumar", "uplink")
+
+    # Verify: stops retrying, rather than sleeping past the limit
+    assert response is responses[0]
+    assert len(mock_client.history) == 1
+
+
 def test_retry_fail(mock_client, mock_response):
     # Setup
     mock_response.with_json({"id": 123, "name": "prkumar"})
@@ -127,13 +196,9 @@ def test_retry_with_status_501(mock_client, mock_response):
 def test_retry_with_asyncio(mock_client, mock_response):
     import asyncio
 
-    @asyncio.coroutine
-    def coroutine():
-        return mock_response
-
     # Setup
     mock_response.with_json({"id": 123, "name": "prkumar"})
-    mock_client.with_side_effect([Exception, coroutine()])
+    mock_client.with_side_effect([Exception, asyncio.sleep(0, mock_response)])
     mock_client.with_io(io.AsyncioStrategy())
     github = GitHub(base_url=BASE_URL, client=mock_client)
 
@@ -147,6 +212,26 @@ def test_retry_with_asyncio(mock_client, mock_response):
     assert response.json() == {"id": 123, "name": "prkumar"}
 
 
+def test_retry_with_futures(mock_client, mock_response):
+    from concurrent import futures
+
+    # Setup
+    mock_response.with_json({"id": 123, "name": "prkumar"})
+    mock_client.with_side_effect([Exception, mock_response])
+    github = GitHub(base_url=BASE_URL, client=mock_client)
+
+    with futures.ThreadPoolExecutor(max_workers=1) as executor:
+        mock_client.with_io(io.FuturesStrategy(executor))
+
+        # Run
+        future = github.get_user("prkumar")
+        response = future.result()
+
+    # Verify
+    assert len(mock_client.history) == 2
+    assert response.json() == {"id": 123, "name": "prkumar"}
+
+
 @pytest_twisted.inlineCallbacks
 def test_retry_with_twisted(mock_client, mock_response):
     from twisted.internet import defer
@@ -192,3 +277,28 @@ def test_retry_fail_with_twisted(mock_client, mock_response):
         yield github.get_user("prkumar")
 
     assert len(mock_client.history) == 2
+
+
+def test_retry_budget(mock_client):
+    # Setup: the server fails every request
+    mock_client.with_side_effect(IOError)
+    github = BudgetedGitHub(base_url=BASE_URL, client=mock_client)
+
+    def call(method, *args):
+        try:
+            method(*args)
+        except IOError:
+            pass
+
+    # Run
+    calls = [(github.get_user, "prkumar")] * 10
+    calls += [(github.get_repo, "prkumar", "uplink")] * 10
+    threads = [threading.Thread(target=call, args=args) for args in calls]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Verify: all methods and threads share the budget, which allows
+    # far fewer retries than max_attempts would
+    assert 20 < len(mock_client.history) <= 20 + 0.1 * 20 + 1
@@ -0,0 +1,190 @@
+# Standard library imports
+import json
+
+# Third-party imports
+import pytest
+import pytest_twisted
+
+# Local imports
+from uplink import (
+    Consumer,
+    Body,
+    Field,
+    Query,
+    Timeout,
+    form_url_encoded,
+    get,
+    json as json_,
+    post,
+    response_handler,
+    returns,
+    retry,
+)
+from uplink.clients.twisted_ import TwistedAgentClient
+
+
+def _read_content(request):
+    request.content.seek(0)
+    return request.content.read().decode()
+
+
+def _echo(request):
+    # Describes the request, so that tests can verify what was sent.
+    request.setHeader(b"Content-Type", b"application/json")
+    return json.dumps(
+        {
+            "method": request.method.decode(),
+            "path": request.path.decode(),
+            "args": {
+                key.decode(): [value.decode() for value in values]
+                for key, values in request.args.items()
+            },
+            "content_type": (
+                request.getHeader(b"Content-Type") or b""
+            ).decode(),
+            "body": _read_content(request),
+        }
+    ).encode()
+
+
+@pytest.fixture
+def server():
+    from twisted.internet import reactor
+    from twisted.web import resource, server as web_server
+
+    class Echo(resource.Resource):
+        isLeaf = True
+        failures = []
+
+        def render(self, request):
+            if request.path == b"/flaky" and not self.failures:
+                self.failures.append(request)
+                request.setResponseCode(503)
+                return b""
+            if request.path == b"/cookies":
+                request.addCookie(b"first", b"1")
+                request.addCookie(b"second", b"2", path=b"/")
+                return b""
+            if request.path == b"/slow":
+                # Never respond.
+                return web_server.NOT_DONE_YET
+            return _echo(request)
+
+    port = reactor.listenTCP(0, web_server.Site(Echo()), interface="127.0.0.1")
+    yield "http://127.0.0.1:%d/" % port.getHost().port
+    pytest_twisted.blockon(port.stopListening())
+
+
+def raise_for_status(response):
+    response.raise_for_status()
+    return response
+
+
+class Echo(Consumer):
+    @returns.json
+    @get("/echo/{name}")
+    def get_echo(self, name, page: Query):
+        pass
+
+    @json_
+    @returns.json
+    @post("/echo")
+    def post_json(self, body: Body):
+        pass
+
+    @form_url_encoded
+    @returns.json
+    @post("/echo")
+    def post_form(self, name: Field):
+        pass
+
+    @retry(when=retry.when.status(503), backoff=retry.backoff.fixed(0))
+    @response_handler(raise_for_status)
+    @get("/flaky")
+    def get_flaky(self):
+        pass
+
+    @get("/cookies")
+    def get_cookies(self):
+        pass
+
+    @get("/slow")
+    def get_slow(self, timeout: Timeout):
+        pass
+
+
+@pytest.fixture
+def echo(server):
+    from twisted.internet import reactor
+    from twisted.web import client
+
+    pool = client.HTTPConnectionPool(reactor)
+    yield Echo(base_url=server, client=TwistedAgentClient(pool=pool))
+    pytest_twisted.blockon(pool.closeCachedConnections())
+
+
+@pytest_twisted.inlineCallbacks
+def test_get(echo):
+    response = yield echo.get_echo("prkumar", page=2)
+    assert response["method"] == "GET"
+    assert response["path"] == "/echo/prkumar"
+    assert response["args"] == {"page": ["2"]}
+
+
+@pytest_twisted.inlineCallbacks
+def test_post_json(echo):
+    response = yield echo.post_json({"id": 123})
+    assert response["method"] == "POST"
+    assert response["content_type"] == "application/json"
+    assert json.loads(response["body"]) == {"id": 123}
+
+
+@pytest_twisted.inlineCallbacks
+def test_post_form(echo):
+    response = yield echo.post_form("prkumar")
+    assert response["content_type"] == "application/x-www-form-urlencoded"
+    assert response["body"] == "name=prkumar"
+
+
+@pytest_twisted.inlineCallbacks
+def test_retry_and_response_handler(echo):
+    response = yield echo.get_flaky()
+    assert response.status_code == 200
+    assert response.json()["path"] == "/flaky"
+
+
+@pytest_twisted.inlineCallbacks
+def test_cookies(echo):
+    response = yield echo.get_cookies()
+
+    # Verify: each Set-Cookie header is parsed on its own
+    assert response.cookies.get_dict() == {"first": "1", "second": "2"}
+    assert response.headers["Set-Cookie"].count("=") == 3
+
+
+@pytest_twisted.inlineCallbacks
+def test_timeout(echo):
+    with pytest.raises(echo.exceptions.ServerTimeout):
+        yield echo.get_slow(0.1)
+
+
+@pytest_twisted.inlineCallbacks
+def test_connection_error():
+    from twisted.internet import protocol, reactor
+
+    # Find a port that nothing listens on.
+    port = reactor.listenTCP(0, protocol.Factory(), interface="127.0.0.1")
+    url = "http://127.0.0.1:%d/" % port.getHost().port
+    yield port.stopListening()
+    echo = Echo(base_url=url, client=TwistedAgentClient())
+
+    with pytest.raises(echo.exceptions.ConnectionError):
+        yield echo.get_echo("prkumar", page=1)
+
+
+@pytest_twisted.inlineCallbacks
+def test_map(echo):
+    responses = yield echo.get_echo.map(
+        ["a", "b", "c"], [1, 2, 3], concurrency=2
+    )
+    assert [r["path"] for r in responses] == ["/echo/a", "/echo/b", "/echo/c"]
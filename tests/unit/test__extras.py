@@ -24,6 +24,23 @@ def test_load_entry_points(mocker):
     func.assert_called_with("plugin-value")
 
 
+def test_iter_entry_points():
+    assert list(_extras.iter_entry_points("uplink.no-such-group")) == []
+
+
+def test_load_entry_points_once(mocker):
+    # Setup
+    load_entry_points = mocker.patch.object(_extras, "load_entry_points")
+    loaded = []
+
+    # Run
+    _extras.load_entry_points_once(_loaded=loaded)
+    _extras.load_entry_points_once(_loaded=loaded)
+
+    # Verify
+    load_entry_points.assert_called_once_with()
+
+
 def test_install(mocker):
     # Setup
     func = mocker.stub()
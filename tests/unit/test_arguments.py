@@ -3,6 +3,7 @@ import pytest
 # Local imports
 from uplink import hooks, arguments
 from uplink.converters import keys
+from uplink.deadline import DeadlineClient, DeadlineTemplate
 
 
 inject_args = pytest.mark.parametrize("args", (["arg1", "arg2", "arg3"],))
@@ -175,19 +176,21 @@ class TestArgumentAnnotationHandler(object):
         assert list(relevant) == list(args.items())
 
     def test_handle_call(self, request_builder, mocker):
-        def dummy(arg1):
+        def dummy(self, arg1):
             return arg1
 
         request_builder.get_converter.return_value = dummy
-        get_call_args = mocker.patch("uplink.utils.get_call_args")
-        get_call_args.return_value = {"arg1": "hello"}
         annotation = mocker.Mock(arguments.ArgumentAnnotation)
         handlers = arguments.ArgumentAnnotationHandler(
             dummy, {"arg1": annotation}
         )
-        handlers.handle_call(request_builder, (), {})
+        handlers.handle_call(request_builder, ("hello",), {})
         annotation.modify_request.assert_called_with(request_builder, "hello")
 
+        # Verify: keyword arguments bind the same way
+        handlers.handle_call(request_builder, (), {"arg1": "world"})
+        annotation.modify_request.assert_called_with(request_builder, "world")
+
     @inject_args
     def test_annotations(self, args):
         annotations = ["annotation"] * len(args)
@@ -437,6 +440,25 @@ class TestTimeout(ArgumentTestCase, FuncDecoratorTestCase):
         assert request_builder.info["timeout"] == 10
 
 
+class TestDeadline(ArgumentTestCase, FuncDecoratorTestCase):
+    type_cls = arguments.Deadline
+    expected_converter_key = keys.Identity()
+
+    def test_modify_request(self, request_builder):
+        client = request_builder.client
+        arguments.Deadline().modify_request(request_builder, 10)
+        assert isinstance(request_builder.client, DeadlineClient)
+        assert request_builder.client._proxy is client
+        template = request_builder.add_request_template.call_args[0][0]
+        assert isinstance(template, DeadlineTemplate)
+
+    def test_modify_request_without_deadline(self, request_builder):
+        client = request_builder.client
+        arguments.Deadline().modify_request(request_builder, None)
+        assert request_builder.client is client
+        assert not request_builder.add_request_template.called
+
+
 class TestContext(ArgumentTestCase, FuncDecoratorTestCase):
     type_cls = arguments.Context
     expected_converter_key = keys.Identity()
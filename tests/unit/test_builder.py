@@ -37,8 +37,8 @@ class TestRequestPreparer(object):
         request_preparer.prepare_request(request_builder, execution_builder)
 
         # Verify
-        execution_builder.with_client.assert_called_with(uplink_builder.client)
-        execution_builder.with_io.assert_called_with(uplink_builder.client.io())
+        execution_builder.with_client.assert_called_with(request_builder.client)
+        execution_builder.with_io.assert_called_with(request_builder.client.io())
         execution_builder.with_template(request_builder.request_template)
 
     def test_prepare_request_with_transaction_hook(
@@ -57,10 +57,60 @@ class TestRequestPreparer(object):
         transaction_hook_mock.audit_request.assert_called_with(
             None, request_builder
         )
-        execution_builder.with_client.assert_called_with(uplink_builder.client)
-        execution_builder.with_io.assert_called_with(uplink_builder.client.io())
+        execution_builder.with_client.assert_called_with(request_builder.client)
+        execution_builder.with_io.assert_called_with(request_builder.client.io())
         execution_builder.with_template(request_builder.request_template)
 
+    def test_can_send_directly(
+        self, mocker, uplink_builder, transaction_hook_mock
+    ):
+        request_preparer = builder.RequestPreparer(uplink_builder)
+        request_builder = helpers.RequestBuilder(
+            uplink_builder.client, {}, "base_url"
+        )
+        assert request_preparer.can_send_directly(request_builder)
+
+        # Verify: request templates require the state machine
+        request_builder.add_request_template(mocker.Mock())
+        assert not request_preparer.can_send_directly(request_builder)
+
+        # Verify: as do transaction hooks
+        request_builder = helpers.RequestBuilder(
+            uplink_builder.client, {}, "base_url"
+        )
+        request_builder.add_transaction_hook(transaction_hook_mock)
+        assert not request_preparer.can_send_directly(request_builder)
+
+    def test_send_directly(self, mocker, uplink_builder):
+        uplink_builder.base_url = "https://example.com"
+        request_preparer = builder.RequestPreparer(uplink_builder)
+        request_builder = helpers.RequestBuilder(
+            uplink_builder.client, {}, "https://example.com"
+        )
+        request_builder.method = "GET"
+        request_builder.relative_url = "/users"
+        client = uplink_builder.client
+        client.io.return_value = io.BlockingStrategy()
+        client.send.return_value = response = object()
+
+        assert request_preparer.send_directly(request_builder) is response
+        client.send.assert_called_with(
+            ("GET", "https://example.com/users", request_builder.info)
+        )
+
+    def test_send_directly_reraises(self, mocker, uplink_builder):
+        request_preparer = builder.RequestPreparer(uplink_builder)
+        request_builder = helpers.RequestBuilder(
+            uplink_builder.client, {}, "base_url"
+        )
+        client = uplink_builder.client
+        client.io.return_value = io.BlockingStrategy()
+        client.send.side_effect = error = IOError()
+
+        with pytest.raises(IOError) as exc_info:
+            request_preparer.send_directly(request_builder)
+        assert exc_info.value is error
+
     def test_create_request_builder(self, mocker, request_definition):
         uplink_builder = mocker.Mock(spec=builder.Builder)
         uplink_builder.converters = ()
@@ -70,6 +120,18 @@ class TestRequestPreparer(object):
         request = request_preparer.create_request_builder(request_definition)
         assert isinstance(request, helpers.RequestBuilder)
 
+    def test_create_request_builder_reuses_converter_registry(
+        self, mocker, request_definition
+    ):
+        uplink_builder = mocker.Mock(spec=builder.Builder)
+        uplink_builder.converters = ()
+        uplink_builder.hooks = ()
+        request_definition.make_converter_registry.return_value = {}
+        request_preparer = builder.RequestPreparer(uplink_builder)
+        request_preparer.create_request_builder(request_definition)
+        request_preparer.create_request_builder(request_definition)
+        request_definition.make_converter_registry.assert_called_once_with(())
+
     def test_create_request_builder_with_session_hooks(
         self, mocker, request_definition, transaction_hook_mock
     ):
@@ -89,6 +151,7 @@ class TestCallFactory(object):
         kwargs = {}
         request_preparer = mocker.Mock(spec=builder.RequestPreparer)
         request_preparer.create_request_builder.return_value = request_builder
+        request_preparer.can_send_directly.return_value = False
         execution_builder = mocker.Mock(spec=io.RequestExecutionBuilder)
         execution_builder.build().start.return_value = object()
         factory = builder.CallFactory(
@@ -108,6 +171,51 @@ class TestCallFactory(object):
             (request_builder.method, request_builder.url, request_builder.info)
         )
 
+    def test_call_sends_directly(
+        self, mocker, request_definition, request_builder
+    ):
+        request_preparer = mocker.Mock(spec=builder.RequestPreparer)
+        request_preparer.create_request_builder.return_value = request_builder
+        request_preparer.can_send_directly.return_value = True
+        request_preparer.send_directly.return_value = object()
+        execution_builder_factory = mocker.Mock()
+        factory = builder.CallFactory(
+            request_preparer, request_definition, execution_builder_factory
+        )
+        assert factory() is request_preparer.send_directly.return_value
+        request_preparer.authenticate.assert_called_with(request_builder)
+        request_preparer.send_directly.assert_called_with(request_builder)
+        assert not execution_builder_factory.called
+
+    def test_map(self, mocker, request_definition):
+        request_preparer = mocker.Mock(spec=builder.RequestPreparer)
+        io_ = request_preparer.client.io.return_value
+        factory = builder.CallFactory(
+            request_preparer, request_definition, mocker.Mock()
+        )
+
+        # Run
+        value = factory.map([1, 2], ["a", "b"], concurrency=2)
+
+        # Verify
+        assert value is io_.map.return_value
+        func, calls, concurrency = io_.map.call_args[0]
+        assert func is factory
+        assert isinstance(calls, io.FanOut)
+        assert list(calls) == [(0, (1, "a")), (1, (2, "b"))]
+        assert concurrency == 2
+
+    def test_map_with_invalid_arguments(self, mocker, request_definition):
+        factory = builder.CallFactory(
+            mocker.Mock(spec=builder.RequestPreparer),
+            request_definition,
+            mocker.Mock(),
+        )
+        with pytest.raises(TypeError):
+            factory.map([1], limit=2)
+        with pytest.raises(ValueError):
+            factory.map([1], concurrency=0)
+
 
 class TestBuilder(object):
     def test_init_adds_standard_converter_factory(self, uplink_builder):
@@ -138,6 +246,11 @@ class TestBuilder(object):
         call = uplink_builder.build(request_definition)
         assert isinstance(call, builder.CallFactory)
 
+    def test_build_with_timing_sink(self, request_definition, uplink_builder):
+        uplink_builder.timing_sink = list().append
+        call = uplink_builder.build(request_definition)
+        assert isinstance(call, builder.InstrumentedCallFactory)
+
 
 def test_build_failure(fake_service_cls):
     exception = exceptions.InvalidRequestDefinition()
@@ -193,6 +306,27 @@ def test_setting_request_method(request_definition_builder):
     assert callable(consumer.request_method)
 
 
+def test_consumer_method_is_cached_per_instance(request_definition_builder):
+    def update_wrapper(wrapper):
+        wrapper.__wrapped__ = request_definition_builder
+
+    request_definition_builder.update_wrapper.side_effect = update_wrapper
+
+    class Consumer(builder.Consumer):
+        request_method = request_definition_builder
+
+    request_definition_builder.update_wrapper.reset_mock()
+    consumer = Consumer()
+    method = consumer.request_method
+    assert consumer.request_method is method
+    assert Consumer().request_method is not method
+    assert request_definition_builder.update_wrapper.call_count == 2
+
+    # Verify: Changing the session rebuilds the method
+    consumer.session.base_url = "https://example.com"
+    assert consumer.request_method is not method
+
+
 def test_inject(mocker, fake_service_cls, transaction_hook_mock):
     # Monkey-patch the Builder class.
     builder_cls_mock = mocker.Mock()
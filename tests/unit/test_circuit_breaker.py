@@ -0,0 +1,131 @@
+# Third-party imports
+import pytest
+
+# Local imports
+from uplink.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    Circuit,
+    CircuitBreakerOpen,
+    CircuitBreakerTemplate,
+    circuit_breaker,
+)
+from uplink.retry import when
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.time = 100.0
+
+    def __call__(self):
+        return self.time
+
+    def advance(self, seconds):
+        self.time += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def circuit(clock):
+    return Circuit(
+        failure_threshold=2,
+        recovery_timeout=10,
+        half_open_max_calls=2,
+        clock=clock,
+    )
+
+
+def _open(circuit):
+    for _ in range(2):
+        assert circuit.acquire() == 0
+        circuit.record_failure()
+
+
+class TestCircuit(object):
+    def test_opens_after_consecutive_failures(self, circuit, clock):
+        circuit.record_failure()
+        circuit.record_success()
+        circuit.record_failure()
+        assert circuit.state == CLOSED
+
+        circuit.record_failure()
+        assert circuit.state == OPEN
+        clock.advance(4)
+        assert circuit.acquire() == pytest.approx(6)
+
+    def test_closes_after_successful_probes(self, circuit, clock):
+        _open(circuit)
+        clock.advance(10)
+
+        # Verify: only a limited number of probes are let through
+        assert circuit.acquire() == 0
+        assert circuit.state == HALF_OPEN
+        assert circuit.acquire() == 0
+        assert circuit.acquire() > 0
+
+        circuit.record_success()
+        assert circuit.state == HALF_OPEN
+        circuit.record_success()
+        assert circuit.state == CLOSED
+        assert circuit.acquire() == 0
+
+    def test_reopens_after_failed_probe(self, circuit, clock):
+        _open(circuit)
+        clock.advance(10)
+        assert circuit.acquire() == 0
+        circuit.record_failure()
+        assert circuit.state == OPEN
+        assert circuit.acquire() == pytest.approx(10)
+
+    def test_probes_again_if_probes_are_lost(self, circuit, clock):
+        _open(circuit)
+        clock.advance(10)
+        assert [circuit.acquire() for _ in range(3)][-1] > 0
+
+        # Verify: the probes never report back, so new probes are let
+        # through after another timeout
+        clock.advance(10)
+        assert circuit.acquire() == 0
+
+
+class TestCircuitBreakerTemplate(object):
+    def test_fail_fast(self, circuit):
+        template = CircuitBreakerTemplate(circuit, when.raises(IOError))
+        template.after_exception(None, IOError, IOError(), None)
+        template.after_exception(None, IOError, IOError(), None)
+
+        with pytest.raises(CircuitBreakerOpen) as exc_info:
+            template.before_request(None)
+        assert exc_info.value.retry_after == pytest.approx(10)
+
+    def test_failure_predicate(self, mocker, circuit):
+        template = CircuitBreakerTemplate(circuit, when.status(503))
+        response = mocker.Mock(status_code=404)
+        for _ in range(2):
+            assert template.before_request(None) is None
+            assert template.after_response(None, response) is None
+        assert circuit.state == CLOSED
+
+        # Verify: exceptions that don't match the predicate are ignored
+        template.after_exception(None, IOError, IOError(), None)
+        assert circuit.state == CLOSED
+
+        response.status_code = 503
+        template.after_response(None, response)
+        template.after_response(None, response)
+        assert circuit.state == OPEN
+
+
+def test_group_by(request_builder):
+    decorator = circuit_breaker()
+    request_builder.base_url = "https://api.github.com"
+    circuit = decorator._get_circuit_for_request(request_builder)
+    assert decorator._get_circuit_for_request(request_builder) is circuit
+
+    request_builder.base_url = "https://example.com"
+    assert decorator._get_circuit_for_request(request_builder) is not circuit
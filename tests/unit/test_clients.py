@@ -1,10 +1,13 @@
 # Standard library imports
 import contextlib
+import subprocess
+import sys
 
 # Third-party imports
 import pytest
 
 # Local imports
+from uplink import clients
 from uplink.clients import (
     AiohttpClient,
     interfaces,
@@ -25,6 +28,18 @@ requires_python34 = pytest.mark.skipif(
 )
 
 
+def _coroutine(func):
+    # Native coroutines are a syntax error before Python 3.5, so the
+    # wrapper is compiled at runtime.
+    namespace = {"func": func}
+    exec(
+        "async def coroutine(*args, **kwargs):\n"
+        "    return func(*args, **kwargs)\n",
+        namespace,
+    )
+    return namespace["coroutine"]
+
+
 @contextlib.contextmanager
 def _patch(obj, attr, value):
     if obj is not None:
@@ -58,6 +73,38 @@ def test_get_client_with_unrecognized_key():
     assert register.get_client("no client for this key") is None
 
 
+@pytest.mark.skipif(
+    sys.version_info < (3, 7), reason="Requires module __getattr__"
+)
+def test_optional_clients_are_loaded_lazily():
+    code = (
+        "import sys, uplink\n"
+        "lazy = ('aiohttp', 'twisted', 'asyncio', 'marshmallow', 'pydantic',\n"
+        "        'sqlite3')\n"
+        "assert not [m for m in lazy if m in sys.modules], sys.modules\n"
+        "assert uplink.TwistedClient.__name__ == 'TwistedClient'\n"
+        "assert 'twisted' in sys.modules\n"
+    )
+    subprocess.check_call([sys.executable, "-c", code])
+
+
+def test_get_attribute_error():
+    with pytest.raises(AttributeError):
+        clients.NotAClient
+    with pytest.raises(AttributeError):
+        io.NotAStrategy
+
+
+def test_http_client_proxy(http_client_mock):
+    proxy = interfaces.HttpClientProxy(http_client_mock)
+    assert proxy.io() is http_client_mock.io.return_value
+    assert proxy.exceptions is http_client_mock.exceptions
+    assert proxy.send("request") is http_client_mock.send.return_value
+    http_client_mock.send.assert_called_with("request")
+    proxy.apply_callback(len, "response")
+    http_client_mock.apply_callback.assert_called_with(len, "response")
+
+
 class TestRequests(object):
     def test_get_client(self, mocker):
         import requests
@@ -153,7 +200,12 @@ class TestRequests(object):
             raise requests.exceptions.InvalidURL()
 
     def test_io(self):
-        assert isinstance(requests_.RequestsClient.io(), io.BlockingStrategy)
+        client = requests_.RequestsClient()
+        assert isinstance(client.io(), io.BlockingStrategy)
+
+    def test_io_with_executor(self, mocker):
+        client = requests_.RequestsClient(executor=mocker.Mock())
+        assert isinstance(client.io(), io.FuturesStrategy)
 
 
 class TestTwisted(object):
@@ -197,6 +249,77 @@ class TestTwisted(object):
         assert isinstance(twisted_.TwistedClient.io(), io.TwistedStrategy)
 
 
+class TestTwistedAgent(object):
+    def test_init_without_agent(self):
+        from twisted.web import iweb
+
+        client = twisted_.TwistedAgentClient()
+        assert iweb.IAgent.providedBy(client._agent)
+
+    def test_init_no_twisted(self):
+        with _patch(twisted_, "client", None):
+            with pytest.raises(NotImplementedError):
+                twisted_.TwistedAgentClient()
+
+    def test_get_client(self):
+        from twisted.web import client
+
+        agent = client.Agent(None)
+        uplink_client = register.get_client(agent)
+        assert isinstance(uplink_client, twisted_.TwistedAgentClient)
+        assert uplink_client._agent is agent
+
+    def test_twisted_agent_handler(self):
+        from twisted.web import client
+
+        uplink_client = clients._twisted_agent_handler(client.Agent(None))
+        assert isinstance(uplink_client, twisted_.TwistedAgentClient)
+        assert clients._twisted_agent_handler("agent") is None
+
+    def test_send(self, mocker):
+        agent = mocker.Mock()
+        client = twisted_.TwistedAgentClient(agent)
+
+        # Run
+        client.send(
+            (
+                "POST",
+                "http://example.com/path",
+                {"params": {"q": "1"}, "headers": {"X": "y"}, "json": {}},
+            )
+        )
+
+        # Verify
+        method, uri, headers, body = agent.request.call_args[0]
+        assert method == b"POST"
+        assert uri == b"http://example.com/path?q=1"
+        assert headers.getRawHeaders(b"X") == [b"y"]
+        assert headers.getRawHeaders(b"Content-Type") == [b"application/json"]
+        assert not headers.hasHeader(b"Content-Length")
+        assert body.length == 2
+
+    def test_send_with_unsupported_options(self, mocker):
+        agent = mocker.Mock()
+        client = twisted_.TwistedAgentClient(agent)
+        url = "http://example.com/path"
+
+        # Verify: options that match what the agent does are accepted
+        client.send(("GET", url, {"allow_redirects": True, "proxies": {}}))
+        assert agent.request.called
+
+        # Verify: other options fail instead of being ignored
+        for extras in ({"allow_redirects": False}, {"verify": False}, {"x": 1}):
+            with pytest.raises(ValueError):
+                client.send(("GET", url, extras))
+
+    def test_apply_callback(self):
+        client = twisted_.TwistedAgentClient(object())
+        assert client.apply_callback(lambda x: x + 1, 1) == 2
+
+    def test_io(self):
+        assert isinstance(twisted_.TwistedAgentClient.io(), io.TwistedStrategy)
+
+
 @pytest.fixture
 def aiohttp_session_mock(mocker):
     import aiohttp
@@ -222,6 +345,11 @@ class TestAiohttp(object):
         client = register.get_client(aiohttp_session_mock)
         assert isinstance(client, aiohttp_.AiohttpClient)
 
+    def test_aiohttp_session_handler(self, aiohttp_session_mock):
+        client = clients._aiohttp_session_handler(aiohttp_session_mock)
+        assert isinstance(client, aiohttp_.AiohttpClient)
+        assert clients._aiohttp_session_handler("session") is None
+
     @requires_python34
     def test_request_send(self, mocker, aiohttp_session_mock):
         # Setup
@@ -229,11 +357,10 @@ class TestAiohttp(object):
 
         expected_response = mocker.Mock()
 
-        @asyncio.coroutine
         def request(*args, **kwargs):
             return expected_response
 
-        aiohttp_session_mock.request = request
+        aiohttp_session_mock.request = _coroutine(request)
         client = aiohttp_.AiohttpClient(aiohttp_session_mock)
 
         # Run
@@ -251,22 +378,20 @@ class TestAiohttp(object):
 
         expected_response = mocker.Mock(spec=aiohttp_.aiohttp.ClientResponse)
 
-        @asyncio.coroutine
         def request(*args, **kwargs):
             return expected_response
 
-        aiohttp_session_mock.request = request
+        aiohttp_session_mock.request = _coroutine(request)
         client = aiohttp_.AiohttpClient(aiohttp_session_mock)
-        client._sync_callback_adapter = asyncio.coroutine
+        client._sync_callback_adapter = _coroutine
 
         # Run
         globals_ = dict(globals(), client=client)
-        locals_ = {"asyncio": asyncio}
+        locals_ = {}
         exec(
-            """@asyncio.coroutine
-def call():
-    response = yield from client.send((1, 2, {}))
-    response = yield from client.apply_callback(lambda x: 2, response)
+            """async def call():
+    response = await client.send((1, 2, {}))
+    response = await client.apply_callback(lambda x: 2, response)
     return response
 """,
             globals_,
@@ -283,8 +408,6 @@ def call():
 
     @requires_python34
     def test_wrap_callback(self, mocker):
-        import asyncio
-
         # Setup
         c = AiohttpClient()
         mocker.spy(c, "_sync_callback_adapter")
@@ -299,7 +422,7 @@ def call():
         c._sync_callback_adapter.assert_called_with(callback)
 
         # Run: with coroutine callback
-        coroutine_callback = asyncio.coroutine(callback)
+        coroutine_callback = _coroutine(callback)
         assert c.wrap_callback(coroutine_callback) is coroutine_callback
 
     @requires_python34
@@ -311,7 +434,8 @@ def call():
 
         # Mock response.
         response = mocker.Mock(spec=aiohttp_.aiohttp.ClientResponse)
-        response.text = asyncio.coroutine(mocker.stub())
+        read = mocker.stub()
+        response.read = _coroutine(read)
 
         # Run
         new_callback = aiohttp_.threaded_callback(callback)
@@ -320,7 +444,7 @@ def call():
         value = loop.run_until_complete(asyncio.ensure_future(return_value))
 
         # Verify
-        response.text.assert_called_with()
+        read.assert_called_with()
         assert value == response
 
         # Run: Verify with callback that returns new value
@@ -332,21 +456,70 @@ def call():
         loop = asyncio.get_event_loop()
         value = loop.run_until_complete(asyncio.ensure_future(awaitable))
         assert value == 1
-        assert response.text.called
+        assert read.called
 
         # Run: Verify with response that is not ClientResponse (should not be wrapped)
         response = mocker.Mock()
         awaitable = new_callback(response)
         loop = asyncio.get_event_loop()
         loop.run_until_complete(asyncio.ensure_future(awaitable))
-        assert not response.text.called
+        assert not response.read.called
 
     @requires_python34
-    def test_threaded_coroutine(self):
-        # Setup
+    def test_threaded_callback_reads_body_in_place(self, mocker):
         import asyncio
+        import threading
+
+        threads = []
+
+        def json():
+            threads.append(threading.current_thread())
+            return {"key": "value"}
+
+        response = mocker.Mock(spec=aiohttp_.aiohttp.ClientResponse)
+        response.read = _coroutine(lambda: b'{"key": "value"}')
+        response.json = _coroutine(json)
 
-        @asyncio.coroutine
+        # Run
+        new_callback = aiohttp_.threaded_callback(
+            lambda r: (r.read(), r.json())
+        )
+        loop = asyncio.get_event_loop()
+        value = loop.run_until_complete(new_callback(response))
+
+        # Verify: the body accessors ran without a thread hop
+        assert value == (b'{"key": "value"}', {"key": "value"})
+        assert threads == [threading.current_thread()]
+
+    @requires_python34
+    def test_buffered_body(self, mocker):
+        import asyncio
+
+        response = mocker.Mock(spec=aiohttp_.aiohttp.ClientResponse)
+        response.text = _coroutine(lambda encoding=None: "text")
+        response.json = _coroutine(lambda **kwargs: kwargs)
+        body = aiohttp_.BufferedBody(response, b"body")
+
+        # Run & Verify
+        assert body.read() == b"body"
+        assert body.text() == "text"
+        assert body.json(content_type=None) == {"content_type": None}
+
+        # Run & Verify: fails instead of blocking on I/O
+        response.text = lambda: asyncio.sleep(0)
+        with pytest.raises(RuntimeError):
+            body.text()
+
+    @requires_python34
+    def test_get_shared_executor(self):
+        executor = aiohttp_.get_shared_executor()
+        assert isinstance(executor, aiohttp_.AsyncioExecutor)
+        assert aiohttp_.get_shared_executor() is executor
+
+    @requires_python34
+    def test_threaded_coroutine(self):
+        # Setup
+        @_coroutine
         def coroutine():
             return 1
 
@@ -361,9 +534,7 @@ def call():
     @requires_python34
     def test_threaded_response(self, mocker):
         # Setup
-        import asyncio
-
-        @asyncio.coroutine
+        @_coroutine
         def coroutine():
             return 1
 
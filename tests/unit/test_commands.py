@@ -231,7 +231,7 @@ class TestRequestDefinition(object):
         )
         definition.define_request(request_builder, (), {})
         assert request_builder.method == method
-        assert request_builder.relative_url == uri
+        assert str(request_builder.relative_url) == uri
         assert request_builder.return_type is str
 
     def test_make_converter_registry(self, annotation_handler_mock):
@@ -245,3 +245,4 @@ class TestRequestDefinition(object):
         annotation_handler_mock.annotations = ("annotation",)
         registry = definition.make_converter_registry(())
         assert isinstance(registry, converters.ConverterFactoryRegistry)
+        assert isinstance(registry, converters.CachedConverterFactoryRegistry)
@@ -97,6 +97,63 @@ class TestConverterFactoryRegistry(object):
         assert list(iter(registry)) == list(iter(self.backend))
 
 
+class TestCachedConverterFactoryRegistry(object):
+    def test_converter_is_resolved_once(
+        self, converter_factory_mock, converter_mock
+    ):
+        converter_factory_mock.create_string_converter.return_value = (
+            converter_mock
+        )
+        registry = converters.CachedConverterFactoryRegistry(
+            (converter_factory_mock,), "definition"
+        )
+
+        # Run
+        first = registry[converters.keys.CONVERT_TO_STRING](int)
+        second = registry[converters.keys.CONVERT_TO_STRING](int)
+
+        # Verify
+        assert first is second is converter_mock
+        converter_factory_mock.create_string_converter.assert_called_once_with(
+            int, "definition"
+        )
+
+    def test_missing_converter_is_cached(self, converter_factory_mock):
+        converter_factory_mock.create_string_converter.return_value = None
+        registry = converters.CachedConverterFactoryRegistry(
+            (converter_factory_mock,)
+        )
+        assert registry[converters.keys.CONVERT_TO_STRING](int) is None
+        assert registry[converters.keys.CONVERT_TO_STRING](int) is None
+        assert converter_factory_mock.create_string_converter.call_count == 1
+
+    def test_composite_key(self, converter_factory_mock, converter_mock):
+        converter_factory_mock.create_string_converter.return_value = (
+            converter_mock
+        )
+        registry = converters.CachedConverterFactoryRegistry(
+            (converter_factory_mock,)
+        )
+        key = converters.keys.Map(converters.keys.CONVERT_TO_STRING)
+        first = registry[key](int)
+        second = registry[
+            converters.keys.Map(converters.keys.CONVERT_TO_STRING)
+        ](int)
+        assert first is second
+        assert converter_factory_mock.create_string_converter.call_count == 1
+
+    def test_unhashable_type(self, converter_factory_mock, converter_mock):
+        converter_factory_mock.create_string_converter.return_value = (
+            converter_mock
+        )
+        registry = converters.CachedConverterFactoryRegistry(
+            (converter_factory_mock,)
+        )
+        registry[converters.keys.CONVERT_TO_STRING]({})
+        registry[converters.keys.CONVERT_TO_STRING]({})
+        assert converter_factory_mock.create_string_converter.call_count == 2
+
+
 def test_create_request_body_converter(converter_factory_mock):
     method = converters.create_request_body_converter(converter_factory_mock)
     assert method is converter_factory_mock.create_request_body_converter
@@ -288,6 +345,7 @@ class TestMap(object):
 
     def test_eq(self):
         assert converters.keys.Map(0) == converters.keys.Map(0)
+        assert hash(converters.keys.Map(0)) == hash(converters.keys.Map(0))
         assert not (converters.keys.Map(1) == converters.keys.Map(0))
         assert not (converters.keys.Map(1) == 1)
 
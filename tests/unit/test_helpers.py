@@ -37,6 +37,16 @@ class TestRequestBuilder(object):
         # Verify
         assert builder.return_type is str
 
+    def test_client(self, http_client_mock):
+        # Setup
+        builder = helpers.RequestBuilder(None, {}, "base_url")
+
+        # Run
+        builder.client = http_client_mock
+
+        # Verify
+        assert builder.client is http_client_mock
+
     def test_add_transaction_hook(self, transaction_hook_mock):
         # Setup
         builder = helpers.RequestBuilder(None, {}, "base_url")
@@ -47,6 +57,19 @@ class TestRequestBuilder(object):
         # Verify
         assert list(builder.transaction_hooks) == [transaction_hook_mock]
 
+    def test_add_request_template(self, mocker):
+        # Setup
+        builder = helpers.RequestBuilder(None, {}, "base_url")
+        first, second, third = mocker.Mock(), mocker.Mock(), mocker.Mock()
+
+        # Run
+        builder.add_request_template(first)
+        builder.add_request_template(second)
+        builder.add_request_template(third, first=True)
+
+        # Verify
+        assert builder.request_templates == (third, first, second)
+
     def test_context(self):
         # Setup
         builder = helpers.RequestBuilder(None, {}, "base_url")
@@ -68,6 +91,17 @@ class TestRequestBuilder(object):
         # Verify
         assert builder.relative_url == "/v1/api/users/cognifloyd/repos"
 
+    def test_url(self):
+        # Setup
+        builder = helpers.RequestBuilder(None, {}, "https://api.github.com/")
+
+        # Run
+        builder.relative_url = "users/{username}/repos"
+        builder.set_url_variable({"username": "prkumar"})
+
+        # Verify
+        assert builder.url == "https://api.github.com/users/prkumar/repos"
+
     def test_relative_url_template_type_error(self):
         # Setup
         builder = helpers.RequestBuilder(None, {}, "base_url")
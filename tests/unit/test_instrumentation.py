@@ -0,0 +1,83 @@
+# Local imports
+from uplink import instrumentation
+from uplink.clients import io
+from uplink.clients.io import interfaces
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.time = 0
+
+    def __call__(self):
+        return self.time
+
+
+class TestCallTimings(object):
+    def test_phases_are_exclusive(self):
+        clock = FakeClock()
+        timings = instrumentation.CallTimings(clock)
+        timings.enter("handlers")
+        clock.time += 1
+        with timings.phase("converters"):
+            clock.time += 2
+        clock.time += 3
+        timings.exit()
+        clock.time += 4
+        timings.finish()
+
+        assert timings.phases["handlers"] == 4
+        assert timings.phases["converters"] == 2
+        assert timings.total == 10
+
+    def test_timed(self):
+        clock = FakeClock()
+        timings = instrumentation.CallTimings(clock)
+
+        def func(value):
+            clock.time += 5
+            return value
+
+        assert timings.timed("converters", func)(1) == 1
+        assert timings.phases["converters"] == 5
+
+    def test_finish_with_exception(self):
+        timings = instrumentation.CallTimings()
+        error = Exception()
+        timings.set_request("GET", "https://example.com")
+        timings.finish(error)
+        assert timings.exception is error
+        assert timings.method == "GET"
+        assert timings.url == "https://example.com"
+        assert "GET https://example.com" in repr(timings)
+
+
+class TestTimingStrategy(object):
+    def test_invoke(self, mocker, http_client_mock):
+        clock = FakeClock()
+        timings = instrumentation.CallTimings(clock)
+        callback = mocker.Mock(spec=interfaces.InvokeCallback)
+
+        def send(request):
+            clock.time += 1
+
+        http_client_mock.send.side_effect = send
+        strategy = instrumentation.TimingStrategy(
+            io.BlockingStrategy(), http_client_mock, timings
+        )
+        strategy.invoke(http_client_mock.send, ("request",), {}, callback)
+        strategy.invoke(send, ("request",), {}, callback)
+
+        assert callback.on_success.call_count == 2
+        assert timings.phases["send"] == 1
+        assert timings.phases["handlers"] == 1
+
+    def test_sleep(self, mocker, http_client_mock):
+        timings = instrumentation.CallTimings()
+        callback = mocker.Mock(spec=interfaces.SleepCallback)
+        strategy = instrumentation.TimingStrategy(
+            io.BlockingStrategy(), http_client_mock, timings
+        )
+        strategy.sleep(0.01, callback)
+
+        callback.on_success.assert_called_with()
+        assert timings.phases["sleep"] >= 0.01
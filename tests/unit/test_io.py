@@ -1,8 +1,13 @@
+# Standard library imports
+import sys
+
 # Third-party imports
 import pytest
 
 # Local imports
+from uplink.clients import io
 from uplink.clients.io import interfaces, state, transitions
+from tests import requires_python34
 
 
 @pytest.fixture
@@ -137,6 +142,496 @@ class TestFinish(object):
         request_execution_mock.finish.assert_called_with(response)
 
 
+class _RetryTemplate(interfaces.RequestTemplate):
+    def __init__(self, attempts):
+        self._remaining = attempts
+
+    def after_exception(self, request, exc_type, exc_val, exc_tb):
+        self._remaining -= 1
+        if self._remaining > 0:
+            return transitions.sleep(0)
+
+
+def _get_stack_depth():
+    frame, depth = sys._getframe(1), 0
+    while frame is not None:
+        frame, depth = frame.f_back, depth + 1
+    return depth
+
+
+def _build_retrying_execution(mocker, strategy, depths, attempts):
+    def send(request):
+        depths.append(_get_stack_depth())
+        raise IOError()
+
+    client = mocker.Mock()
+    client.send.side_effect = send
+    execution = io.RequestExecutionBuilder()
+    execution.with_client(client)
+    execution.with_io(strategy)
+    execution.with_template(
+        io.CompositeRequestTemplate([_RetryTemplate(attempts)])
+    )
+    return execution.build()
+
+
+class TestFanOut(object):
+    def test_ordered(self):
+        calls = io.FanOut([("a",), ("b",)])
+        assert list(calls) == [(0, ("a",)), (1, ("b",))]
+        calls.succeed(1, "B")
+        calls.succeed(0, "A")
+        assert calls.results() == ["A", "B"]
+
+    def test_unordered(self):
+        calls = io.FanOut([("a",), ("b",)], ordered=False)
+        calls.succeed(1, "B")
+        calls.succeed(0, "A")
+        assert calls.results() == ["B", "A"]
+
+    def test_fail(self):
+        error = IOError()
+        calls = io.FanOut([("a",), ("b",)])
+        assert next(calls) == (0, ("a",))
+        calls.fail(0, IOError, error, None)
+        calls.fail(1, ValueError, ValueError(), None)
+
+        # Verify: no more calls start and the first failure is raised
+        assert list(calls) == []
+        with pytest.raises(IOError) as exc_info:
+            calls.results()
+        assert exc_info.value is error
+
+    def test_fail_with_return_exceptions(self):
+        error = IOError()
+        calls = io.FanOut([("a",), ("b",)], return_exceptions=True)
+        assert next(calls) == (0, ("a",))
+        calls.fail(0, IOError, error, None)
+        assert list(calls) == [(1, ("b",))]
+        calls.succeed(1, "B")
+        assert calls.results() == [error, "B"]
+
+
+class TestSemaphore(object):
+    def test_acquire(self, mocker):
+        semaphore = io.Semaphore(1)
+        first, second = mocker.Mock(), mocker.Mock()
+
+        semaphore.acquire(first)
+        semaphore.acquire(second)
+
+        # Verify: the second caller waits for the first's permit
+        first.assert_called_with()
+        assert not second.called
+        assert semaphore.locked()
+        semaphore.release()
+        second.assert_called_with()
+        semaphore.release()
+        assert not semaphore.locked()
+
+    def test_fifo(self):
+        semaphore = io.Semaphore(1)
+        order = []
+        semaphore.acquire(lambda: None)
+        for i in range(3):
+            semaphore.acquire(lambda i=i: order.append(i))
+        for _ in range(3):
+            semaphore.release()
+        assert order == [0, 1, 2]
+
+    def test_try_acquire(self):
+        semaphore = io.Semaphore(1)
+        assert semaphore.try_acquire()
+        assert not semaphore.try_acquire()
+        semaphore.release()
+        assert not semaphore.locked()
+
+    def test_cancel(self, mocker):
+        semaphore = io.Semaphore(1)
+        first, second = mocker.Mock(), mocker.Mock()
+        semaphore.acquire(first)
+        semaphore.acquire(second)
+
+        # Verify: only a pending request can be withdrawn
+        assert semaphore.cancel(second)
+        assert not semaphore.cancel(first)
+        semaphore.release()
+        assert not second.called
+        assert not semaphore.locked()
+
+
+class _Identity(interfaces.InvokeCallback):
+    def on_success(self, result):
+        return result
+
+    def on_failure(self, exc_type, exc_val, exc_tb):
+        raise exc_val
+
+
+def _square(x):
+    if x < 0:
+        raise ValueError(x)
+    return x * x
+
+
+class TestBlockingStrategy(object):
+    def test_invoke(self, mocker):
+        callback = mocker.Mock(spec=interfaces.InvokeCallback)
+        strategy = io.BlockingStrategy()
+        response = strategy.invoke(lambda: 1, (), {}, callback)
+        callback.on_success.assert_called_with(1)
+        assert response is callback.on_success.return_value
+
+    def test_execute_has_constant_stack_depth(self, mocker):
+        depths = []
+        execution = _build_retrying_execution(
+            mocker, io.BlockingStrategy(), depths, attempts=50
+        )
+
+        with pytest.raises(IOError):
+            execution.start("request")
+
+        # Verify: retries don't grow the stack
+        assert len(depths) == 50
+        assert len(set(depths[1:])) == 1
+
+    def test_map(self):
+        import threading
+
+        threads, lock = set(), threading.Lock()
+
+        def func(x):
+            with lock:
+                threads.add(threading.current_thread())
+            return _square(x)
+
+        strategy = io.BlockingStrategy()
+        calls = io.FanOut([(i,) for i in range(20)])
+        assert strategy.map(func, calls, 4) == [i * i for i in range(20)]
+        assert 1 <= len(threads) <= 4
+
+    def test_map_starts_threads_only_for_calls(self, mocker):
+        import threading
+
+        thread = mocker.patch.object(
+            threading, "Thread", wraps=threading.Thread
+        )
+        strategy = io.BlockingStrategy()
+
+        # Verify: two calls need one thread besides the calling one
+        calls = io.FanOut([(1,), (2,)])
+        assert strategy.map(_square, calls, 10) == [1, 4]
+        assert thread.call_count == 1
+
+        # Verify: no calls, no threads
+        assert strategy.map(_square, io.FanOut([]), 10) == []
+        assert thread.call_count == 1
+
+    def test_map_failure(self):
+        strategy = io.BlockingStrategy()
+        calls = io.FanOut([(1,), (-1,), (2,)])
+        with pytest.raises(ValueError):
+            strategy.map(_square, calls, 1)
+
+    def test_call_with_permit(self):
+        import threading
+        import time
+
+        in_flight, peak, lock = [0], [0], threading.Lock()
+
+        def func(x):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return _square(x)
+
+        strategy = io.BlockingStrategy()
+        semaphore = io.Semaphore(2)
+        calls = io.FanOut([(i,) for i in range(8)])
+        results = strategy.map(
+            lambda x: strategy.call_with_permit(semaphore, func, (x,)),
+            calls,
+            8,
+        )
+        assert results == [i * i for i in range(8)]
+        assert peak[0] == 2
+
+    def test_call_with_permit_failure(self):
+        strategy = io.BlockingStrategy()
+        semaphore = io.Semaphore(1)
+        with pytest.raises(ValueError):
+            strategy.call_with_permit(semaphore, _square, (-1,))
+
+        # Verify: the permit is returned
+        assert not semaphore.locked()
+
+    def test_hedge(self):
+        import time
+
+        calls = []
+
+        def func(x):
+            calls.append(x)
+            # The first call is slow, so the extra call wins.
+            time.sleep(0.5 if len(calls) == 1 else 0)
+            return len(calls)
+
+        strategy = io.BlockingStrategy()
+        assert strategy.hedge(func, (1,), (0.01,)) == 2
+        assert calls == [1, 1]
+
+    def test_hedge_without_delay(self):
+        strategy = io.BlockingStrategy()
+        assert strategy.hedge(_square, (2,), (0.5,)) == 4
+
+    def test_hedge_failure(self):
+        strategy = io.BlockingStrategy()
+        with pytest.raises(ValueError):
+            strategy.hedge(_square, (-1,), (0.5,))
+
+
+class TestFuturesStrategy(object):
+    @pytest.fixture
+    def executor(self):
+        from concurrent import futures
+
+        with futures.ThreadPoolExecutor(max_workers=2) as executor:
+            yield executor
+
+    def test_invoke(self, mocker, executor):
+        callback = mocker.Mock(spec=interfaces.InvokeCallback)
+        strategy = io.FuturesStrategy(executor)
+        future = strategy.invoke(lambda: 1, (), {}, callback)
+        assert future.result() is callback.on_success.return_value
+        callback.on_success.assert_called_with(1)
+
+    def test_execute(self, mocker, executor):
+        import threading
+
+        threads = []
+
+        def send(request):
+            threads.append(threading.current_thread())
+            raise IOError()
+
+        client = mocker.Mock()
+        client.send.side_effect = send
+        execution = io.RequestExecutionBuilder()
+        execution.with_client(client)
+        execution.with_io(io.FuturesStrategy(executor))
+        execution.with_template(
+            io.CompositeRequestTemplate([_RetryTemplate(attempts=3)])
+        )
+
+        # Run
+        future = execution.build().start("request")
+
+        # Verify: the retries ran on a worker
+        with pytest.raises(IOError):
+            future.result()
+        assert len(threads) == 3
+        assert threading.current_thread() not in threads
+
+    def test_execute_on_worker_runs_in_place(self, mocker, executor):
+        strategy = io.FuturesStrategy(executor)
+        executable = mocker.Mock(spec=interfaces.Executable)
+        executable.execute.return_value = 1
+
+        def execute():
+            return strategy.execute(executable)
+
+        # Verify: returns the result rather than another future
+        assert strategy.invoke(execute, (), {}, _Identity()).result() == 1
+
+    def test_map(self, executor):
+        strategy = io.FuturesStrategy(executor)
+        calls = io.FanOut([(i,) for i in range(10)])
+        future = strategy.map(_square, calls, 2)
+        assert future.result() == [i * i for i in range(10)]
+
+    def test_map_failure(self, executor):
+        strategy = io.FuturesStrategy(executor)
+        calls = io.FanOut([(1,), (-1,), (2,)])
+        future = strategy.map(_square, calls, 2)
+        with pytest.raises(ValueError):
+            future.result()
+
+
+@requires_python34
+class TestAsyncioStrategy(object):
+    @staticmethod
+    def _run(awaitable):
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        return loop.run_until_complete(asyncio.ensure_future(awaitable))
+
+    def test_invoke(self, mocker):
+        import asyncio
+
+        callback = mocker.Mock(spec=interfaces.InvokeCallback)
+        callback.on_success.return_value = 2
+        strategy = io.AsyncioStrategy()
+
+        # Run: with a coroutine function
+        response = strategy.invoke(asyncio.sleep, (0, 1), {}, callback)
+
+        # Verify: the invocation is deferred until awaited
+        assert not callback.on_success.called
+        assert self._run(response) == 2
+        callback.on_success.assert_called_with(1)
+
+        # Run & Verify: with a function that returns a plain value
+        response = strategy.invoke(lambda: 3, (), {}, callback)
+        assert self._run(response) == 2
+        callback.on_success.assert_called_with(3)
+
+    def test_invoke_failure(self, mocker):
+        error = IOError()
+        callback = mocker.Mock(spec=interfaces.InvokeCallback)
+        strategy = io.AsyncioStrategy()
+
+        def func():
+            raise error
+
+        response = strategy.invoke(func, (), {}, callback)
+        assert self._run(response) is callback.on_failure.return_value
+        assert callback.on_failure.call_args[0][:2] == (IOError, error)
+
+    def test_sleep(self, mocker):
+        callback = mocker.Mock(spec=interfaces.SleepCallback)
+        strategy = io.AsyncioStrategy()
+        response = strategy.sleep(0, callback)
+        assert self._run(response) is callback.on_success.return_value
+        callback.on_success.assert_called_with()
+
+    def test_finish(self):
+        response = object()
+        assert io.AsyncioStrategy().finish(response) is response
+
+    def test_execute_has_constant_stack_depth(self, mocker):
+        depths = []
+        execution = _build_retrying_execution(
+            mocker, io.AsyncioStrategy(), depths, attempts=50
+        )
+
+        with pytest.raises(IOError):
+            self._run(execution.start("request"))
+
+        # Verify: retries don't grow the stack
+        assert len(depths) == 50
+        assert len(set(depths)) == 1
+
+    def test_map(self):
+        import asyncio
+
+        in_flight, peak = [0], [0]
+
+        async def func(x):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0)
+            in_flight[0] -= 1
+            return _square(x)
+
+        strategy = io.AsyncioStrategy()
+        calls = io.FanOut([(i,) for i in range(20)])
+        results = self._run(strategy.map(func, calls, 4))
+        assert results == [i * i for i in range(20)]
+        assert peak[0] == 4
+
+    def test_call_with_permit(self):
+        import asyncio
+
+        in_flight, peak = [0], [0]
+
+        async def func(x):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0)
+            in_flight[0] -= 1
+            return _square(x)
+
+        strategy = io.AsyncioStrategy()
+        semaphore = io.Semaphore(2)
+        awaitable = asyncio.gather(
+            *[
+                strategy.call_with_permit(semaphore, func, (i,))
+                for i in range(8)
+            ]
+        )
+        assert self._run(awaitable) == [i * i for i in range(8)]
+        assert peak[0] == 2
+        assert not semaphore.locked()
+
+    def test_call_with_permit_cancelled(self):
+        import asyncio
+
+        strategy = io.AsyncioStrategy()
+        semaphore = io.Semaphore(1)
+
+        async def run():
+            blocker = asyncio.ensure_future(
+                strategy.call_with_permit(semaphore, asyncio.sleep, (0.01,))
+            )
+            waiter = asyncio.ensure_future(
+                strategy.call_with_permit(semaphore, asyncio.sleep, (0,))
+            )
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await blocker
+
+        # Verify: the cancelled waiter doesn't keep a permit
+        self._run(run())
+        assert not semaphore.locked()
+
+    def test_hedge(self):
+        import asyncio
+
+        calls, cancelled = [], []
+
+        async def func(x):
+            calls.append(x)
+            try:
+                await asyncio.sleep(1 if len(calls) == 1 else 0)
+            except asyncio.CancelledError:
+                cancelled.append(x)
+                raise
+            return len(calls)
+
+        async def run():
+            result = await strategy.hedge(func, (1,), (0.01,))
+            await asyncio.sleep(0)  # Let the cancellation go through
+            return result
+
+        strategy = io.AsyncioStrategy()
+        assert self._run(run()) == 2
+
+        # Verify: the slow call is cancelled
+        assert calls == [1, 1]
+        assert cancelled == [1]
+
+    def test_hedge_failure(self):
+        strategy = io.AsyncioStrategy()
+        with pytest.raises(ValueError):
+            self._run(strategy.hedge(_square, (-1,), (0.5,)))
+
+    def test_map_with_return_exceptions(self):
+        import asyncio
+
+        def func(x):
+            return asyncio.sleep(0, _square(x))
+
+        strategy = io.AsyncioStrategy()
+        calls = io.FanOut([(1,), (-1,)], return_exceptions=True)
+        results = self._run(strategy.map(func, calls, 2))
+        assert results[0] == 1
+        assert isinstance(results[1], ValueError)
+
+
 def test_sleep_transition(request_state_mock):
     transitions.sleep(10)(request_state_mock)
     request_state_mock.sleep.assert_called_with(10)
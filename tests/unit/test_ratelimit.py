@@ -0,0 +1,416 @@
+# Standard library imports
+import json
+import multiprocessing
+import os
+import threading
+import time
+
+# Third-party imports
+import pytest
+
+# Local imports
+from uplink.ratelimit import (
+    Backend,
+    RateLimiterTemplate,
+    FixedWindowLimiter,
+    GcraLimiter,
+    InProcessBackend,
+    SQLiteBackend,
+    SlidingLogLimiter,
+    SlidingWindowLimiter,
+    TokenBucketLimiter,
+    ratelimit,
+)
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.time = 100.0
+
+    def __call__(self):
+        return self.time
+
+    def advance(self, seconds):
+        self.time += seconds
+
+
+def _acquire_all(limiter, n):
+    return [limiter.acquire() for _ in range(n)]
+
+
+def _reserve_all(limiter, n):
+    return [limiter.reserve() for _ in range(n)]
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestFixedWindowLimiter(object):
+    def test_acquire(self, clock):
+        limiter = FixedWindowLimiter(2, 10, clock)
+        assert _acquire_all(limiter, 2) == [0, 0]
+        clock.advance(4)
+        assert limiter.acquire() == 6
+
+        # Verify: the count resets with the next period
+        clock.advance(6)
+        assert _acquire_all(limiter, 2) == [0, 0]
+
+
+class TestSlidingLogLimiter(object):
+    def test_acquire(self, clock):
+        limiter = SlidingLogLimiter(2, 10, clock)
+        limiter.acquire()
+        clock.advance(4)
+        limiter.acquire()
+        clock.advance(4)
+
+        # Verify: waits until the oldest call slides out
+        assert limiter.acquire() == pytest.approx(2)
+        clock.advance(2)
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == pytest.approx(4)
+
+
+class TestSlidingWindowLimiter(object):
+    def test_acquire(self, clock):
+        limiter = SlidingWindowLimiter(4, 10, clock)
+        assert _acquire_all(limiter, 4) == [0] * 4
+        assert limiter.acquire() == pytest.approx(10)
+
+        # Verify: the previous period's calls are weighted by overlap
+        clock.advance(11)
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == pytest.approx(1.5)
+        clock.advance(1.6)
+        assert limiter.acquire() == 0
+
+
+class TestTokenBucketLimiter(object):
+    def test_acquire(self, clock):
+        limiter = TokenBucketLimiter(10, 5, clock)
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == pytest.approx(0.5)
+        clock.advance(0.5)
+        assert limiter.acquire() == 0
+
+    def test_burst(self, clock):
+        limiter = TokenBucketLimiter(1, 1, clock, burst=3)
+        assert _acquire_all(limiter, 3) == [0, 0, 0]
+        assert limiter.acquire() == pytest.approx(1)
+
+        # Verify: the bucket never holds more than the burst size
+        clock.advance(100)
+        assert _acquire_all(limiter, 3) == [0, 0, 0]
+        assert limiter.acquire() == pytest.approx(1)
+
+
+class TestGcraLimiter(object):
+    def test_acquire(self, clock):
+        limiter = GcraLimiter(10, 5, clock)
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == pytest.approx(0.5)
+        clock.advance(0.5)
+        assert limiter.acquire() == 0
+
+    def test_burst(self, clock):
+        limiter = GcraLimiter(1, 1, clock, burst=3)
+        assert _acquire_all(limiter, 3) == [0, 0, 0]
+        assert limiter.acquire() == pytest.approx(1)
+        clock.advance(100)
+        assert _acquire_all(limiter, 3) == [0, 0, 0]
+        assert limiter.acquire() == pytest.approx(1)
+
+
+def test_algorithm(clock, request_builder):
+    request_builder.base_url = "https://api.github.com"
+    decorator = ratelimit(
+        calls=2,
+        period=1,
+        clock=clock,
+        algorithm=ratelimit.TOKEN_BUCKET,
+        burst=2,
+    )
+    limiter = decorator._get_limiter_for_request(request_builder)
+    assert isinstance(limiter, TokenBucketLimiter)
+    assert _acquire_all(limiter, 3) == [0, 0, pytest.approx(0.5)]
+
+
+@pytest.mark.parametrize(
+    "limiter_cls,expected",
+    [
+        (FixedWindowLimiter, [0, 0, 10, 10, 20]),
+        (SlidingLogLimiter, [0, 0, 10, 10, 20]),
+        (TokenBucketLimiter, [0, 5, 10, 15, 20]),
+        (GcraLimiter, [0, 5, 10, 15, 20]),
+    ],
+)
+def test_reserve(clock, limiter_cls, expected):
+    limiter = limiter_cls(2, 10, clock)
+
+    # Verify: each caller gets the next permit in line
+    assert _reserve_all(limiter, 5) == pytest.approx(expected)
+
+    # Verify: other callers wait behind the reservations
+    clock.advance(10)
+    assert limiter.acquire() == pytest.approx(10)
+
+
+def test_reserve_sliding_window(clock):
+    limiter = SlidingWindowLimiter(2, 10, clock)
+    delays = _reserve_all(limiter, 5)
+    assert delays[:2] == [0, 0]
+    assert delays == sorted(delays)
+    assert delays[2] == pytest.approx(10, abs=0.01)
+
+
+class RemoteBackend(Backend):
+    # Stands in for a network store: the state only crosses the
+    # "network" serialized, and each update is a transaction.
+    def __init__(self):
+        self._store = {}
+        self._lock = threading.Lock()
+
+    def update(self, key, func):
+        with self._lock:
+            state = json.loads(self._store.get(key, "{}"))
+            result = func(state)
+            self._store[key] = json.dumps(state)
+            return result
+
+
+@pytest.fixture(params=["in_process", "sqlite", "remote"])
+def backend(request, tmpdir):
+    if request.param == "in_process":
+        return InProcessBackend()
+    elif request.param == "sqlite":
+        return SQLiteBackend(str(tmpdir.join("ratelimit.db")))
+    else:
+        return RemoteBackend()
+
+
+@pytest.mark.parametrize(
+    "limiter_cls",
+    [
+        FixedWindowLimiter,
+        SlidingLogLimiter,
+        SlidingWindowLimiter,
+        TokenBucketLimiter,
+        GcraLimiter,
+    ],
+)
+def test_backend_shares_state(clock, backend, limiter_cls):
+    limiter1 = limiter_cls(2, 10, clock, backend=backend, key="key")
+    limiter2 = limiter_cls(2, 10, clock, backend=backend, key="key")
+    other = limiter_cls(2, 10, clock, backend=backend, key="other")
+
+    expected = _acquire_all(limiter_cls(2, 10, clock), 3)
+
+    # Verify: limiters with the same key share a count
+    shared = _acquire_all(limiter1, 2) + _acquire_all(limiter2, 1)
+    assert shared == pytest.approx(expected)
+    assert shared[-1] > 0
+    assert other.acquire() == 0
+
+    # Verify: reservations are shared, too
+    assert limiter2.reserve() > 0
+    assert limiter1.acquire() > 0
+
+
+def test_backend_rolls_back_on_error(tmpdir):
+    backend = SQLiteBackend(str(tmpdir.join("ratelimit.db")))
+
+    def fail(state):
+        state["calls"] = 1
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        backend.update("key", fail)
+
+    assert backend.update("key", dict.copy) == {}
+
+
+def test_sqlite_backend_reconnects_after_fork(mocker, tmpdir):
+    backend = SQLiteBackend(str(tmpdir.join("ratelimit.db")))
+    connection = backend._get_connection()
+    assert backend._get_connection() is connection
+
+    # Run: simulate a forked child process
+    mocker.patch("os.getpid", return_value=os.getpid() + 1)
+
+    # Verify: the child doesn't reuse the parent's connection
+    assert backend._get_connection() is not connection
+
+
+@pytest.mark.parametrize(
+    "limiter_cls",
+    [
+        FixedWindowLimiter,
+        SlidingLogLimiter,
+        SlidingWindowLimiter,
+        TokenBucketLimiter,
+        GcraLimiter,
+    ],
+)
+def test_sqlite_backend_discards_future_state(clock, tmpdir, limiter_cls):
+    # Setup: state saved before a reboot, when the monotonic clock read
+    # much later than it does now.
+    path = str(tmpdir.join("ratelimit.db"))
+    before = FakeClock()
+    before.advance(10**6)
+    limiter = limiter_cls(1, 10, before, backend=SQLiteBackend(path), key="k")
+    limiter.update_quota(0, 3600)
+    limiter.reserve()
+    limiter.reserve()
+
+    # Run
+    limiter = limiter_cls(1, 10, clock, backend=SQLiteBackend(path), key="k")
+
+    # Verify: the limiter starts over instead of waiting for days
+    assert limiter.quota_delay() == 0
+    assert limiter.reserve() == 0
+    assert limiter.acquire() == pytest.approx(10)
+
+
+def _acquire_in_process(path, clock_time, results):
+    clock = FakeClock()
+    clock.time = clock_time
+    limiter = FixedWindowLimiter(
+        5, 10, clock, backend=SQLiteBackend(path), key="key"
+    )
+    results.put(_acquire_all(limiter, 5))
+
+
+def test_sqlite_backend_across_processes(clock, tmpdir):
+    # Setup
+    path = str(tmpdir.join("ratelimit.db"))
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(
+            target=_acquire_in_process, args=(path, clock.time, results)
+        )
+        for _ in range(3)
+    ]
+
+    # Run
+    for process in processes:
+        process.start()
+    delays = sum((results.get(timeout=10) for _ in processes), [])
+    for process in processes:
+        process.join()
+
+    # Verify: the processes share a single limit
+    assert delays.count(0) == 5
+
+
+def test_ratelimit_with_backend(clock, request_builder):
+    request_builder.base_url = "https://api.github.com"
+    backend = InProcessBackend()
+    first = ratelimit(calls=1, period=10, clock=clock, backend=backend)
+    second = ratelimit(calls=1, period=10, clock=clock, backend=backend)
+    other = ratelimit(calls=2, period=10, clock=clock, backend=backend)
+
+    # Verify: decorators with the same limit share the backend's count
+    limiter = first._get_limiter_for_request(request_builder)
+    assert limiter.acquire() == 0
+    assert second._get_limiter_for_request(request_builder).acquire() > 0
+    assert other._get_limiter_for_request(request_builder).acquire() == 0
+
+
+def test_ratelimit_without_backend(clock, request_builder):
+    request_builder.base_url = "https://api.github.com"
+    first = ratelimit(calls=1, period=10, clock=clock)
+    second = ratelimit(calls=1, period=10, clock=clock)
+
+    # Verify: each decorator keeps its own count by default
+    assert first._get_limiter_for_request(request_builder).acquire() == 0
+    assert second._get_limiter_for_request(request_builder).acquire() == 0
+
+
+def test_update_quota(clock):
+    limiter = FixedWindowLimiter(1, 10, clock)
+    limiter.update_quota(2, 5)
+
+    # Verify: the server's quota replaces the limiter's own
+    assert _acquire_all(limiter, 3) == [0, 0, pytest.approx(5)]
+    assert limiter.quota_delay() == pytest.approx(5)
+
+    # Verify: the limiter falls back to its own algorithm once the
+    # server's quota resets
+    clock.advance(5)
+    assert limiter.quota_delay() == 0
+    assert _acquire_all(limiter, 2) == [0, pytest.approx(10)]
+
+
+def test_reserve_with_quota(clock):
+    limiter = GcraLimiter(10, 1, clock)
+    limiter.update_quota(0, 30)
+    assert _reserve_all(limiter, 2) == pytest.approx([30, 30.1])
+
+
+class TestAdaptiveTemplate(object):
+    @staticmethod
+    def _response(mocker, status_code=200, **headers):
+        response = mocker.Mock(status_code=status_code)
+        response.headers = headers
+        return response
+
+    def test_quota_headers(self, mocker, clock):
+        limiter = FixedWindowLimiter(100, 10, clock)
+        template = RateLimiterTemplate(limiter, None, adaptive=True)
+        response = self._response(
+            mocker, **{"RateLimit-Remaining": "1", "RateLimit-Reset": "20"}
+        )
+
+        assert template.after_response(None, response) is None
+        assert _acquire_all(limiter, 2) == [0, pytest.approx(20)]
+
+    def test_reset_timestamp(self, mocker, clock):
+        limiter = FixedWindowLimiter(100, 10, clock)
+        template = RateLimiterTemplate(limiter, None, adaptive=True)
+        response = self._response(
+            mocker,
+            **{
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(int(time.time()) + 60),
+            }
+        )
+
+        template.after_response(None, response)
+        assert limiter.acquire() == pytest.approx(60, abs=2)
+
+    def test_retry_after(self, mocker, clock):
+        limiter = FixedWindowLimiter(100, 10, clock)
+        template = RateLimiterTemplate(limiter, None, adaptive=True)
+        response = self._response(mocker, 429, **{"Retry-After": "30"})
+
+        template.after_response(None, response)
+        assert limiter.acquire() == pytest.approx(30)
+
+    def test_wake_up_after_retry_after(self, mocker, clock):
+        limiter = GcraLimiter(1, 10, clock)
+        template = RateLimiterTemplate(limiter, None, adaptive=True)
+        state = mocker.Mock()
+        assert template.before_request(None) is None
+        template.before_request(None)(state)
+        state.sleep.assert_called_with(pytest.approx(10))
+
+        # Verify: a waiting request keeps waiting if the server asked
+        # the client to back off in the meantime
+        response = self._response(mocker, 429, **{"Retry-After": "30"})
+        template.after_response(None, response)
+        clock.advance(10)
+        template.before_request(None)(state)
+        state.sleep.assert_called_with(pytest.approx(20))
+        clock.advance(20)
+        assert template.before_request(None) is None
+
+    def test_not_adaptive(self, mocker, clock):
+        limiter = FixedWindowLimiter(100, 10, clock)
+        template = RateLimiterTemplate(limiter, None)
+        response = self._response(mocker, 429, **{"Retry-After": "30"})
+
+        template.after_response(None, response)
+        assert limiter.acquire() == 0
@@ -1,6 +1,6 @@
 # Local imports
 from uplink import retry
-from uplink.retry import backoff, stop, when
+from uplink.retry import RetryBudget, backoff, stop, when
 
 
 def test_jittered_backoff():
@@ -35,6 +35,19 @@ def test_fixed_backoff():
     assert next(iterator) == 10
 
 
+def test_from_response_backoff(mocker):
+    strategy = backoff.from_response(fallback=backoff.fixed(10))
+    response = mocker.Mock(status_code=429, headers={"Retry-After": "3"})
+
+    assert strategy.get_delay(response) == 3
+    assert next(strategy()) == 10
+
+    # Verify: the header is ignored for other responses
+    response.status_code = 500
+    assert strategy.get_delay(response) is None
+    assert strategy.get_delay(None) is None
+
+
 def test_retry_stop_default():
     decorator = retry()
     assert stop.NEVER == decorator._stop
@@ -233,3 +246,41 @@ class TestClientExceptionProxies(object):
     def test_ssl_error(self, request_builder):
         exc = self._get_exception(retry.SSL_ERROR, request_builder)
         assert request_builder.client.exceptions.BaseClientException == exc
+
+
+class _Clock(object):
+    time = 100.0
+
+    def __call__(self):
+        return self.time
+
+
+def test_retry_budget():
+    clock = _Clock()
+    budget = RetryBudget(
+        ratio=0.5, min_retries_per_second=0.1, ttl=10, clock=clock
+    )
+
+    # Verify: the floor allows a retry without any requests
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+    # Verify: requests add to the budget
+    for _ in range(4):
+        budget.deposit()
+    assert [budget.withdraw() for _ in range(3)] == [True, True, False]
+
+    # Verify: old requests and retries no longer count
+    clock.time += 10
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+
+def test_retry_budget_template(request_builder):
+    budget = RetryBudget(ratio=0, min_retries_per_second=0.1, ttl=10)
+    decorator = retry(max_attempts=3, backoff=backoff.fixed(0), budget=budget)
+    template = decorator._create_template(request_builder)
+
+    # Verify: once the budget is spent, the request isn't retried
+    assert template.after_exception(None, IOError, IOError(), None) is not None
+    assert template.after_exception(None, IOError, IOError(), None) is None
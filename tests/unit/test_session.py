@@ -65,3 +65,76 @@ def test_context(uplink_builder_mock):
     # Verify
     assert uplink_builder_mock.add_hook.called
     assert sess.context == {"key": "value"}
+
+
+def test_create_is_cached(uplink_builder_mock, request_definition):
+    # Setup
+    sess = session.Session(uplink_builder_mock)
+
+    # Run
+    first = sess.create("consumer", request_definition)
+    second = sess.create("consumer", request_definition)
+
+    # Verify
+    assert first is second
+    uplink_builder_mock.build.assert_called_once_with(
+        request_definition, "consumer"
+    )
+
+
+def test_inject_invalidates_cache(
+    uplink_builder_mock, request_definition, transaction_hook_mock
+):
+    # Setup
+    sess = session.Session(uplink_builder_mock)
+    sess.create("consumer", request_definition)
+
+    # Run
+    sess.inject(transaction_hook_mock)
+    sess.create("consumer", request_definition)
+
+    # Verify
+    assert uplink_builder_mock.build.call_count == 2
+
+
+def test_auth_set_invalidates_cache(uplink_builder_mock, request_definition):
+    # Setup
+    sess = session.Session(uplink_builder_mock)
+    sess.create("consumer", request_definition)
+
+    # Run
+    sess.auth = ("username", "password")
+    sess.create("consumer", request_definition)
+
+    # Verify
+    assert uplink_builder_mock.build.call_count == 2
+
+
+def test_base_url_set(uplink_builder_mock, request_definition):
+    # Setup
+    sess = session.Session(uplink_builder_mock)
+    sess.create("consumer", request_definition)
+
+    # Run
+    sess.base_url = "https://api.github.com"
+    sess.create("consumer", request_definition)
+
+    # Verify
+    assert uplink_builder_mock.base_url == "https://api.github.com"
+    assert uplink_builder_mock.build.call_count == 2
+
+
+def test_timing_sink_set(uplink_builder_mock, request_definition):
+    # Setup
+    sess = session.Session(uplink_builder_mock)
+    sess.create("consumer", request_definition)
+    sink = list().append
+
+    # Run
+    sess.timing_sink = sink
+    sess.create("consumer", request_definition)
+
+    # Verify
+    assert sess.timing_sink is sink
+    assert uplink_builder_mock.timing_sink is sink
+    assert uplink_builder_mock.build.call_count == 2
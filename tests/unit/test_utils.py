@@ -1,5 +1,12 @@
 # Standard library imports
+import email.utils
 import sys
+import time
+import timeit
+
+# Third-party imports
+import pytest
+import uritemplate
 
 # Local imports
 from uplink import utils
@@ -29,6 +36,67 @@ def test_call_args():
     assert call_args == {"pos1": 1, "args": (2,), "kwargs": {"named": 3}}
 
 
+def _call_args_examples():
+    def func(pos1, pos2="default", *args, **kwargs):
+        pass
+
+    def keyword_only(pos1, *, key1, key2=None):
+        pass
+
+    def no_varargs(pos1, pos2=None):
+        pass
+
+    return [
+        (func, (1,), {}),
+        (func, (1, 2, 3, 4), {}),
+        (func, (1,), {"pos2": 2, "other": 3}),
+        (func, (), {"pos1": 1, "args": 2}),
+        (keyword_only, (1,), {"key1": 2}),
+        (keyword_only, (), {"pos1": 1, "key1": 2, "key2": 3}),
+        (no_varargs, (1, 2), {}),
+    ]
+
+
+@pytest.mark.parametrize("func,args,kwargs", _call_args_examples())
+def test_compile_call_args(func, args, kwargs):
+    get_call_args = utils.compile_call_args(func)
+    expected = utils.get_call_args(func, *args, **kwargs)
+    call_args = get_call_args(*args, **kwargs)
+    assert call_args == expected
+    assert list(call_args) == list(expected)
+
+
+@pytest.mark.parametrize(
+    "args,kwargs",
+    [((), {}), ((1, 2, 3), {}), ((1,), {"pos1": 2}), ((1,), {"other": 2})],
+)
+def test_compile_call_args_with_bad_arguments(args, kwargs):
+    def func(pos1, pos2=None):
+        pass
+
+    get_call_args = utils.compile_call_args(func)
+    with pytest.raises(TypeError):
+        get_call_args(*args, **kwargs)
+
+
+def test_compile_call_args_is_faster():
+    # A micro-benchmark: the compiled binder should avoid the cost of
+    # inspecting the signature on every call.
+    def func(self, user, page=1, *args, **params):
+        pass
+
+    get_call_args = utils.compile_call_args(func)
+    number = 2000
+    slow = timeit.timeit(
+        lambda: utils.get_call_args(func, None, "prkumar", per_page=10),
+        number=number,
+    )
+    fast = timeit.timeit(
+        lambda: get_call_args(None, "prkumar", per_page=10), number=number
+    )
+    assert fast < slow
+
+
 class TestURIBuilder(object):
     def test_variables_not_string(self):
         assert utils.URIBuilder.variables(None) == set()
@@ -44,3 +112,108 @@ class TestURIBuilder(object):
         assert builder.remaining_variables() == set(["variable"])
         builder.set_variable(variable="resource")
         assert len(builder.remaining_variables()) == 0
+
+
+class TestURITemplate(object):
+    @pytest.mark.parametrize(
+        "uri,variables",
+        [
+            ("/users/{user}", {"user": "a b/c"}),
+            ("/users/{user}", {}),
+            ("/todos{/id}", {"id": ""}),
+            ("/todos{/id}", {"id": 5}),
+            ("/todos{/id}", {"id": None}),
+            ("/todos{/id}/{x}", {"id": ["a", "b"], "x": 1.5}),
+            ("/search{?q}", {"q": "x y"}),
+            ("/{var.name}", {"var.name": "value"}),
+            ("/path", {}),
+        ],
+    )
+    def test_expand(self, uri, variables):
+        expected = uritemplate.URITemplate(uri).expand(variables)
+        assert utils.URITemplate(uri).expand(variables) == expected
+
+    def test_variable_names(self):
+        assert utils.URITemplate("/{a}{/b}").variable_names == {"a", "b"}
+        assert utils.URITemplate("{?a,b}").variable_names == {"a", "b"}
+
+    def test_str(self):
+        assert str(utils.URITemplate("/users/{user}")) == "/users/{user}"
+        assert str(utils.URITemplate(None)) == ""
+
+
+class TestURLJoiner(object):
+    @pytest.mark.parametrize(
+        "base_url",
+        [
+            "",
+            "example.com",
+            "https://api.github.com",
+            "https://api.github.com/v3",
+            "https://api.github.com/v3/",
+            "HTTPS://user@api.github.com:8080/v3/x?y=1#z",
+            "https://api.github.com/v3/../v4/",
+            "ftp://example.com/pub/",
+        ],
+    )
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "",
+            "users/prkumar",
+            "/users/prkumar",
+            "users/",
+            "users?q=1",
+            "users?",
+            "users#fragment",
+            "users//prkumar",
+            "../users",
+            "./users",
+            "https://example.com/users",
+            "//example.com/users",
+            "users;params",
+            "?q=1",
+        ],
+    )
+    def test_call(self, base_url, url):
+        joiner = utils.URLJoiner(base_url)
+        assert joiner(url) == utils.urlparse.urljoin(base_url, url)
+
+
+class TestLazyModule(object):
+    def test_installed_module(self):
+        class Owner(object):
+            module = utils.LazyModule("uritemplate")
+
+        assert Owner.module is uritemplate
+
+    def test_module_not_imported(self, mocker):
+        mocker.patch.dict(sys.modules)
+        sys.modules.pop("uritemplate", None)
+
+        class Owner(object):
+            module = utils.LazyModule("uritemplate")
+
+        proxy = Owner.module
+        assert proxy is not None
+        assert not utils.is_imported("uritemplate")
+        assert proxy.URITemplate is sys.modules["uritemplate"].URITemplate
+
+    def test_missing_module(self):
+        class Owner(object):
+            module = utils.LazyModule("uplink_no_such_module")
+
+        assert Owner.module is None
+
+
+def test_parse_retry_after():
+    assert utils.parse_retry_after("120") == 120
+    assert utils.parse_retry_after("-1") == 0
+    assert utils.parse_retry_after("soon") is None
+    assert utils.parse_retry_after(None) is None
+
+    # Verify: HTTP-dates are converted to a delay
+    date = email.utils.formatdate(time.time() + 60, usegmt=True)
+    assert utils.parse_retry_after(date) == pytest.approx(60, abs=2)
+    date = email.utils.formatdate(time.time() - 60, usegmt=True)
+    assert utils.parse_retry_after(date) == 0
@@ -1,8 +1,11 @@
+# Standard library imports
+import sys
+
 # Local imports
 from uplink.__about__ import __version__
-from uplink._extras import install, load_entry_points as _load_entry_points
-from uplink import returns, types
-from uplink.clients import AiohttpClient, RequestsClient, TwistedClient
+from uplink._extras import install
+from uplink import clients, returns, types
+from uplink.clients import RequestsClient
 
 # todo: remove this in v1.0.0
 from uplink.converters import MarshmallowConverter
@@ -41,10 +44,16 @@ from uplink.arguments import (
     Body,
     Url,
     Timeout,
+    Deadline,
     Context,
 )
 from uplink.ratelimit import ratelimit
 from uplink.retry import retry
+from uplink.coalesce import coalesce
+from uplink.concurrency_limit import concurrency_limit
+from uplink.hedge import hedge
+from uplink.circuit_breaker import circuit_breaker
+from uplink.deadline import deadline
 
 __all__ = [
     "__version__",
@@ -54,6 +63,7 @@ __all__ = [
     "AiohttpClient",
     "RequestsClient",
     "TwistedClient",
+    "TwistedAgentClient",
     "MarshmallowConverter",
     "build",
     "Consumer",
@@ -91,9 +101,29 @@ __all__ = [
     "Body",
     "Url",
     "Timeout",
+    "Deadline",
     "Context",
     "retry",
     "ratelimit",
+    "coalesce",
+    "concurrency_limit",
+    "hedge",
+    "circuit_breaker",
+    "deadline",
 ]
 
-_load_entry_points()
+
+def __getattr__(name):
+    # Defer loading optional clients (e.g., aiohttp) until first use.
+    if name in ("AiohttpClient", "TwistedClient", "TwistedAgentClient"):
+        return getattr(clients, name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # Module-level __getattr__ requires Python 3.7+ (PEP 562).
+    from uplink.clients import (
+        AiohttpClient,
+        TwistedClient,
+        TwistedAgentClient,
+    )
@@ -1,11 +1,11 @@
 # Standard library imports
 import inspect
 import collections
-import pkg_resources
 
 
 _INSTALLERS = collections.OrderedDict()
 _ENTRY_POINTS = collections.OrderedDict()
+_LOADED = []
 
 
 class plugin(object):
@@ -30,9 +30,27 @@ class installer(object):
         return func
 
 
+def iter_entry_points(group):
+    """Yields the installed entry points in the given group."""
+    try:
+        from importlib import metadata
+    except ImportError:  # pragma: no cover
+        try:
+            import importlib_metadata as metadata
+        except ImportError:
+            # Fall back to pkg_resources, which is much slower to import.
+            import pkg_resources
+
+            return pkg_resources.iter_entry_points(group)
+
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        return entry_points.select(group=group)
+    return entry_points.get(group, ())  # pragma: no cover
+
+
 def load_entry_points(
-    _entry_points=_ENTRY_POINTS,
-    _iter_entry_points=pkg_resources.iter_entry_points,
+    _entry_points=_ENTRY_POINTS, _iter_entry_points=iter_entry_points
 ):
     for name in _entry_points:
         plugins = {
@@ -44,7 +62,19 @@ def load_entry_points(
             func(value)
 
 
+def load_entry_points_once(_loaded=_LOADED):
+    """
+    Loads the installed plugins on first call, rather than on `import
+    uplink`, since discovering entry points requires scanning the
+    metadata of every installed distribution.
+    """
+    if not _loaded:
+        _loaded.append(True)
+        load_entry_points()
+
+
 def install(installable, _installers=_INSTALLERS):
+    load_entry_points_once()
     cls = installable if inspect.isclass(installable) else type(installable)
     for base_cls in _installers:
         if issubclass(cls, base_cls):
@@ -25,6 +25,7 @@ __all__ = [
     "Body",
     "Url",
     "Timeout",
+    "Deadline",
     "Context",
 ]
 
@@ -140,6 +141,7 @@ class ArgumentAnnotationHandler(interfaces.AnnotationHandler):
     def __init__(self, func, arguments):
         self._func = func
         self._arguments = arguments
+        self._call_args_getter = None
 
     @property
     def annotations(self):
@@ -150,7 +152,9 @@ class ArgumentAnnotationHandler(interfaces.AnnotationHandler):
         return ((n, annotations[n]) for n in call_args if n in annotations)
 
     def handle_call(self, request_builder, args, kwargs):
-        call_args = utils.get_call_args(self._func, None, *args, **kwargs)
+        if self._call_args_getter is None:
+            self._call_args_getter = utils.compile_call_args(self._func)
+        call_args = self._call_args_getter(None, *args, **kwargs)
         self.handle_call_args(request_builder, call_args)
 
     def handle_call_args(self, request_builder, call_args):
@@ -735,6 +739,43 @@ class Timeout(FuncDecoratorMixin, ArgumentAnnotation):
         request_builder.info["timeout"] = value
 
 
+class Deadline(FuncDecoratorMixin, ArgumentAnnotation):
+    """
+    Passes a deadline as a method argument at runtime.
+
+    While :py:class:`uplink.deadline` bounds every call of a consumer
+    method by the same deadline, this class turns a method argument
+    into a dynamic deadline, in seconds.
+
+    Example:
+        .. code-block:: python
+
+            @retry(stop=retry.stop.after_attempt(5))
+            @get("/user/posts")
+            def get_posts(self, deadline: Deadline() = 10):
+                \"""Fetch all posts for the current user, retrying until
+                the deadline is exceeded.\"""
+    """
+
+    @property
+    def type(self):
+        return float
+
+    @property
+    def converter_key(self):
+        """Do not convert passed argument."""
+        return keys.Identity()
+
+    def _modify_request(self, request_builder, value):
+        """Bounds the request's execution by the deadline."""
+        # Avoid a circular import, since the decorators import this
+        # module.
+        from uplink.deadline import apply_deadline
+
+        if value is not None:
+            apply_deadline(request_builder, value)
+
+
 class Context(FuncDecoratorMixin, NamedArgument):
     """
     Defines a name-value pair that is accessible to middleware at
@@ -4,13 +4,16 @@ import warnings
 
 # Local imports
 from uplink import (
+    _extras,
     arguments,
     auth as auth_,
     clients,
+    compat,
     converters as converters_,
     exceptions,
     helpers,
     hooks as hooks_,
+    instrumentation,
     interfaces,
     session,
     utils,
@@ -24,15 +27,24 @@ class RequestPreparer(object):
     def __init__(self, builder, consumer=None):
         self._client = builder.client
         self._base_url = str(builder.base_url)
-        self._converters = list(builder.converters)
+        self._join_url = utils.URLJoiner(self._base_url)
+        self._converters = tuple(builder.converters)
         self._auth = builder.auth
         self._consumer = consumer
+        self._converter_registries = {}
 
-        if builder.hooks:
-            self._session_chain = hooks_.TransactionHookChain(*builder.hooks)
+        # `builder.hooks` is an iterator, so it must be materialized to
+        # determine whether any session hooks were actually registered.
+        session_hooks = tuple(builder.hooks)
+        if session_hooks:
+            self._session_chain = hooks_.TransactionHookChain(*session_hooks)
         else:
             self._session_chain = None
 
+    @property
+    def client(self):
+        return self._client
+
     @staticmethod
     def _get_request_hooks(contract):
         chain = list(contract.transaction_hooks)
@@ -58,8 +70,34 @@ class RequestPreparer(object):
             )
         execution_builder.with_errbacks(self._wrap_hook(chain.handle_exception))
 
-    def prepare_request(self, request_builder, execution_builder):
+    def authenticate(self, request_builder):
         self._auth(request_builder)
+
+    def can_send_directly(self, request_builder):
+        """
+        Returns whether the request can skip the request execution state
+        machine: i.e., there are no request templates (e.g., `retry`)
+        and no response or error handlers to run.
+        """
+        return not (
+            self._session_chain
+            or request_builder.request_templates
+            or self._get_request_hooks(request_builder)
+        )
+
+    def send_directly(self, request_builder):
+        request = (
+            request_builder.method,
+            request_builder.url,
+            request_builder.info,
+        )
+        client = request_builder.client
+        io_ = client.io()
+        return io.Invocation(
+            io_, client.send, (request,), {}, io.FinishingCallback(io_)
+        ).start()
+
+    def prepare_request(self, request_builder, execution_builder):
         request_hooks = self._get_request_hooks(request_builder)
         if request_hooks:
             chain = hooks_.TransactionHookChain(*request_hooks)
@@ -68,13 +106,24 @@ class RequestPreparer(object):
         if self._session_chain:
             self.apply_hooks(execution_builder, self._session_chain)
 
-        execution_builder.with_client(self._client)
-        execution_builder.with_io(self._client.io())
+        execution_builder.with_client(request_builder.client)
+        execution_builder.with_io(request_builder.client.io())
         execution_builder.with_template(request_builder.request_template)
 
+    def _get_converter_registry(self, definition):
+        # Resolve converters once per request definition, rather than
+        # traversing the converter chain again on every call.
+        try:
+            return self._converter_registries[definition]
+        except KeyError:
+            registry = definition.make_converter_registry(self._converters)
+            return self._converter_registries.setdefault(definition, registry)
+
     def create_request_builder(self, definition):
-        registry = definition.make_converter_registry(self._converters)
-        req = helpers.RequestBuilder(self._client, registry, self._base_url)
+        registry = self._get_converter_registry(definition)
+        req = helpers.RequestBuilder(
+            self._client, registry, self._base_url, self._join_url
+        )
         if self._session_chain:
             self._session_chain.audit_request(self._consumer, req)
         return req
@@ -93,6 +142,9 @@ class CallFactory(object):
             self._request_definition
         )
         self._request_definition.define_request(request_builder, args, kwargs)
+        self._request_preparer.authenticate(request_builder)
+        if self._request_preparer.can_send_directly(request_builder):
+            return self._request_preparer.send_directly(request_builder)
         execution_builder = self._execution_builder_factory()
         self._request_preparer.prepare_request(
             request_builder, execution_builder
@@ -103,16 +155,139 @@ class CallFactory(object):
             (request_builder.method, request_builder.url, request_builder.info)
         )
 
+    def map(self, *iterables, **kwargs):
+        """
+        Calls the consumer method once for each set of arguments taken
+        from the given iterables, like the builtin :py:func:`map`, with
+        a bounded number of calls in flight at once.
+
+        Each call goes through the method's request templates (e.g.,
+        :py:class:`~uplink.retry`) and handlers as usual. Blocking
+        clients make the calls on a pool of threads and return the list
+        of results; non-blocking clients return an awaitable (or
+        :py:class:`~twisted.internet.defer.Deferred`) of the list.
+
+        Keyword Args:
+            concurrency (int): The maximum number of calls in flight at
+                once. Defaults to 10.
+            ordered (bool): Whether the results should be in the same
+                order as the arguments. Otherwise, the results are in
+                the order that the calls completed. Defaults to
+                :py:obj:`True`.
+            return_exceptions (bool): Whether a failed call's exception
+                should be returned in place of its result. Otherwise,
+                the first failure stops new calls from starting and is
+                raised once the calls in flight finish. Defaults to
+                :py:obj:`False`.
+        """
+        concurrency = kwargs.pop("concurrency", 10)
+        ordered = kwargs.pop("ordered", True)
+        return_exceptions = kwargs.pop("return_exceptions", False)
+        if kwargs:
+            raise TypeError(
+                "map() got unexpected keyword arguments: %s"
+                % ", ".join(sorted(kwargs))
+            )
+        if concurrency < 1:
+            raise ValueError("`concurrency` must be a positive integer.")
+        calls = io.FanOut(compat.izip(*iterables), ordered, return_exceptions)
+        return self._request_preparer.client.io().map(self, calls, concurrency)
+
+
+class InstrumentedCallFactory(CallFactory):
+    """
+    A call factory that records how long each phase of a call takes and
+    sends the resulting :class:`~uplink.instrumentation.CallTimings` to
+    the given sink once the call finishes.
+    """
+
+    def __init__(
+        self,
+        request_preparer,
+        request_definition,
+        execution_builder_factory,
+        sink,
+    ):
+        super(InstrumentedCallFactory, self).__init__(
+            request_preparer, request_definition, execution_builder_factory
+        )
+        self._sink = sink
+
+    def _prepare(self, timings, args, kwargs):
+        with timings.phase(instrumentation.ARGUMENTS):
+            request_builder = self._request_preparer.create_request_builder(
+                self._request_definition
+            )
+            self._request_definition.define_request(
+                request_builder, args, kwargs
+            )
+        with timings.phase(instrumentation.AUTH):
+            self._request_preparer.authenticate(request_builder)
+        return request_builder
+
+    def _execute(self, timings, request_builder):
+        client = request_builder.client
+        io_ = instrumentation.TimingStrategy(client.io(), client, timings)
+        request = (
+            request_builder.method,
+            request_builder.url,
+            request_builder.info,
+        )
+        timings.set_request(request[0], request[1])
+        if self._request_preparer.can_send_directly(request_builder):
+            return io.Invocation(
+                io_, client.send, (request,), {}, io.FinishingCallback(io_)
+            ).start()
+
+        if callable(request_builder.return_type):
+            request_builder.return_type = timings.timed(
+                instrumentation.CONVERTERS, request_builder.return_type
+            )
+        execution_builder = self._execution_builder_factory()
+        self._request_preparer.prepare_request(
+            request_builder, execution_builder
+        )
+        execution_builder.with_io(io_)
+        execution_builder.with_template(
+            instrumentation.TimedRequestTemplate(
+                request_builder.request_template, timings
+            )
+        )
+        return execution_builder.build().start(request)
+
+    def __call__(self, *args, **kwargs):
+        timings = instrumentation.CallTimings()
+        try:
+            request_builder = self._prepare(timings, args, kwargs)
+        except Exception as error:
+            timings.finish(error)
+            self._sink(timings)
+            raise
+
+        # Run the execution through the client's I/O strategy, so that
+        # the timings are emitted once the call actually finishes, even
+        # when the client is non-blocking.
+        io_ = self._request_preparer.client.io()
+        return io.Invocation(
+            io_,
+            self._execute,
+            (timings, request_builder),
+            {},
+            instrumentation.EmittingCallback(io_, timings, self._sink),
+        ).start()
+
 
 class Builder(interfaces.CallBuilder):
     """The default callable builder."""
 
     def __init__(self):
+        _extras.load_entry_points_once()
         self._base_url = ""
         self._hooks = []
         self._client = clients.get_client()
         self._converters = converters_.get_default_converter_factories()
         self._auth = auth_.get_auth()
+        self._timing_sink = None
 
     @property
     def client(self):
@@ -158,11 +333,26 @@ class Builder(interfaces.CallBuilder):
         if auth is not None:
             self._auth = auth_.get_auth(auth)
 
+    @property
+    def timing_sink(self):
+        return self._timing_sink
+
+    @timing_sink.setter
+    def timing_sink(self, sink):
+        self._timing_sink = sink
+
     def build(self, definition, consumer=None):
         """
         Creates a callable that uses the provided definition to execute
         HTTP requests when invoked.
         """
+        if self._timing_sink is not None:
+            return InstrumentedCallFactory(
+                RequestPreparer(self, consumer),
+                definition,
+                io.RequestExecutionBuilder,
+                self._timing_sink,
+            )
         return CallFactory(
             RequestPreparer(self, consumer),
             definition,
@@ -193,11 +383,6 @@ class ConsumerMethod(object):
             )
 
     def __get__(self, instance, owner):
-        # TODO:
-        #   Consider caching by instance/owner using WeakKeyDictionary.
-        #   This will avoid the extra copy/create per attribute reference.
-        #   However, we should do this after investigating for any latent cases
-        #   of unnecessary overhead in the codebase as a whole.
         if instance is None:
             # This code path is traditionally called when applying a class
             # decorator to a Consumer. We should return a copy of the definition
@@ -205,11 +390,14 @@ class ConsumerMethod(object):
             # other siblings (#152).
             value = self._request_definition_builder.copy()
         else:
+            # The session caches the callable per instance, so we only
+            # need to wrap it the first time it's created.
             value = instance.session.create(instance, self._request_definition)
+            if getattr(value, "__wrapped__", None) is not None:
+                return value
 
         # Make the return value look like the original method (e.g., inherit
         # docstrings and other function attributes).
-        # TODO: Ideally, we should wrap once instead of on each reference.
         self._request_definition_builder.update_wrapper(value)
         return value
 
@@ -232,11 +420,16 @@ class ConsumerMeta(type):
         else:
             builder = arguments.ArgumentAnnotationHandlerBuilder.from_func(init)
             handler = builder.build()
+            if next(handler.annotations, None) is None:
+                # Without annotated arguments, there's nothing to audit,
+                # and the hook would keep requests off the direct path.
+                return
+            get_call_args = utils.compile_call_args(init)
 
             @functools.wraps(init)
             def new_init(self, *args, **kwargs):
                 init(self, *args, **kwargs)
-                call_args = utils.get_call_args(init, self, *args, **kwargs)
+                call_args = get_call_args(self, *args, **kwargs)
                 f = functools.partial(
                     handler.handle_call_args, call_args=call_args
                 )
@@ -0,0 +1,219 @@
+# Standard library imports
+import threading
+
+# Local imports
+from uplink import decorators, utils
+from uplink.clients.io import RequestTemplate
+from uplink.ratelimit import now, ratelimit
+from uplink.retry import when as when_mod
+
+__all__ = ["circuit_breaker", "CircuitBreakerOpen"]
+
+# The states of a circuit
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+
+class CircuitBreakerOpen(RuntimeError):
+    """
+    A request failed fast, without being sent, because the circuit
+    breaker is open.
+    """
+
+    def __init__(self, retry_after):
+        super(CircuitBreakerOpen, self).__init__(
+            "Circuit breaker is open: retry in [%.3f] seconds." % retry_after
+        )
+        self.retry_after = retry_after
+
+
+class Circuit(object):
+    """
+    Tracks the outcomes of requests to decide whether to let further
+    requests through.
+
+    The circuit starts out closed, letting all requests through. After
+    ``failure_threshold`` consecutive failures, it opens, rejecting all
+    requests for ``recovery_timeout`` seconds. Then, it becomes
+    half-open, letting up to ``half_open_max_calls`` requests through
+    to probe whether the server has recovered: if they all succeed,
+    the circuit closes again, but if any fails, it opens again.
+    """
+
+    def __init__(
+        self, failure_threshold, recovery_timeout, half_open_max_calls, clock
+    ):
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._changed_at = None
+        self._probes = self._successes = 0
+
+    @property
+    def state(self):
+        return self._state
+
+    def _set_state(self, state):
+        self._state = state
+        self._changed_at = self._clock()
+        self._failures = self._probes = self._successes = 0
+
+    def acquire(self):
+        """
+        Lets a request through, if the circuit allows it.
+
+        Returns:
+            ``0`` if the request can be sent, otherwise the number of
+            seconds until the circuit lets requests through again.
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return 0
+            elapsed = self._clock() - self._changed_at
+            if self._state == OPEN:
+                if elapsed < self._recovery_timeout:
+                    return self._recovery_timeout - elapsed
+                self._set_state(HALF_OPEN)
+            elif self._probes >= self._half_open_max_calls:
+                if elapsed < self._recovery_timeout:
+                    return self._recovery_timeout - elapsed
+                # The probes never reported back (e.g., they were
+                # cancelled), so start probing again.
+                self._set_state(HALF_OPEN)
+            self._probes += 1
+            return 0
+
+    def record_success(self):
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._successes += 1
+                if self._successes >= self._half_open_max_calls:
+                    self._set_state(CLOSED)
+            else:
+                self._failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._set_state(OPEN)
+            elif self._state == CLOSED:
+                self._failures += 1
+                if self._failures >= self._failure_threshold:
+                    self._set_state(OPEN)
+
+
+class CircuitBreakerTemplate(RequestTemplate):
+    def __init__(self, circuit, condition):
+        self._circuit = circuit
+        self._condition = condition
+
+    def before_request(self, request):
+        retry_after = self._circuit.acquire()
+        if retry_after > 0:
+            raise CircuitBreakerOpen(retry_after)
+        return  # Fallback to default behavior
+
+    def after_response(self, request, response):
+        if self._condition.should_retry_after_response(response):
+            self._circuit.record_failure()
+        else:
+            self._circuit.record_success()
+        return  # Fallback to default behavior
+
+    def after_exception(self, request, exc_type, exc_val, exc_tb):
+        if self._condition.should_retry_after_exception(
+            exc_type, exc_val, exc_tb
+        ):
+            self._circuit.record_failure()
+        else:
+            self._circuit.record_success()
+        return  # Fallback to default behavior
+
+
+# noinspection PyPep8Naming
+class circuit_breaker(decorators.MethodAnnotation):
+    """
+    A decorator that stops a consumer method or an entire consumer from
+    sending requests to a server that keeps failing.
+
+    After ``failure_threshold`` consecutive failed requests, the circuit
+    breaker opens: for the next ``recovery_timeout`` seconds, requests
+    fail fast with a
+    :class:`~uplink.circuit_breaker.CircuitBreakerOpen` exception,
+    without being sent. Then, up to ``half_open_max_calls`` requests are
+    sent to probe whether the server has recovered. If they succeed,
+    requests are sent as usual again; otherwise, the circuit breaker
+    opens for another ``recovery_timeout`` seconds.
+
+    Note:
+        Like :class:`~uplink.ratelimit`, the circuit breaker tracks
+        requests separately for each host-port combination, unless
+        you specify the ``group_by`` argument.
+
+    When combined with :class:`~uplink.retry`, place
+    :class:`@circuit_breaker <uplink.circuit_breaker>` below it, so
+    that each retry counts as an attempt and an open circuit stops the
+    retries.
+
+    Args:
+        failure_threshold (int): The number of consecutive failures
+            that opens the circuit breaker.
+        recovery_timeout (float): The number of seconds that the
+            circuit breaker stays open before probing the server.
+        half_open_max_calls (int): The number of requests that probe
+            whether the server has recovered.
+        when (optional): A predicate that determines whether a request
+            failed, such as one of :mod:`uplink.retry.when`. By
+            default, requests fail when they raise an exception or the
+            server responds with a 5xx status code.
+        group_by (callable, optional): A function that maps the base
+            URL to the group of requests that share a circuit breaker.
+            If :obj:`None`, all requests share the same one.
+    """
+
+    BY_HOST_AND_PORT = ratelimit.BY_HOST_AND_PORT
+
+    _DEFAULT_PREDICATE = when_mod.raises(Exception) | when_mod.status_5xx()
+
+    def __init__(
+        self,
+        failure_threshold=5,
+        recovery_timeout=30,
+        half_open_max_calls=1,
+        when=None,
+        group_by=BY_HOST_AND_PORT,
+        clock=now,
+    ):
+        self._failure_threshold = max(1, int(failure_threshold))
+        self._recovery_timeout = recovery_timeout
+        self._half_open_max_calls = max(1, int(half_open_max_calls))
+        self._predicate = self._DEFAULT_PREDICATE if when is None else when
+        self._group_by = utils.no_op if group_by is None else group_by
+        self._clock = clock
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def _get_circuit_for_request(self, request_builder):
+        key = self._group_by(request_builder.base_url)
+        with self._lock:
+            try:
+                return self._circuits[key]
+            except KeyError:
+                circuit = Circuit(
+                    self._failure_threshold,
+                    self._recovery_timeout,
+                    self._half_open_max_calls,
+                    self._clock,
+                )
+                return self._circuits.setdefault(key, circuit)
+
+    def modify_request(self, request_builder):
+        request_builder.add_request_template(
+            CircuitBreakerTemplate(
+                self._get_circuit_for_request(request_builder),
+                self._predicate(request_builder),
+            )
+        )
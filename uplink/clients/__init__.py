@@ -10,12 +10,14 @@ Todo:
     At some point, we may want to expose this layer to the user, so
     they can create custom adapters.
 """
+# Standard library imports
+import sys
+
 # Local imports
 from uplink import utils
 from uplink.clients import interfaces, register
 from uplink.clients.register import DEFAULT_CLIENT, get_client
 from uplink.clients.requests_ import RequestsClient
-from uplink.clients.twisted_ import TwistedClient
 
 
 @register.handler
@@ -24,22 +26,82 @@ def _client_class_handler(key):
         return key()
 
 
-try:
-    from uplink.clients.aiohttp_ import AiohttpClient
-except (ImportError, SyntaxError):  # pragma: no cover
+@register.handler
+def _aiohttp_session_handler(key):
+    # The aiohttp adapter is loaded lazily, so it may not have registered
+    # its own handler yet. A key can only be an aiohttp session if aiohttp
+    # has already been imported.
+    aiohttp = sys.modules.get("aiohttp")
+    if aiohttp is not None and isinstance(key, aiohttp.ClientSession):
+        return __getattr__("AiohttpClient")(key)
+
+
+@register.handler
+def _twisted_agent_handler(key):
+    # Similarly, a key can only be a twisted agent if twisted's web
+    # client interfaces have already been imported.
+    iweb = sys.modules.get("twisted.web.iweb")
+    if iweb is not None and iweb.IAgent.providedBy(key):
+        return __getattr__("TwistedAgentClient")(key)
+
+
+def _load_aiohttp_client():
+    try:
+        from uplink.clients.aiohttp_ import AiohttpClient
+    except (ImportError, SyntaxError):  # pragma: no cover
+
+        class AiohttpClient(interfaces.HttpClientAdapter):
+            def __init__(self, *args, **kwargs):
+                raise NotImplementedError(
+                    "Failed to load `aiohttp` client: you may be using a version "
+                    "of Python below 3.3. `aiohttp` requires Python 3.4+."
+                )
+
+    return AiohttpClient
+
+
+def _load_twisted_client():
+    from uplink.clients.twisted_ import TwistedClient
+
+    return TwistedClient
+
+
+def _load_twisted_agent_client():
+    from uplink.clients.twisted_ import TwistedAgentClient
+
+    return TwistedAgentClient
+
+
+_LAZY_CLIENTS = {
+    "AiohttpClient": _load_aiohttp_client,
+    "TwistedClient": _load_twisted_client,
+    "TwistedAgentClient": _load_twisted_agent_client,
+}
+
+
+def __getattr__(name):
+    # The optional clients are loaded on first access, since importing
+    # aiohttp or twisted noticeably slows down `import uplink`.
+    try:
+        load = _LAZY_CLIENTS[name]
+    except KeyError:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = globals()[name] = load()
+    return value
+
 
-    class AiohttpClient(interfaces.HttpClientAdapter):
-        def __init__(self, *args, **kwargs):
-            raise NotImplementedError(
-                "Failed to load `aiohttp` client: you may be using a version "
-                "of Python below 3.3. `aiohttp` requires Python 3.4+."
-            )
+if sys.version_info < (3, 7):  # pragma: no cover
+    # Module-level __getattr__ requires Python 3.7+ (PEP 562).
+    AiohttpClient = _load_aiohttp_client()
+    TwistedClient = _load_twisted_client()
+    TwistedAgentClient = _load_twisted_agent_client()
 
 
 __all__ = [
     "RequestsClient",
     "AiohttpClient",
     "TwistedClient",
+    "TwistedAgentClient",
     "DEFAULT_CLIENT",
     "get_client",
 ]
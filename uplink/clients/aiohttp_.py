@@ -5,6 +5,8 @@ that returns awaitable responses.
 # Standard library imports
 import asyncio
 import collections
+import inspect
+import os
 import threading
 from concurrent import futures
 
@@ -19,14 +21,15 @@ from uplink.clients import exceptions, io, interfaces, register
 
 
 def threaded_callback(callback):
-    coroutine_callback = asyncio.coroutine(callback)
-
-    @asyncio.coroutine
-    def new_callback(response):
+    async def new_callback(response):
         if isinstance(response, aiohttp.ClientResponse):
-            yield from response.text()
-            response = ThreadedResponse(response)
-        response = yield from coroutine_callback(response)
+            # Read the body ahead of time, so that the callback can
+            # access it without waiting on the event loop.
+            body = await response.read()
+            response = ThreadedResponse(response, body)
+        response = callback(response)
+        if inspect.isawaitable(response):
+            response = await response
         if isinstance(response, ThreadedResponse):
             return response.unwrap()
         else:
@@ -79,8 +82,7 @@ class AiohttpClient(interfaces.HttpClientAdapter):
             else:
                 self._session.close()
 
-    @asyncio.coroutine
-    def session(self):
+    async def session(self):
         """Returns the underlying `aiohttp.ClientSession`."""
         if isinstance(self._session, self.__ARG_SPEC):
             args, kwargs = self._session
@@ -128,11 +130,10 @@ class AiohttpClient(interfaces.HttpClientAdapter):
         session_build_args = cls._create_session(*args, **kwargs)
         return AiohttpClient(session=session_build_args)
 
-    @asyncio.coroutine
-    def send(self, request):
+    async def send(self, request):
         method, url, extras = request
-        session = yield from self.session()
-        response = yield from session.request(method, url, **extras)
+        session = await self.session()
+        response = await session.request(method, url, **extras)
 
         # Make `aiohttp` response "quack" like a `requests` response
         response.status_code = response.status
@@ -148,21 +149,64 @@ class AiohttpClient(interfaces.HttpClientAdapter):
 
 
 class ThreadedCoroutine(object):
-    def __init__(self, coroutine):
-        self.__coroutine = coroutine
+    """
+    Runs a coroutine to completion on a background event loop, blocking
+    until the result is available.
+    """
+
+    def __init__(self, coroutine, executor=None):
+        self._coroutine = coroutine
+        self._executor = executor
 
     def __call__(self, *args, **kwargs):
-        with AsyncioExecutor() as executor:
-            future = executor.submit(self.__coroutine, *args, **kwargs)
-            result = future.result()
-        return result
+        executor = self._executor or get_shared_executor()
+        future = executor.submit(self._coroutine, *args, **kwargs)
+        return future.result()
+
+
+def _run_in_place(coroutine):
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coroutine.close()
+    raise RuntimeError(
+        "Expected the body accessor to complete without waiting on I/O."
+    )
+
+
+class BufferedBody(object):
+    """
+    Serves the body accessors of a response whose body was already read
+    (i.e., ``read``, ``text``, and ``json``) synchronously.
+
+    Once the body is cached, :py:class:`aiohttp.ClientResponse`'s own
+    ``text`` and ``json`` return without waiting on I/O, so they run in
+    place here.
+    """
+
+    def __init__(self, response, body):
+        self._response = response
+        self._body = body
+
+    def read(self):
+        return self._body
+
+    def text(self, *args, **kwargs):
+        return _run_in_place(self._response.text(*args, **kwargs))
+
+    def json(self, *args, **kwargs):
+        return _run_in_place(self._response.json(*args, **kwargs))
 
 
 class ThreadedResponse(object):
-    def __init__(self, response):
+    def __init__(self, response, body=None):
         self.__response = response
+        self.__body = None if body is None else BufferedBody(response, body)
 
     def __getattr__(self, item):
+        if self.__body is not None and item in ("read", "text", "json"):
+            return getattr(self.__body, item)
         value = getattr(self.__response, item)
         if asyncio.iscoroutinefunction(value):
             return ThreadedCoroutine(value)
@@ -183,6 +227,7 @@ class AsyncioExecutor(futures.Executor):
     def __init__(self):
         self._loop = asyncio.new_event_loop()
         self._thread = threading.Thread(target=self._target)
+        self._thread.daemon = True
         self._thread.start()
 
     def _target(self):
@@ -199,6 +244,27 @@ class AsyncioExecutor(futures.Executor):
             self._thread.join()
 
 
+_shared_executor = None
+_shared_executor_pid = None
+_shared_executor_lock = threading.Lock()
+
+
+def get_shared_executor():
+    """
+    Returns the executor that runs coroutines for synchronous callbacks.
+
+    The executor is created on first use and lives for the rest of the
+    process, so that the callbacks reuse one event loop and thread.
+    """
+    global _shared_executor, _shared_executor_pid
+    with _shared_executor_lock:
+        # The executor's thread doesn't survive a fork.
+        if _shared_executor is None or _shared_executor_pid != os.getpid():
+            _shared_executor = AsyncioExecutor()
+            _shared_executor_pid = os.getpid()
+        return _shared_executor
+
+
 # === Register client exceptions === #
 if aiohttp is not None:  # pragma: no cover
     AiohttpClient.exceptions.BaseClientException = aiohttp.ClientError
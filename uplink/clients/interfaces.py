@@ -25,3 +25,26 @@ class HttpClientAdapter(io.Client):
 
     def apply_callback(self, callback, response):
         raise NotImplementedError
+
+
+class HttpClientProxy(HttpClientAdapter):
+    """
+    Forwards everything to another client. Subclasses override the
+    methods whose behavior they change (e.g., :py:meth:`send`).
+    """
+
+    def __init__(self, proxy):
+        self._proxy = proxy
+
+    def io(self):
+        return self._proxy.io()
+
+    @property
+    def exceptions(self):
+        return self._proxy.exceptions
+
+    def send(self, request):
+        return self._proxy.send(request)
+
+    def apply_callback(self, callback, response):
+        return self._proxy.apply_callback(callback, response)
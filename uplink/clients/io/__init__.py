@@ -1,44 +1,90 @@
+# Standard library imports
+import sys
+
+# Local imports
 from uplink.clients.io.interfaces import (
     Client,
     Executable,
     IOStrategy,
     RequestTemplate,
 )
-from uplink.clients.io.execution import RequestExecutionBuilder
+from uplink.clients.io.execution import (
+    FinishingCallback,
+    Invocation,
+    RequestExecutionBuilder,
+)
+from uplink.clients.io.fanout import FanOut
+from uplink.clients.io.semaphore import Semaphore
 from uplink.clients.io.templates import CompositeRequestTemplate
 from uplink.clients.io.blocking_strategy import BlockingStrategy
+from uplink.clients.io.futures_strategy import FuturesStrategy
 
 __all__ = [
     "Client",
     "CompositeRequestTemplate",
     "Executable",
+    "FanOut",
+    "FinishingCallback",
+    "Invocation",
     "IOStrategy",
     "RequestTemplate",
+    "Semaphore",
     "BlockingStrategy",
+    "FuturesStrategy",
     "AsyncioStrategy",
     "TwistedStrategy",
     "RequestExecutionBuilder",
 ]
 
-try:
-    from uplink.clients.io.asyncio_strategy import AsyncioStrategy
-except (ImportError, SyntaxError):  # pragma: no cover
 
-    class AsyncioStrategy(IOStrategy):
-        def __init__(self, *args, **kwargs):
-            raise NotImplementedError(
-                "Failed to load `asyncio` execution strategy: you may be using a version "
-                "of Python below 3.3. `aiohttp` requires Python 3.4+."
-            )
+def _load_asyncio_strategy():
+    try:
+        from uplink.clients.io.asyncio_strategy import AsyncioStrategy
+    except (ImportError, SyntaxError):  # pragma: no cover
+
+        class AsyncioStrategy(IOStrategy):
+            def __init__(self, *args, **kwargs):
+                raise NotImplementedError(
+                    "Failed to load `asyncio` execution strategy: you may be using a version "
+                    "of Python below 3.3. `aiohttp` requires Python 3.4+."
+                )
+
+    return AsyncioStrategy
+
+
+def _load_twisted_strategy():
+    try:
+        from uplink.clients.io.twisted_strategy import TwistedStrategy
+    except (ImportError, SyntaxError):  # pragma: no cover
+
+        class TwistedStrategy(IOStrategy):
+            def __init__(self, *args, **kwargs):
+                raise NotImplementedError(
+                    "Failed to load `twisted` execution strategy: you may be not have "
+                    "the twisted library installed."
+                )
+
+    return TwistedStrategy
+
+
+_LAZY_STRATEGIES = {
+    "AsyncioStrategy": _load_asyncio_strategy,
+    "TwistedStrategy": _load_twisted_strategy,
+}
+
 
+def __getattr__(name):
+    # The non-blocking strategies are loaded on first access, since
+    # importing asyncio or twisted noticeably slows down `import uplink`.
+    try:
+        load = _LAZY_STRATEGIES[name]
+    except KeyError:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = globals()[name] = load()
+    return value
 
-try:
-    from uplink.clients.io.twisted_strategy import TwistedStrategy
-except (ImportError, SyntaxError):  # pragma: no cover
 
-    class TwistedStrategy(IOStrategy):
-        def __init__(self, *args, **kwargs):
-            raise NotImplementedError(
-                "Failed to load `twisted` execution strategy: you may be not have "
-                "the twisted library installed."
-            )
+if sys.version_info < (3, 7):  # pragma: no cover
+    # Module-level __getattr__ requires Python 3.7+ (PEP 562).
+    AsyncioStrategy = _load_asyncio_strategy()
+    TwistedStrategy = _load_twisted_strategy()
@@ -1,5 +1,6 @@
 # Third-party imports
 import asyncio
+import inspect
 import sys
 
 # Local models
@@ -8,32 +9,147 @@ from uplink.clients.io import interfaces
 __all__ = ["AsyncioStrategy"]
 
 
+class _Step(object):
+    """
+    A pending step of an execution.
+
+    Steps are returned to the loop in :py:func:`_run` instead of being
+    awaited in place, so that each state transition doesn't add another
+    coroutine frame. Awaiting a step directly runs it, and any steps
+    that follow it, to completion.
+    """
+
+    __slots__ = ("callback",)
+
+    def __await__(self):
+        return _run(self).__await__()
+
+
+class _Invocation(_Step):
+    __slots__ = ("func", "args", "kwargs")
+
+    def __init__(self, func, args, kwargs, callback):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.callback = callback
+
+
+class _Sleep(_Step):
+    __slots__ = ("duration",)
+
+    def __init__(self, duration, callback):
+        self.duration = duration
+        self.callback = callback
+
+
+async def _run(step):
+    while True:
+        if isinstance(step, _Invocation):
+            try:
+                response = step.func(*step.args, **step.kwargs)
+                if inspect.isawaitable(response):
+                    response = await response
+            except Exception as error:
+                tb = sys.exc_info()[2]
+                step = step.callback.on_failure(type(error), error, tb)
+            else:
+                step = step.callback.on_success(response)
+        elif isinstance(step, _Sleep):
+            await asyncio.sleep(step.duration)
+            step = step.callback.on_success()
+        else:
+            return step
+
+
+def _set_result(future, result):
+    if not future.done():
+        future.set_result(result)
+
+
 class AsyncioStrategy(interfaces.IOStrategy):
     """A non-blocking execution strategy using asyncio."""
 
-    @asyncio.coroutine
     def invoke(self, func, args, kwargs, callback):
-        try:
-            response = yield from func(*args, **kwargs)
-        except Exception as error:
-            tb = sys.exc_info()[2]
-            response = yield from callback.on_failure(type(error), error, tb)
-        else:
-            response = yield from callback.on_success(response)
-        return response
+        return _Invocation(func, args, kwargs, callback)
 
-    @asyncio.coroutine
     def sleep(self, duration, callback):
-        yield from asyncio.sleep(duration)
-        response = yield from callback.on_success()
-        return response
+        return _Sleep(duration, callback)
 
-    @asyncio.coroutine
     def finish(self, response):
-        yield
         return response
 
-    @asyncio.coroutine
-    def execute(self, executable):
-        response = yield from executable.execute()
-        return response
+    async def execute(self, executable):
+        return await _run(executable.execute())
+
+    async def call_with_permit(self, semaphore, func, args):
+        loop = asyncio.get_event_loop()
+        granted = loop.create_future()
+
+        def notify():
+            # The permit may be released on another thread.
+            loop.call_soon_threadsafe(_set_result, granted, None)
+
+        semaphore.acquire(notify)
+        try:
+            await granted
+        except asyncio.CancelledError:
+            if not semaphore.cancel(notify):
+                semaphore.release()
+            raise
+        try:
+            result = func(*args)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        finally:
+            semaphore.release()
+
+    async def hedge(self, func, args, delays):
+        loop = asyncio.get_event_loop()
+
+        async def call():
+            result = func(*args)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        start_time = loop.time()
+        delays = iter(delays)
+        next_delay = next(delays, None)
+        pending = {asyncio.ensure_future(call())}
+        try:
+            while True:
+                timeout = None
+                if next_delay is not None:
+                    timeout = max(0, start_time + next_delay - loop.time())
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    pending.add(asyncio.ensure_future(call()))
+                    next_delay = next(delays, None)
+                    continue
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                if not pending:
+                    return done.pop().result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def map(self, func, calls, concurrency):
+        async def work():
+            for index, args in calls:
+                try:
+                    result = await func(*args)
+                except Exception:
+                    calls.fail(index, *sys.exc_info())
+                else:
+                    calls.succeed(index, result)
+
+        await asyncio.gather(*[work() for _ in range(concurrency)])
+        return calls.results()
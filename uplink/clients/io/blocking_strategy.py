@@ -1,31 +1,152 @@
 # Standard library imports
+import itertools
 import sys
+import threading
 import time
 
+# Third-party imports
+from six.moves import queue
+
 # Local imports
+from uplink import compat
 from uplink.clients.io import interfaces
 
 __all__ = ["BlockingStrategy"]
 
 
+class _Continuation(object):
+    """A deferred callback invocation, run by the trampoline."""
+
+    __slots__ = ("_func", "_args")
+
+    def __init__(self, func, args):
+        self._func = func
+        self._args = args
+
+    def __call__(self):
+        return self._func(*self._args)
+
+
 class BlockingStrategy(interfaces.IOStrategy):
     """A blocking execution strategy."""
 
+    def __init__(self):
+        # While an execution is running, callbacks are returned to the
+        # loop in `execute` instead of being invoked in place. This way,
+        # the stack depth stays constant across state transitions (e.g.,
+        # when a request is retried many times). The flag is per thread,
+        # since an instance may run executions on several threads.
+        self._local = threading.local()
+
+    def _resume(self, func, *args):
+        if getattr(self._local, "trampolined", False):
+            return _Continuation(func, args)
+        return func(*args)
+
     def invoke(self, func, arg, kwargs, callback):
         try:
             response = func(*arg, **kwargs)
         except Exception as error:
             tb = sys.exc_info()[2]
-            return callback.on_failure(type(error), error, tb)
+            return self._resume(callback.on_failure, type(error), error, tb)
         else:
-            return callback.on_success(response)
+            return self._resume(callback.on_success, response)
 
     def sleep(self, duration, callback):
         time.sleep(duration)
-        return callback.on_success()
+        return self._resume(callback.on_success)
 
     def finish(self, response):
         return response
 
     def execute(self, executable):
-        return executable.execute()
+        # Each execution runs its own loop, even when nested inside
+        # another one (e.g., a request sent from a response handler),
+        # since the enclosing execution needs the nested one's result,
+        # not its pending continuations.
+        local = self._local
+        previous = getattr(local, "trampolined", False)
+        local.trampolined = True
+        try:
+            result = executable.execute()
+            while isinstance(result, _Continuation):
+                result = result()
+            return result
+        finally:
+            local.trampolined = previous
+
+    def call_with_permit(self, semaphore, func, args):
+        granted = threading.Event()
+        semaphore.acquire(granted.set)
+        granted.wait()
+        try:
+            return func(*args)
+        finally:
+            semaphore.release()
+
+    def hedge(self, func, args, delays):
+        outcomes = queue.Queue()
+
+        def call():
+            try:
+                outcomes.put((func(*args), None))
+            except Exception:
+                outcomes.put((None, sys.exc_info()))
+
+        def start():
+            # Calls run on their own threads, so the caller can wait
+            # for whichever finishes first. A blocking call can't be
+            # cancelled, so the losers finish in the background.
+            thread = threading.Thread(target=call)
+            thread.daemon = True
+            thread.start()
+
+        start_time = time.time()
+        delays = iter(delays)
+        next_delay = next(delays, None)
+        in_flight = 1
+        start()
+        while True:
+            timeout = None
+            if next_delay is not None:
+                timeout = max(0, start_time + next_delay - time.time())
+            try:
+                result, exc_info = outcomes.get(timeout=timeout)
+            except queue.Empty:
+                in_flight += 1
+                start()
+                next_delay = next(delays, None)
+                continue
+            if exc_info is None:
+                return result
+            in_flight -= 1
+            if not in_flight:
+                compat.reraise(*exc_info)
+
+    def map(self, func, calls, concurrency):
+        def work(call):
+            while call is not None:
+                index, args = call
+                try:
+                    result = func(*args)
+                except Exception:
+                    calls.fail(index, *sys.exc_info())
+                else:
+                    calls.succeed(index, result)
+                call = next(calls, None)
+
+        # The calling thread works alongside the others, and a thread is
+        # only started for a call that is ready to run, so that a short
+        # batch doesn't start threads that have nothing to do.
+        first = next(calls, None)
+        threads = [
+            threading.Thread(target=work, args=(call,))
+            for call in itertools.islice(calls, concurrency - 1)
+        ]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        work(first)
+        for thread in threads:
+            thread.join()
+        return calls.results()
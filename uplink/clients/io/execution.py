@@ -108,6 +108,29 @@ class FinishingCallback(interfaces.InvokeCallback):
         return self._io.fail(exc_type, exc_val, exc_tb)
 
 
+class Invocation(interfaces.Executable):
+    """
+    A single invocation of ``func``, run to completion with
+    :py:meth:`IOStrategy.execute` so that callers get the strategy's
+    usual result type (e.g., a coroutine or a Deferred).
+    """
+
+    def __init__(self, io, func, args, kwargs, callback):
+        self._io = io
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+        self._callback = callback
+
+    def execute(self):
+        return self._io.invoke(
+            self._func, self._args, self._kwargs, self._callback
+        )
+
+    def start(self):
+        return self._io.execute(self)
+
+
 class IOStrategyDecorator(interfaces.IOStrategy):
     def __init__(self, io):
         self._io = io
@@ -121,6 +144,15 @@ class IOStrategyDecorator(interfaces.IOStrategy):
     def execute(self, executable):
         return self._io.execute(executable)
 
+    def map(self, func, calls, concurrency):
+        return self._io.map(func, calls, concurrency)
+
+    def call_with_permit(self, semaphore, func, args):
+        return self._io.call_with_permit(semaphore, func, args)
+
+    def hedge(self, func, args, delays):
+        return self._io.hedge(func, args, delays)
+
     def finish(self, response):
         return self._io.finish(response)
 
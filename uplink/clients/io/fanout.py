@@ -0,0 +1,75 @@
+# Standard library imports
+import threading
+
+# Local imports
+from uplink import compat
+
+__all__ = ["FanOut"]
+
+
+class FanOut(object):
+    """
+    The calls of a bounded fan-out (e.g., a consumer method's ``map``).
+
+    Workers draw the arguments of the next call by iterating over this
+    object, and report the outcome of each call through
+    :py:meth:`succeed` or :py:meth:`fail`. Iteration is thread-safe, so
+    the workers of a blocking strategy can share the same instance.
+
+    Args:
+        args: An iterable of positional argument tuples, one per call.
+        ordered (bool): Whether the results should be in the same order
+            as the arguments. Otherwise, results are in the order that
+            the calls completed.
+        return_exceptions (bool): Whether a failed call's exception
+            should be returned in place of its result. Otherwise, the
+            first failure stops any further calls from starting and is
+            raised once the calls already in flight finish.
+    """
+
+    def __init__(self, args, ordered=True, return_exceptions=False):
+        self._args = enumerate(args)
+        self._ordered = ordered
+        self._return_exceptions = return_exceptions
+        self._results = {} if ordered else []
+        self._exc_info = None
+        self._lock = threading.Lock()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        with self._lock:
+            if self._exc_info is not None:
+                raise StopIteration
+            return next(self._args)
+
+    next = __next__
+
+    def succeed(self, index, result):
+        """Records the result of the call at the given position."""
+        with self._lock:
+            if self._ordered:
+                self._results[index] = result
+            else:
+                self._results.append(result)
+
+    def fail(self, index, exc_type, exc_val, exc_tb):
+        """Records the failure of the call at the given position."""
+        if self._return_exceptions:
+            self.succeed(index, exc_val)
+            return
+        with self._lock:
+            if self._exc_info is None:
+                self._exc_info = (exc_type, exc_val, exc_tb)
+
+    def results(self):
+        """
+        Returns the results of the calls, or raises the first failure if
+        exceptions aren't returned.
+        """
+        if self._exc_info is not None:
+            compat.reraise(*self._exc_info)
+        if self._ordered:
+            return [self._results[i] for i in range(len(self._results))]
+        return list(self._results)
@@ -0,0 +1,90 @@
+# Standard library imports
+import sys
+import threading
+from concurrent import futures
+
+# Local imports
+from uplink.clients.io.blocking_strategy import BlockingStrategy
+
+__all__ = ["FuturesStrategy"]
+
+# Marks the threads that are running work submitted by this strategy.
+_worker = threading.local()
+
+
+def _is_worker():
+    return getattr(_worker, "active", False)
+
+
+def _run_as_worker(func, *args):
+    previous, _worker.active = _is_worker(), True
+    try:
+        return func(*args)
+    finally:
+        _worker.active = previous
+
+
+class FuturesStrategy(BlockingStrategy):
+    """
+    A non-blocking execution strategy that runs each request's execution
+    on an executor (e.g., a :py:class:`concurrent.futures.ThreadPoolExecutor`)
+    and returns a :py:class:`concurrent.futures.Future` of the result.
+
+    The entire execution runs on a worker of the executor, including
+    any retries, sleeps, and response handlers. Requests made from a
+    worker (e.g., inside a response handler) run in place, so that they
+    don't wait on the executor they're running on.
+
+    Args:
+        executor (:py:class:`concurrent.futures.Executor`): The executor
+            that runs the executions.
+    """
+
+    def __init__(self, executor):
+        super(FuturesStrategy, self).__init__()
+        self._executor = executor
+
+    def _submit(self, func, *args):
+        return self._executor.submit(_run_as_worker, func, *args)
+
+    def invoke(self, func, args, kwargs, callback):
+        invoke = super(FuturesStrategy, self).invoke
+        if _is_worker() or getattr(self._local, "trampolined", False):
+            return invoke(func, args, kwargs, callback)
+        return self._submit(invoke, func, args, kwargs, callback)
+
+    def execute(self, executable):
+        execute = super(FuturesStrategy, self).execute
+        if _is_worker():
+            return execute(executable)
+        return self._submit(execute, executable)
+
+    def map(self, func, calls, concurrency):
+        result = futures.Future()
+        lock = threading.Lock()
+        remaining = [concurrency]
+
+        def work():
+            for index, args in calls:
+                try:
+                    value = func(*args)
+                except Exception:
+                    calls.fail(index, *sys.exc_info())
+                else:
+                    calls.succeed(index, value)
+
+        def on_done(_):
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            try:
+                result.set_result(calls.results())
+            except Exception as error:
+                result.set_exception(error)
+
+        # Each worker runs its calls in place, so the map occupies at
+        # most the given number of the executor's workers.
+        for _ in range(concurrency):
+            self._submit(work).add_done_callback(on_done)
+        return result
@@ -308,3 +308,57 @@ class IOStrategy(object):
         of this strategy.
         """
         raise NotImplementedError
+
+    def map(self, func, calls, concurrency):
+        """
+        Invokes the given function for each call of a fan-out, with at
+        most the given number of invocations in flight at once.
+
+        Args:
+            func (callable): The function to invoke.
+            calls (:obj:`uplink.clients.io.FanOut`): The fan-out, which
+                yields the index and arguments of each call and collects
+                the outcome of each invocation.
+            concurrency (int): The maximum number of concurrent
+                invocations.
+
+        Returns:
+            The results of the fan-out, once every invocation finishes.
+        """
+        raise NotImplementedError
+
+    def call_with_permit(self, semaphore, func, args):
+        """
+        Calls the given function once the semaphore grants a permit,
+        and returns the permit when the function's result is ready.
+
+        Args:
+            semaphore (:obj:`uplink.clients.io.Semaphore`): The
+                semaphore that limits the number of concurrent calls.
+            func (callable): The function to call.
+            args: The function's positional arguments.
+
+        Returns:
+            The function's result.
+        """
+        raise NotImplementedError
+
+    def hedge(self, func, args, delays):
+        """
+        Calls the given function, then calls it again after each of the
+        given delays, until one of the calls succeeds. Calls that are
+        still in flight once a call succeeds are cancelled, where
+        possible.
+
+        Args:
+            func (callable): The function to call.
+            args: The function's positional arguments.
+            delays: The number of seconds after the first call at which
+                to make each extra call, in ascending order.
+
+        Returns:
+            The result of the first call to succeed. If every call that
+            was made fails, the last failure is raised instead, without
+            making any further calls.
+        """
+        raise NotImplementedError
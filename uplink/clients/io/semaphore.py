@@ -0,0 +1,83 @@
+# Standard library imports
+import collections
+import threading
+
+__all__ = ["Semaphore"]
+
+
+class Semaphore(object):
+    """
+    A thread-safe counting semaphore that grants permits in FIFO order.
+
+    Instead of blocking, :py:meth:`acquire` takes a function to call
+    once the permit is granted, so that each I/O strategy can wait for
+    the permit in its own way (e.g., on a :py:class:`threading.Event` or
+    an :py:class:`asyncio.Future`).
+
+    Args:
+        value (int): The number of permits.
+    """
+
+    def __init__(self, value):
+        self._value = value
+        self._waiters = collections.deque()
+        self._lock = threading.Lock()
+
+    def locked(self):
+        """Returns :obj:`True` if no permit is available right now."""
+        with self._lock:
+            return self._value <= 0
+
+    def acquire(self, notify):
+        """
+        Requests a permit.
+
+        Args:
+            notify (callable): Called without arguments once the permit
+                is granted: immediately if a permit is available,
+                otherwise from the thread that releases a permit.
+        """
+        with self._lock:
+            if self._value <= 0:
+                self._waiters.append(notify)
+                return
+            self._value -= 1
+        notify()
+
+    def try_acquire(self):
+        """
+        Takes a permit only if one is available right now.
+
+        Returns:
+            :obj:`True` if the permit was taken, in which case the
+            caller should release it.
+        """
+        with self._lock:
+            if self._value <= 0:
+                return False
+            self._value -= 1
+            return True
+
+    def cancel(self, notify):
+        """
+        Withdraws a pending request for a permit.
+
+        Returns:
+            :obj:`False` if the permit was already granted, in which
+            case the caller should release it.
+        """
+        with self._lock:
+            try:
+                self._waiters.remove(notify)
+            except ValueError:
+                return False
+            return True
+
+    def release(self):
+        """Returns a permit, handing it to the longest waiter if any."""
+        with self._lock:
+            if not self._waiters:
+                self._value += 1
+                return
+            notify = self._waiters.popleft()
+        notify()
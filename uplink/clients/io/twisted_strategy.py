@@ -3,6 +3,7 @@ import sys
 
 # Third-party imports
 from twisted.internet import reactor, defer, task
+from twisted.python import threadable
 
 # Local imports
 from uplink.clients.io import interfaces
@@ -47,3 +48,84 @@ class TwistedStrategy(interfaces.IOStrategy):
     def execute(self, executable):
         response = yield executable.execute()
         defer.returnValue(response)
+
+    @defer.inlineCallbacks
+    def call_with_permit(self, semaphore, func, args):
+        def withdraw(_):
+            # Give up the place in line, or the permit if it was granted
+            # while the notification was on its way to the reactor.
+            if not semaphore.cancel(notify):
+                semaphore.release()
+
+        granted = defer.Deferred(withdraw)
+
+        def grant():
+            if not granted.called:
+                granted.callback(None)
+
+        def notify():
+            # The permit may be released on another thread.
+            if threadable.isInIOThread():
+                grant()
+            else:
+                reactor.callFromThread(grant)
+
+        semaphore.acquire(notify)
+        yield granted
+        try:
+            response = yield func(*args)
+        finally:
+            semaphore.release()
+        defer.returnValue(response)
+
+    def hedge(self, func, args, delays):
+        calls, timers = [], []
+
+        def cancel(_=None):
+            for timer in timers:
+                if timer.active():
+                    timer.cancel()
+            # Cancelling a call removes it from the list.
+            for call in list(calls):
+                call.cancel()
+
+        result = defer.Deferred(cancel)
+
+        def on_success(value):
+            if not result.called:
+                # Cancel the losers before firing the result, since its
+                # callbacks may run for a while. The winner stays in the
+                # list, so the losers' failures are ignored.
+                cancel()
+                result.callback(value)
+
+        def on_failure(failure, call):
+            calls.remove(call)
+            if not (calls or result.called):
+                cancel()
+                result.errback(failure)
+
+        def start():
+            call = defer.maybeDeferred(func, *args)
+            calls.append(call)
+            # Cancelled losers fail quietly.
+            call.addCallbacks(on_success, on_failure, errbackArgs=(call,))
+
+        timers.extend(reactor.callLater(delay, start) for delay in delays)
+        start()
+        return result
+
+    @defer.inlineCallbacks
+    def map(self, func, calls, concurrency):
+        @defer.inlineCallbacks
+        def work():
+            for index, args in calls:
+                try:
+                    result = yield func(*args)
+                except Exception:
+                    calls.fail(index, *sys.exc_info())
+                else:
+                    calls.succeed(index, result)
+
+        yield defer.gatherResults([work() for _ in range(concurrency)])
+        defer.returnValue(calls.results())
@@ -13,6 +13,7 @@ def handler(func):
     """Registers :py:obj:`func` as a handler."""
     # TODO: support handler prioritization?
     _registrar[1].append(func)
+    return func
 
 
 def handle_client_key(key):
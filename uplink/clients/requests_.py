@@ -17,16 +17,23 @@ class RequestsClient(interfaces.HttpClientAdapter):
             that should handle sending requests. If this argument is
             omitted or set to :py:obj:`None`, a new session will be
             created.
+        executor (:py:class:`concurrent.futures.Executor`, optional):
+            An executor (e.g., a
+            :py:class:`concurrent.futures.ThreadPoolExecutor`) on which
+            to run requests. If this argument is set, requests return a
+            :py:class:`concurrent.futures.Future` of the response
+            instead of blocking.
     """
 
     exceptions = exceptions.Exceptions()
 
-    def __init__(self, session=None, **kwargs):
+    def __init__(self, session=None, executor=None, **kwargs):
         self.__auto_created_session = False
         if session is None:
             session = self._create_session(**kwargs)
             self.__auto_created_session = True
         self.__session = session
+        self.__executor = executor
 
     def __del__(self):
         if self.__auto_created_session:
@@ -52,9 +59,10 @@ class RequestsClient(interfaces.HttpClientAdapter):
     def apply_callback(self, callback, response):
         return callback(response)
 
-    @staticmethod
-    def io():
-        return io.BlockingStrategy()
+    def io(self):
+        if self.__executor is None:
+            return io.BlockingStrategy()
+        return io.FuturesStrategy(self.__executor)
 
 
 # === Register client exceptions === #
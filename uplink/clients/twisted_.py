@@ -1,16 +1,38 @@
 """
-This module defines an :py:class:`aiohttp.ClientSession` adapter that
-returns :py:class:`twisted.internet.defer.Deferred` responses.
+This module defines adapters for :py:mod:`twisted` that return
+:py:class:`twisted.internet.defer.Deferred` responses.
 """
+# Standard library imports
+import email.message
+import io as io_
 
 # Third party imports
+import requests
+
 try:
-    from twisted.internet import threads
+    from twisted.internet import defer, error, threads
+    from twisted.web import client, error as web_error, http_headers, iweb
 except ImportError:  # pragma: no cover
-    threads = None
+    threads = client = iweb = None
 
 # Local imports
-from uplink.clients import interfaces, io, register
+from uplink.clients import exceptions, interfaces, io, register
+
+# The request options that `TwistedAgentClient` sends as `requests`
+# would. The timeout is applied to the Deferred.
+_SUPPORTED_OPTIONS = frozenset(
+    ["headers", "files", "data", "json", "params", "auth", "cookies", "timeout"]
+)
+
+# The request options that the agent decides for itself, with the values
+# that match what the default agent does.
+_AGENT_OPTIONS = {
+    "allow_redirects": True,
+    "verify": True,
+    "cert": None,
+    "proxies": None,
+    "stream": False,
+}
 
 
 class TwistedClient(interfaces.HttpClientAdapter):
@@ -51,3 +73,234 @@ class TwistedClient(interfaces.HttpClientAdapter):
 
     def send(self, request):
         return threads.deferToThread(self._proxy.send, request)
+
+
+class TwistedAgentClient(interfaces.HttpClientAdapter):
+    """
+    Client that sends requests with a :py:class:`twisted.web.client.Agent`
+    and returns :py:class:`twisted.internet.defer.Deferred` responses.
+
+    Unlike :py:class:`TwistedClient`, this client performs I/O on the
+    reactor instead of on a thread pool. Requests are encoded the same
+    way as with :py:mod:`requests`, and the body of each response is
+    read before it's returned as a :py:class:`requests.Response`, so
+    response handlers and converters work as usual.
+
+    Redirects, TLS verification, and proxies are up to the agent, so
+    requests that set the ``allow_redirects``, ``verify``, ``cert``,
+    ``proxies``, or ``stream`` options to anything other than the
+    :py:mod:`requests` defaults fail with a :py:class:`ValueError`, as
+    do requests with any other option that this client doesn't know.
+
+    Note:
+        This client is an optional feature and requires the :py:mod:`twisted`
+        package. For example, here's how to install this extra using pip::
+
+            $ pip install uplink[twisted]
+
+    Args:
+        agent (:py:class:`twisted.web.iweb.IAgent`, optional): The agent
+            that should handle sending requests. If this argument is
+            omitted or set to :py:obj:`None`, a new agent that follows
+            redirects and reuses persistent connections will be created.
+        reactor (optional): The reactor that should run the requests.
+            Defaults to the global reactor.
+        pool (:py:class:`twisted.web.client.HTTPConnectionPool`, optional):
+            The connection pool of the new agent. Ignored if
+            :py:attr:`agent` is set.
+        connect_timeout (float, optional): The number of seconds to wait
+            for a connection before failing. Ignored if :py:attr:`agent`
+            is set.
+    """
+
+    exceptions = exceptions.Exceptions()
+
+    def __init__(
+        self, agent=None, reactor=None, pool=None, connect_timeout=None
+    ):
+        if client is None:
+            raise NotImplementedError("twisted is not installed.")
+        if reactor is None:
+            from twisted.internet import reactor
+        if agent is None:
+            if pool is None:
+                pool = client.HTTPConnectionPool(reactor)
+            agent = client.BrowserLikeRedirectAgent(
+                client.Agent(reactor, connectTimeout=connect_timeout, pool=pool)
+            )
+        self._agent = agent
+        self._reactor = reactor
+
+    @staticmethod
+    @register.handler
+    def with_agent(agent, *args, **kwargs):
+        """
+        Builds a client instance if the first argument is a
+        :py:class:`twisted.web.iweb.IAgent` provider. Otherwise, return
+        :py:obj:`None`.
+        """
+        if iweb is not None and iweb.IAgent.providedBy(agent):
+            return TwistedAgentClient(agent, *args, **kwargs)
+
+    @staticmethod
+    def io():
+        return io.TwistedStrategy()
+
+    @staticmethod
+    def _check_options(extras):
+        for name in extras:
+            if name in _SUPPORTED_OPTIONS:
+                continue
+            if name in _AGENT_OPTIONS and (
+                extras[name] == _AGENT_OPTIONS[name]
+                or (name == "proxies" and not extras[name])
+            ):
+                continue
+            raise ValueError(
+                "TwistedAgentClient doesn't support the request option "
+                "[%s=%r]: configure the agent instead." % (name, extras[name])
+            )
+
+    @classmethod
+    def _prepare(cls, request):
+        method, url, extras = request
+        cls._check_options(extras)
+        prepared = requests.Request(
+            method=method,
+            url=url,
+            headers=extras.get("headers"),
+            files=extras.get("files"),
+            data=extras.get("data"),
+            json=extras.get("json"),
+            params=extras.get("params"),
+            auth=extras.get("auth"),
+            cookies=extras.get("cookies"),
+        ).prepare()
+        headers = http_headers.Headers()
+        for name, value in prepared.headers.items():
+            # The agent frames the body itself.
+            if name.lower() not in ("content-length", "transfer-encoding"):
+                headers.addRawHeader(_to_bytes(name), _to_bytes(value))
+        body = prepared.body
+        if body is not None:
+            if hasattr(body, "read"):
+                body = body.read()
+            body = client.FileBodyProducer(io_.BytesIO(_to_bytes(body)))
+        return prepared, headers, body
+
+    def send(self, request):
+        prepared, headers, body = self._prepare(request)
+        deferred = self._agent.request(
+            _to_bytes(prepared.method), _to_bytes(prepared.url), headers, body
+        )
+        deferred.addCallback(_read_response, prepared)
+        timeout = request[2].get("timeout")
+        if timeout is not None:
+            # Covers reading the body, too.
+            deferred.addTimeout(
+                timeout, self._reactor, onTimeoutCancel=_raise_timeout_error
+            )
+        return deferred
+
+    def apply_callback(self, callback, response):
+        # The response body has already been read, so the callback
+        # can run on the reactor.
+        return callback(response)
+
+
+def _to_bytes(value):
+    if isinstance(value, bytes):
+        return value
+    return value.encode("utf-8")
+
+
+def _raise_timeout_error(result, timeout):
+    # The agent wraps the cancellation in its own errors, so the default
+    # translation into a timeout error doesn't apply.
+    raise defer.TimeoutError("Request timed out after %s seconds." % timeout)
+
+
+def _ignore_potential_data_loss(failure):
+    # The server didn't specify the length of the body, so the body
+    # read before the connection closed may be complete.
+    failure.trap(client.PartialDownloadError)
+    return failure.value.response
+
+
+def _read_response(response, prepared):
+    deferred = client.readBody(response)
+    deferred.addErrback(_ignore_potential_data_loss)
+    deferred.addCallback(_to_requests_response, prepared, response)
+    return deferred
+
+
+class _OriginalResponse(object):
+    # Exposes each raw header, including repeated ones, the way that
+    # `requests` expects when it extracts cookies from a response.
+
+    def __init__(self, headers):
+        self.msg = email.message.Message()
+        for name, values in headers.getAllRawHeaders():
+            for value in values:
+                self.msg[name.decode("latin-1")] = value.decode("latin-1")
+
+
+class _RawResponse(object):
+    def __init__(self, headers):
+        self._original_response = _OriginalResponse(headers)
+
+
+def _to_requests_response(content, prepared, response):
+    # Make the `twisted` response "quack" like a `requests` response.
+    new_response = requests.Response()
+    new_response.status_code = response.code
+    new_response.reason = response.phrase.decode("latin-1")
+    # Like `requests`, join repeated headers into one value. Cookies are
+    # extracted from each Set-Cookie header separately, since their
+    # values may contain commas.
+    new_response.headers = requests.structures.CaseInsensitiveDict(
+        (name.decode("latin-1"), b", ".join(values).decode("latin-1"))
+        for name, values in response.headers.getAllRawHeaders()
+    )
+    requests.cookies.extract_cookies_to_jar(
+        new_response.cookies, prepared, _RawResponse(response.headers)
+    )
+    new_response.encoding = requests.utils.get_encoding_from_headers(
+        new_response.headers
+    )
+    new_response._content = content
+    new_response.request = prepared
+    new_response.url = prepared.url
+    last_request = getattr(response, "request", None)
+    if last_request is not None:
+        # The agent may have followed redirects.
+        new_response.url = last_request.absoluteURI.decode("utf-8")
+    return new_response
+
+
+# === Register client exceptions === #
+if client is not None:  # pragma: no cover
+    TwistedAgentClient.exceptions.BaseClientException = (
+        requests.RequestException,
+        error.ConnectError,
+        error.DNSLookupError,
+        defer.TimeoutError,
+        client.ResponseFailed,
+        client.ResponseNeverReceived,
+        client.RequestTransmissionFailed,
+        web_error.SchemeNotSupported,
+    )
+    TwistedAgentClient.exceptions.ConnectionError = (
+        error.ConnectError,
+        error.DNSLookupError,
+    )
+    TwistedAgentClient.exceptions.ConnectionTimeout = (
+        error.TimeoutError,
+        error.TCPTimedOutError,
+    )
+    TwistedAgentClient.exceptions.ServerTimeout = defer.TimeoutError
+    TwistedAgentClient.exceptions.InvalidURL = (
+        requests.exceptions.InvalidURL,
+        requests.exceptions.MissingSchema,
+        web_error.SchemeNotSupported,
+    )
@@ -0,0 +1,203 @@
+"""
+This module implements single-flight coalescing of identical requests.
+"""
+# Standard library imports
+import inspect
+import sys
+import threading
+
+# Local imports
+from uplink import compat, decorators
+from uplink.clients import interfaces
+
+__all__ = ["coalesce"]
+
+
+def _freeze(value):
+    # Converts the request's data into a hashable key.
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    hash(value)  # Raises TypeError if the value can't be part of a key
+    return value
+
+
+class _Flight(object):
+    """A request in flight, whose outcome is shared by all its callers."""
+
+    def __init__(self):
+        self._done = threading.Event()
+        self._result = None
+        self._exc_info = None
+        self._waiters = []
+        self.shared = None
+
+    def resolve(self, result=None, exc_info=None):
+        self._result, self._exc_info = result, exc_info
+        self._done.set()
+
+    def wait(self):
+        """Blocks until the leader's request finishes."""
+        self._done.wait()
+        if self._exc_info is not None:
+            compat.reraise(*self._exc_info)
+        return self._result
+
+    def add_waiter(self, deferred):
+        self._waiters.append(deferred)
+        return deferred
+
+    def notify_waiters(self, result):
+        # Fires the deferred responses of the followers.
+        waiters, self._waiters = self._waiters, []
+        for deferred in waiters:
+            if self._exc_info is not None:
+                deferred.errback(result)
+            else:
+                deferred.callback(result)
+        return result
+
+
+class CoalescingClient(interfaces.HttpClientProxy):
+    """
+    Wraps a client to send identical requests that are in flight at the
+    same time only once, sharing the outcome with every caller.
+
+    Supports blocking clients (callers wait on the thread sending the
+    request), clients that return awaitables (callers await the same
+    future), and clients that return Twisted deferreds.
+    """
+
+    def __init__(self, proxy, flights, lock):
+        super(CoalescingClient, self).__init__(proxy)
+        self._flights = flights
+        self._lock = lock
+
+    def _get_key(self, request):
+        method, url, extras = request
+        try:
+            return self._proxy, method, url, _freeze(extras)
+        except TypeError:
+            return None
+
+    def send(self, request):
+        key = self._get_key(request)
+        if key is None:
+            return self._proxy.send(request)
+        with self._lock:
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = self._flights[key] = _Flight()
+        if is_leader:
+            return self._lead(key, flight, request)
+        return self._follow(flight)
+
+    def _land(self, key, flight):
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    def _lead(self, key, flight, request):
+        try:
+            result = self._proxy.send(request)
+        except BaseException:
+            self._land(key, flight)
+            flight.resolve(exc_info=sys.exc_info())
+            raise
+        # Check for deferreds first, since they're awaitable too.
+        if hasattr(result, "addBoth"):
+            return self._lead_twisted(key, flight, result)
+        if inspect.isawaitable(result):
+            return self._lead_asyncio(key, flight, result)
+        self._land(key, flight)
+        flight.resolve(result)
+        return result
+
+    def _lead_asyncio(self, key, flight, awaitable):
+        import asyncio
+
+        future = asyncio.ensure_future(awaitable)
+        future.add_done_callback(lambda _: self._land(key, flight))
+        flight.shared = future
+        flight.resolve(future)
+        # Cancelling one caller shouldn't cancel the others.
+        return asyncio.shield(future)
+
+    def _lead_twisted(self, key, flight, deferred):
+        def land(result):
+            self._land(key, flight)
+            if hasattr(result, "raiseException"):  # A failure
+                flight.resolve(exc_info=(result.type, result.value, None))
+            else:
+                flight.resolve(result)
+            return flight.notify_waiters(result)
+
+        flight.shared = deferred
+        return deferred.addBoth(land)
+
+    @staticmethod
+    def _follow(flight):
+        shared = flight.shared
+        if shared is None:
+            # The leader is sending the request on another thread.
+            result = flight.wait()
+            if inspect.isawaitable(result):
+                import asyncio
+
+                return asyncio.shield(result)
+            return result
+        if hasattr(shared, "addBoth"):
+            return flight.add_waiter(type(shared)())
+        import asyncio
+
+        return asyncio.shield(shared)
+
+
+# noinspection PyPep8Naming
+class coalesce(decorators.MethodAnnotation):
+    """
+    A decorator that sends identical requests that are in flight at the
+    same time only once, sharing the response (or error) with every
+    caller.
+
+    Requests are identical when they have the same method, URL, query
+    parameters, headers, and body, and are sent by the same client.
+    Coalescing only applies to requests in flight: once the response
+    arrives, the next identical request is sent anew.
+
+    This decorator only applies to safe HTTP methods (i.e., ``GET``,
+    ``HEAD`` and ``OPTIONS``). It works with blocking clients, where
+    callers on other threads wait for the response, and with
+    :py:class:`~uplink.AiohttpClient` and
+    :py:class:`~uplink.TwistedClient`.
+
+    Note:
+        Callers share the same response object, so response handlers
+        shouldn't modify it.
+
+    Example:
+        .. code-block:: python
+
+            @coalesce
+            @get("users/{username}")
+            def get_user(self, username):
+                \"""Get a single user.\"""
+
+    To coalesce the requests of all methods of a consumer, decorate the
+    class with ``@coalesce()``.
+    """
+
+    _can_be_static = True
+    _http_method_whitelist = {"GET", "HEAD", "OPTIONS"}
+
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def modify_request(self, request_builder):
+        if self.supports_http_method(request_builder.method):
+            request_builder.client = CoalescingClient(
+                request_builder.client, self._flights, self._lock
+            )
@@ -262,10 +262,18 @@ class RequestDefinition(interfaces.RequestDefinition):
     ):
         self._method = method
         self._uri = uri
+        self._uri_template = None
         self._return_type = return_type
         self._argument_handler = argument_handler
         self._method_handler = method_handler
 
+    @property
+    def _template(self):
+        # Parse the URI template once, on first use.
+        if self._uri_template is None:
+            self._uri_template = utils.URITemplate(self._uri)
+        return self._uri_template
+
     @property
     def argument_annotations(self):
         return tuple(self._argument_handler.annotations)
@@ -275,11 +283,11 @@ class RequestDefinition(interfaces.RequestDefinition):
         return tuple(self._method_handler.annotations)
 
     def make_converter_registry(self, converters_):
-        return converters.ConverterFactoryRegistry(converters_, self)
+        return converters.CachedConverterFactoryRegistry(converters_, self)
 
     def define_request(self, request_builder, func_args, func_kwargs):
         request_builder.method = self._method
-        request_builder.relative_url = self._uri
+        request_builder.relative_url = self._template
         request_builder.return_type = self._return_type
         self._argument_handler.handle_call(
             request_builder, func_args, func_kwargs
@@ -1,6 +1,7 @@
 # Third-party imports
 import six
 
-__all__ = ["reraise"]
+__all__ = ["izip", "reraise"]
 
+izip = six.moves.zip
 reraise = six.reraise
@@ -0,0 +1,139 @@
+# Standard library imports
+import threading
+
+# Local imports
+from uplink import decorators, utils
+from uplink.clients import interfaces, io
+from uplink.ratelimit import ratelimit
+
+__all__ = ["concurrency_limit", "ConcurrencyLimitExceeded"]
+
+
+class ConcurrencyLimitExceeded(RuntimeError):
+    """A request failed because too many requests were in flight."""
+
+    def __init__(self, max_in_flight):
+        super(ConcurrencyLimitExceeded, self).__init__(
+            "Exceeded concurrency limit of [%s] requests in flight."
+            % max_in_flight
+        )
+
+
+class _HeldPermit(object):
+    # Stands in for a semaphore whose permit was already taken, so that
+    # the I/O strategy only has to return it once the request is done.
+
+    def __init__(self, semaphore):
+        self._semaphore = semaphore
+
+    @staticmethod
+    def acquire(notify):
+        notify()
+
+    @staticmethod
+    def cancel(notify):
+        return False
+
+    def release(self):
+        self._semaphore.release()
+
+
+class ConcurrencyLimitedClient(interfaces.HttpClientProxy):
+    """
+    Wraps a client to send each request only while holding a permit
+    from the given semaphore.
+    """
+
+    def __init__(self, proxy, semaphore, create_limit_reached_exception):
+        super(ConcurrencyLimitedClient, self).__init__(proxy)
+        self._semaphore = semaphore
+        self._create_limit_reached_exception = create_limit_reached_exception
+
+    def send(self, request):
+        semaphore = self._semaphore
+        if self._create_limit_reached_exception is not None:
+            # Take the permit up front, so that concurrent requests
+            # can't all see a free slot and then wait in line for it.
+            if not semaphore.try_acquire():
+                raise self._create_limit_reached_exception()
+            semaphore = _HeldPermit(semaphore)
+        return self._proxy.io().call_with_permit(
+            semaphore, self._proxy.send, (request,)
+        )
+
+
+# noinspection PyPep8Naming
+class concurrency_limit(decorators.MethodAnnotation):
+    """
+    A decorator that constrains a consumer method or an entire
+    consumer to a maximum number of requests in flight at once (i.e.,
+    a bulkhead).
+
+    Note:
+        The limit is enforced separately for each host-port
+        combination. Logically, requests are grouped by host and port,
+        and the number of requests in flight is capped separately for
+        each group.
+
+    A request holds its slot only while it is being sent: the slot is
+    released once the response arrives or the request fails, so a
+    request that is waiting to be retried doesn't hold a slot.
+
+    By default, when the limit is reached, the client waits for a slot
+    to free up, and waiting requests are sent in the order they
+    arrived. If you'd prefer the client to raise an exception instead,
+    set the ``raise_on_limit`` argument.
+
+    Args:
+        max_in_flight (int): The maximum number of requests that can be
+            in flight at once.
+        raise_on_limit (:class:`Exception` or bool, optional): Either an
+            exception to raise when the client exceeds the limit or a
+            :class:`bool`. If :obj:`True`, a
+            :class:`~uplink.concurrency_limit.ConcurrencyLimitExceeded`
+            exception is raised.
+        group_by (callable, optional): A function that maps the base
+            URL to the group whose requests share the limit. If
+            :obj:`None`, all requests share the same limit.
+    """
+
+    BY_HOST_AND_PORT = ratelimit.BY_HOST_AND_PORT
+
+    def __init__(
+        self, max_in_flight=10, raise_on_limit=False, group_by=BY_HOST_AND_PORT
+    ):
+        self._max_in_flight = max(1, int(max_in_flight))
+        self._semaphores = {}
+        self._lock = threading.Lock()
+        self._group_by = utils.no_op if group_by is None else group_by
+
+        if utils.is_subclass(raise_on_limit, Exception) or isinstance(
+            raise_on_limit, Exception
+        ):
+            self._create_limit_reached_exception = raise_on_limit
+        elif raise_on_limit:
+            self._create_limit_reached_exception = (
+                self._create_concurrency_limit_exceeded
+            )
+        else:
+            self._create_limit_reached_exception = None
+
+    def _get_semaphore_for_request(self, request_builder):
+        key = self._group_by(request_builder.base_url)
+        with self._lock:
+            try:
+                return self._semaphores[key]
+            except KeyError:
+                semaphore = io.Semaphore(self._max_in_flight)
+                return self._semaphores.setdefault(key, semaphore)
+
+    def modify_request(self, request_builder):
+        semaphore = self._get_semaphore_for_request(request_builder)
+        request_builder.client = ConcurrencyLimitedClient(
+            request_builder.client,
+            semaphore,
+            self._create_limit_reached_exception,
+        )
+
+    def _create_concurrency_limit_exceeded(self):
+        return ConcurrencyLimitExceeded(self._max_in_flight)
@@ -157,6 +157,63 @@ class ConverterFactoryRegistry(abc.Mapping):
         return wrapper
 
 
+class _MemoizedConverterFactory(object):
+    def __init__(self, converter_factory):
+        self._converter_factory = converter_factory
+        self._converters = {}
+
+    def __call__(self, *args, **kwargs):
+        try:
+            key = (args, frozenset(kwargs.items()))
+            return self._converters[key]
+        except TypeError:
+            # The type can't be used as a cache key (e.g., an instance
+            # of an unhashable class), so skip the cache.
+            return self._converter_factory(*args, **kwargs)
+        except KeyError:
+            converter = self._converter_factory(*args, **kwargs)
+            return self._converters.setdefault(key, converter)
+
+
+class CachedConverterFactoryRegistry(ConverterFactoryRegistry):
+    """
+    A :py:class:`ConverterFactoryRegistry` that resolves the converter
+    for a specific key and type only once.
+
+    Traversing the chain of converter factories is repeated work when
+    the factories, the request definition, and the requested type are
+    the same as the last time. Hence, this registry remembers the
+    converter returned for each combination of converter key and
+    arguments, so subsequent queries skip the chain entirely.
+
+    Args:
+        factories: An iterable of converter factories. Factories that
+            appear earlier in the chain are given the opportunity to
+            handle a request before those that appear later.
+    """
+
+    def __init__(self, factories=(), *args, **kwargs):
+        super(CachedConverterFactoryRegistry, self).__init__(
+            factories, *args, **kwargs
+        )
+        self._cache = {}
+
+    def __getitem__(self, converter_key):
+        try:
+            return self._cache[converter_key]
+        except TypeError:
+            return super(CachedConverterFactoryRegistry, self).__getitem__(
+                converter_key
+            )
+        except KeyError:
+            factory = super(CachedConverterFactoryRegistry, self).__getitem__(
+                converter_key
+            )
+            return self._cache.setdefault(
+                converter_key, _MemoizedConverterFactory(factory)
+            )
+
+
 @ConverterFactoryRegistry.register(keys.CONVERT_TO_REQUEST_BODY)
 def create_request_body_converter(factory):
     return factory.create_request_body_converter
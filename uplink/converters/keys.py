@@ -42,6 +42,9 @@ class CompositeKey(object):
             return other._converter_key == self._converter_key
         return False
 
+    def __hash__(self):
+        return hash((type(self), self._converter_key))
+
     def convert(self, converter, value):  # pragma: no cover
         raise NotImplementedError
 
@@ -99,6 +102,9 @@ class Identity(object):
     def __eq__(self, other):
         return type(other) is type(self)
 
+    def __hash__(self):
+        return hash(type(self))
+
     def _identity_factory(self, *args, **kwargs):
         return self._identity
 
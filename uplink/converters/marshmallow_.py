@@ -32,13 +32,16 @@ class MarshmallowConverter(interfaces.Factory):
             $ pip install uplink[marshmallow]
     """
 
-    try:
-        import marshmallow
-    except ImportError:  # pragma: no cover
-        marshmallow = None
-        is_marshmallow_3 = None
-    else:
-        is_marshmallow_3 = marshmallow.__version__ >= "3.0"
+    # Avoid importing marshmallow until a converter is actually needed.
+    marshmallow = utils.LazyModule("marshmallow")
+
+    class _IsMarshmallow3(object):
+        def __get__(self, instance, owner):
+            if owner.marshmallow is None:  # pragma: no cover
+                return None
+            return owner.marshmallow.__version__ >= "3.0"
+
+    is_marshmallow_3 = _IsMarshmallow3()
 
     def __init__(self):
         if self.marshmallow is None:
@@ -68,6 +71,11 @@ class MarshmallowConverter(interfaces.Factory):
 
     @classmethod
     def _get_schema(cls, type_):
+        if not utils.is_imported("marshmallow"):
+            # The type can't be a schema if marshmallow isn't loaded.
+            raise ValueError(
+                "Expected marshmallow.Scheme subclass or instance."
+            )
         if utils.is_subclass(type_, cls.marshmallow.Schema):
             return type_()
         elif isinstance(type_, cls.marshmallow.Schema):
@@ -5,7 +5,7 @@ to deserialize and serialize values.
 
 from uplink.converters import register_default_converter_factory
 from uplink.converters.interfaces import Factory, Converter
-from uplink.utils import is_subclass
+from uplink.utils import LazyModule, is_imported, is_subclass
 
 
 def _encode_pydantic(obj):
@@ -73,10 +73,8 @@ class PydanticConverter(Factory):
             $ pip install uplink[pydantic]
     """
 
-    try:
-        import pydantic
-    except ImportError:  # pragma: no cover
-        pydantic = None
+    # Avoid importing pydantic until a converter is actually needed.
+    pydantic = LazyModule("pydantic")
 
     def __init__(self):
         """
@@ -86,6 +84,9 @@ class PydanticConverter(Factory):
             raise ImportError("No module named 'pydantic'")
 
     def _get_model(self, type_):
+        if not is_imported("pydantic"):
+            # The type can't be a model if pydantic isn't loaded.
+            raise ValueError("Expected pydantic.BaseModel subclass or instance")
         if is_subclass(type_, self.pydantic.BaseModel):
             return type_
         raise ValueError("Expected pydantic.BaseModel subclass or instance")
@@ -0,0 +1,183 @@
+"""
+This module implements end-to-end deadlines, which bound the total time
+of a consumer method call across all of its attempts.
+"""
+# Standard library imports
+import numbers
+
+# Local imports
+from uplink import decorators
+from uplink.clients import interfaces
+from uplink.clients.io import RequestTemplate, transitions
+from uplink.clients.io.execution import IOStrategyDecorator
+from uplink.ratelimit import now
+
+__all__ = ["deadline", "DeadlineExceeded"]
+
+
+class DeadlineExceeded(RuntimeError):
+    """
+    A consumer method call failed because it didn't finish before its
+    deadline.
+    """
+
+    def __init__(self, seconds):
+        super(DeadlineExceeded, self).__init__(
+            "Deadline of [%s] seconds exceeded." % seconds
+        )
+        self.seconds = seconds
+
+
+class Countdown(object):
+    """Tracks the time left until a deadline."""
+
+    def __init__(self, seconds, clock=now):
+        self._seconds = seconds
+        self._clock = clock
+        self._expires_at = clock() + seconds
+
+    def remaining(self):
+        return self._expires_at - self._clock()
+
+    def expired(self):
+        return self.remaining() <= 0
+
+    def error(self):
+        return DeadlineExceeded(self._seconds)
+
+
+def _shrink_timeout(timeout, remaining):
+    # Clients accept either a single timeout or a (connect, read) pair.
+    if timeout is None:
+        return remaining
+    if isinstance(timeout, numbers.Number):
+        return min(timeout, remaining)
+    if isinstance(timeout, tuple):
+        return tuple(_shrink_timeout(t, remaining) for t in timeout)
+    if hasattr(timeout, "__attrs_attrs__") and hasattr(timeout, "total"):
+        # An `aiohttp.ClientTimeout`, which is a frozen attrs class.
+        import attr
+
+        return attr.evolve(
+            timeout, total=_shrink_timeout(timeout.total, remaining)
+        )
+    return timeout
+
+
+def _raise(error):
+    raise error
+
+
+class DeadlineStrategy(IOStrategyDecorator):
+    """Fails instead of sleeping past the deadline."""
+
+    def __init__(self, io, countdown):
+        super(DeadlineStrategy, self).__init__(io)
+        self._countdown = countdown
+
+    def sleep(self, duration, callback):
+        if duration >= self._countdown.remaining():
+            return self._io.invoke(
+                _raise, (self._countdown.error(),), {}, callback
+            )
+        return self._io.sleep(duration, callback)
+
+
+class DeadlineClient(interfaces.HttpClientProxy):
+    """
+    Wraps a client to cap the timeout of each request to the time left
+    until the deadline.
+    """
+
+    def __init__(self, proxy, countdown):
+        super(DeadlineClient, self).__init__(proxy)
+        self._countdown = countdown
+
+    def io(self):
+        return DeadlineStrategy(self._proxy.io(), self._countdown)
+
+    def send(self, request):
+        remaining = self._countdown.remaining()
+        if remaining <= 0:
+            raise self._countdown.error()
+        method, url, extras = request
+        # Copy the extras, since every attempt of the call shares them.
+        extras = dict(extras)
+        extras["timeout"] = _shrink_timeout(extras.get("timeout"), remaining)
+        return self._proxy.send((method, url, extras))
+
+
+class DeadlineTemplate(RequestTemplate):
+    def __init__(self, countdown):
+        self._countdown = countdown
+
+    def _fail(self):
+        error = self._countdown.error()
+        return transitions.fail(type(error), error, None)
+
+    def before_request(self, request):
+        if self._countdown.expired():
+            return self._fail()
+        return  # Fallback to default behavior
+
+    def after_exception(self, request, exc_type, exc_val, exc_tb):
+        if isinstance(exc_val, DeadlineExceeded):
+            return transitions.fail(exc_type, exc_val, exc_tb)
+        if self._countdown.expired():
+            # The request most likely timed out because its timeout was
+            # capped to the deadline.
+            return self._fail()
+        return  # Fallback to default behavior
+
+
+def apply_deadline(request_builder, seconds, clock=now):
+    """Bounds the request's execution by a deadline, starting now."""
+    countdown = Countdown(seconds, clock)
+    request_builder.client = DeadlineClient(request_builder.client, countdown)
+    # Consulted first, so that other templates (e.g., retry) can't
+    # retry once the deadline is exceeded.
+    request_builder.add_request_template(
+        DeadlineTemplate(countdown), first=True
+    )
+
+
+# noinspection PyPep8Naming
+class deadline(decorators.MethodAnnotation):
+    """
+    A decorator that bounds the total time of a consumer method call,
+    across all of its attempts.
+
+    Unlike :class:`~uplink.timeout`, which applies to each request on
+    its own, a deadline covers the entire call, including retries and
+    the time spent waiting between them (e.g., for
+    :class:`~uplink.retry` backoff or :class:`~uplink.ratelimit`). The
+    timeout of each request is capped to the time left until the
+    deadline, and a wait that would end past the deadline isn't started.
+    For :class:`aiohttp.ClientTimeout` timeouts, the ``total`` timeout
+    is capped. Other kinds of timeouts are passed to the client as is.
+    Once the deadline is exceeded, the call fails with a
+    :class:`~uplink.deadline.DeadlineExceeded` exception.
+
+    Example:
+        .. code-block:: python
+
+            @deadline(10)
+            @retry(stop=retry.stop.after_attempt(5))
+            @get("users/{username}")
+            def get_user(self, username):
+                \"""Get a single user.\"""
+
+    To set the deadline at runtime, use the
+    :class:`~uplink.Deadline` argument annotation instead.
+
+    Args:
+        seconds (float): The number of seconds that the call has to
+            finish, starting when the consumer method is invoked.
+    """
+
+    def __init__(self, seconds, clock=now):
+        self._seconds = seconds
+        self._clock = clock
+
+    def modify_request(self, request_builder):
+        apply_deadline(request_builder, self._seconds, self._clock)
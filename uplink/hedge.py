@@ -0,0 +1,166 @@
+"""
+This module implements hedged requests, which reduce tail latency by
+sending a duplicate request when a response is slow to arrive.
+"""
+# Standard library imports
+import collections
+import copy
+import inspect
+import math
+import threading
+
+# Local imports
+from uplink import decorators
+from uplink.clients import interfaces
+from uplink.ratelimit import now
+
+__all__ = ["hedge"]
+
+
+class LatencyTracker(object):
+    """
+    Tracks the latencies of recent requests.
+
+    Args:
+        size (int): The number of recent latencies to keep.
+        min_samples (int): The number of latencies needed before
+            estimating a percentile.
+    """
+
+    def __init__(self, size=100, min_samples=10):
+        self._latencies = collections.deque(maxlen=size)
+        self._min_samples = min_samples
+        self._lock = threading.Lock()
+
+    def add(self, latency):
+        with self._lock:
+            self._latencies.append(latency)
+
+    def percentile(self, percent):
+        """
+        Returns the given percentile of the recent latencies, or
+        :obj:`None` if there aren't enough of them yet.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if len(latencies) < self._min_samples:
+            return None
+        index = int(math.ceil(percent / 100.0 * len(latencies))) - 1
+        return latencies[max(0, index)]
+
+
+class HedgingClient(interfaces.HttpClientProxy):
+    """
+    Wraps a client to send a duplicate of a request whenever its
+    response takes longer than the given delay, returning whichever
+    response arrives first.
+    """
+
+    def __init__(self, proxy, delays, latencies):
+        super(HedgingClient, self).__init__(proxy)
+        self._delays = delays
+        self._latencies = latencies
+
+    def _send(self, request):
+        # Records the latency of each request that succeeds.
+        start = now()
+
+        def record(result):
+            self._latencies.add(now() - start)
+            return result
+
+        result = self._proxy.send(request)
+        # Check for deferreds first, since they're awaitable too.
+        if hasattr(result, "addCallback"):
+            return result.addCallback(record)
+        if inspect.isawaitable(result):
+            import asyncio
+
+            def on_done(future_):
+                if not (future_.cancelled() or future_.exception()):
+                    record(None)
+
+            future = asyncio.ensure_future(result)
+            future.add_done_callback(on_done)
+            return future
+        return record(result)
+
+    def send(self, request):
+        if not self._delays:
+            return self._send(request)
+        return self._proxy.io().hedge(self._send, (request,), self._delays)
+
+
+# noinspection PyPep8Naming
+class hedge(decorators.MethodAnnotation):
+    """
+    A decorator that sends a duplicate request when a response is slow
+    to arrive, returning whichever response arrives first (i.e., a
+    hedged request).
+
+    Against a replicated backend, a few slow replicas can dominate the
+    tail latency of a client's requests. Hedging sends a slow request
+    again, likely to another replica, in exchange for a small amount of
+    extra load. Requests that are still in flight once a response
+    arrives are cancelled, if the client supports it (e.g.,
+    :py:class:`~uplink.AiohttpClient`); otherwise, their responses are
+    discarded.
+
+    This decorator only applies to idempotent HTTP methods (i.e.,
+    ``GET``, ``HEAD`` and ``OPTIONS``). With a blocking client (e.g.,
+    :py:class:`~uplink.RequestsClient`), each request is sent on its own
+    thread.
+
+    By default, a duplicate is sent once the request has taken longer
+    than 95% of the method's recent requests. When decorating a consumer
+    class, the latencies of each method are tracked separately.
+
+    Example:
+        .. code-block:: python
+
+            @hedge(after=0.05)
+            @get("users/{username}")
+            def get_user(self, username):
+                \"""Get a single user.\"""
+
+    Args:
+        after (float, optional): The number of seconds to wait for a
+            response before sending a duplicate. If :obj:`None`, waits
+            for the ``percentile`` of the method's recent latencies.
+            Until enough requests have completed to estimate it,
+            requests aren't hedged.
+        max_extra (int, optional): The maximum number of duplicates to
+            send for each request. Each is sent after waiting again.
+        percentile (float, optional): The percentile of recent
+            latencies to wait for, when ``after`` is :obj:`None`.
+    """
+
+    _can_be_static = True
+    _http_method_whitelist = {"GET", "HEAD", "OPTIONS"}
+
+    def __init__(self, after=None, max_extra=1, percentile=95):
+        self._after = after
+        self._max_extra = max(0, int(max_extra))
+        self._percentile = percentile
+        self._latencies = LatencyTracker()
+
+    def _modify_request_definition(self, builder, kwargs):
+        # Track the latencies of each method separately, even when
+        # decorating a consumer class.
+        method_hedge = copy.copy(self)
+        method_hedge._latencies = LatencyTracker()
+        super(hedge, method_hedge)._modify_request_definition(builder, kwargs)
+
+    def _get_delays(self):
+        after = self._after
+        if after is None:
+            after = self._latencies.percentile(self._percentile)
+            if after is None:
+                return ()
+        return tuple(after * n for n in range(1, self._max_extra + 1))
+
+    def modify_request(self, request_builder):
+        if self.supports_http_method(request_builder.method):
+            request_builder.client = HedgingClient(
+                request_builder.client, self._get_delays(), self._latencies
+            )
@@ -37,12 +37,16 @@ def set_api_definition(service, name, definition):
 
 
 class RequestBuilder(object):
-    def __init__(self, client, converter_registry, base_url):
+    def __init__(self, client, converter_registry, base_url, url_joiner=None):
         self._method = None
-        self._relative_url_template = utils.URIBuilder("")
+        self._relative_url_template = utils.URITemplate("")
+        self._url_variables = {}
         self._return_type = None
         self._client = client
         self._base_url = base_url
+        if url_joiner is None:
+            url_joiner = utils.URLJoiner(base_url)
+        self._join_url = url_joiner
 
         # TODO: Pass this in as constructor parameter
         # TODO: Delegate instantiations to uplink.HTTPClientAdapter
@@ -57,6 +61,10 @@ class RequestBuilder(object):
     def client(self):
         return self._client
 
+    @client.setter
+    def client(self, client):
+        self._client = client
+
     @property
     def method(self):
         return self._method
@@ -70,15 +78,20 @@ class RequestBuilder(object):
         return self._base_url
 
     def set_url_variable(self, variables):
-        self._relative_url_template.set_variable(variables)
+        # Like a partial expansion, the first value set for a variable
+        # wins.
+        for name in variables:
+            self._url_variables.setdefault(name, variables[name])
 
     @property
     def relative_url(self):
-        return self._relative_url_template.build()
+        return self._relative_url_template.expand(self._url_variables)
 
     @relative_url.setter
     def relative_url(self, url):
-        self._relative_url_template = utils.URIBuilder(url)
+        if not isinstance(url, utils.URITemplate):
+            url = utils.URITemplate(url)
+        self._relative_url_template = url
 
     @property
     def info(self):
@@ -103,16 +116,25 @@ class RequestBuilder(object):
     def return_type(self, return_type):
         self._return_type = return_type
 
+    @property
+    def request_templates(self):
+        return tuple(self._request_templates)
+
     @property
     def request_template(self):
         return io.CompositeRequestTemplate(self._request_templates)
 
     @property
     def url(self):
-        return utils.urlparse.urljoin(self.base_url, self.relative_url)
+        return self._join_url(self.relative_url)
 
     def add_transaction_hook(self, hook):
         self._transaction_hooks.append(hook)
 
-    def add_request_template(self, template):
-        self._request_templates.append(template)
+    def add_request_template(self, template, first=False):
+        if first:
+            # Consulted before the other templates, so they can't
+            # override its transitions.
+            self._request_templates.insert(0, template)
+        else:
+            self._request_templates.append(template)
@@ -0,0 +1,216 @@
+"""
+This module provides opt-in instrumentation that records how long each
+phase of a consumer method call takes.
+"""
+# Standard library imports
+import contextlib
+import time
+
+# Local imports
+from uplink.clients.io import interfaces
+from uplink.clients.io.execution import IOStrategyDecorator
+
+__all__ = ["CallTimings"]
+
+# Use a high-resolution clock if available, otherwise fall back to the
+# system clock.
+now = getattr(time, "perf_counter", time.time)
+
+ARGUMENTS = "arguments"
+AUTH = "auth"
+TEMPLATES = "templates"
+SEND = "send"
+SLEEP = "sleep"
+CONVERTERS = "converters"
+HANDLERS = "handlers"
+
+PHASES = (ARGUMENTS, AUTH, TEMPLATES, SEND, SLEEP, CONVERTERS, HANDLERS)
+
+
+class CallTimings(object):
+    """
+    A record of the wall time spent in each phase of a single consumer
+    method call.
+
+    The phases are:
+
+    - ``arguments``: handling the method's arguments and building the
+      request (e.g., request body converters).
+    - ``auth``: applying the consumer's authentication.
+    - ``templates``: request templates, such as
+      :class:`~uplink.retry` and :class:`~uplink.ratelimit`, deciding
+      what to do next.
+    - ``send``: the HTTP client sending the request.
+    - ``sleep``: pauses requested by templates (e.g., retry backoffs).
+    - ``converters``: converting the response into the method's return
+      type (e.g., :class:`~uplink.returns.json`).
+    - ``handlers``: response and error handlers, excluding converters.
+
+    Phases are exclusive of each other: e.g., time spent converting the
+    response while running response handlers only counts towards
+    ``converters``.
+    """
+
+    def __init__(self, clock=now):
+        self._clock = clock
+        self._phases = dict.fromkeys(PHASES, 0.0)
+        self._stack = []
+        self._started = self._mark = clock()
+        self._total = None
+        self._method = self._url = None
+        self._exception = None
+
+    def _switch(self):
+        current = self._clock()
+        if self._stack:
+            self._phases[self._stack[-1]] += current - self._mark
+        self._mark = current
+
+    def enter(self, phase):
+        """Starts timing the given phase, pausing the current one."""
+        self._switch()
+        self._stack.append(phase)
+
+    def exit(self):
+        """Stops timing the current phase, resuming the previous one."""
+        self._switch()
+        self._stack.pop()
+
+    @contextlib.contextmanager
+    def phase(self, phase):
+        self.enter(phase)
+        try:
+            yield
+        finally:
+            self.exit()
+
+    def timed(self, phase, func):
+        """Wraps the given function to time its calls as a phase."""
+
+        def wrapper(*args, **kwargs):
+            with self.phase(phase):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def set_request(self, method, url):
+        self._method, self._url = method, url
+
+    def finish(self, exception=None):
+        self._total = self._clock() - self._started
+        self._exception = exception
+
+    @property
+    def method(self):
+        """The HTTP method of the request."""
+        return self._method
+
+    @property
+    def url(self):
+        """The URL of the request."""
+        return self._url
+
+    @property
+    def phases(self):
+        """A dictionary mapping each phase to its duration in seconds."""
+        return dict(self._phases)
+
+    @property
+    def total(self):
+        """The total duration of the call in seconds."""
+        return self._total
+
+    @property
+    def exception(self):
+        """The exception that failed the call, if any."""
+        return self._exception
+
+    def __repr__(self):
+        phases = ", ".join(
+            "%s=%.6f" % (name, self._phases[name]) for name in PHASES
+        )
+        return "%s(%s %s, total=%s, %s)" % (
+            type(self).__name__,
+            self._method,
+            self._url,
+            self._total,
+            phases,
+        )
+
+
+class _TimedCallback(interfaces.InvokeCallback, interfaces.SleepCallback):
+    def __init__(self, callback, timings):
+        self._callback = callback
+        self._timings = timings
+
+    def on_success(self, *result):
+        self._timings.exit()
+        return self._callback.on_success(*result)
+
+    def on_failure(self, exc_type, exc_val, exc_tb):
+        self._timings.exit()
+        return self._callback.on_failure(exc_type, exc_val, exc_tb)
+
+
+class TimingStrategy(IOStrategyDecorator):
+    """
+    Times the invocations that pass through the decorated I/O strategy:
+    i.e., sending requests, sleeping, and response and error handlers.
+    """
+
+    def __init__(self, io, client, timings):
+        super(TimingStrategy, self).__init__(io)
+        self._client = client
+        self._timings = timings
+
+    def invoke(self, func, args, kwargs, callback):
+        phase = SEND if func == self._client.send else HANDLERS
+        self._timings.enter(phase)
+        return self._io.invoke(
+            func, args, kwargs, _TimedCallback(callback, self._timings)
+        )
+
+    def sleep(self, duration, callback):
+        self._timings.enter(SLEEP)
+        return self._io.sleep(duration, _TimedCallback(callback, self._timings))
+
+
+class TimedRequestTemplate(interfaces.RequestTemplate):
+    """Times the transitions chosen by the decorated request template."""
+
+    def __init__(self, template, timings):
+        self._template = template
+        self._timings = timings
+
+    def before_request(self, request):
+        with self._timings.phase(TEMPLATES):
+            return self._template.before_request(request)
+
+    def after_response(self, request, response):
+        with self._timings.phase(TEMPLATES):
+            return self._template.after_response(request, response)
+
+    def after_exception(self, request, exc_type, exc_val, exc_tb):
+        with self._timings.phase(TEMPLATES):
+            return self._template.after_exception(
+                request, exc_type, exc_val, exc_tb
+            )
+
+
+class EmittingCallback(interfaces.InvokeCallback):
+    """Sends the timings to the sink once the call finishes."""
+
+    def __init__(self, io, timings, sink):
+        self._io = io
+        self._timings = timings
+        self._sink = sink
+
+    def on_success(self, result):
+        self._timings.finish()
+        self._sink(self._timings)
+        return self._io.finish(result)
+
+    def on_failure(self, exc_type, exc_val, exc_tb):
+        self._timings.finish(exc_val)
+        self._sink(self._timings)
+        return self._io.fail(exc_type, exc_val, exc_tb)
@@ -138,6 +138,10 @@ class CallBuilder(object):
     def auth(self):
         raise NotImplementedError
 
+    @property
+    def timing_sink(self):
+        raise NotImplementedError
+
     def build(self, definition):
         raise NotImplementedError
 
@@ -1,25 +1,83 @@
 # Standard library imports
-import contextlib
+import bisect
+import functools
+import json
 import math
+import os
 import threading
 import time
 import sys
 
+# Third-party imports
+import six
+
 # Local imports
 from uplink import decorators, utils
 from uplink.clients.io import RequestTemplate, transitions
 
-__all__ = ["ratelimit", "RateLimitExceeded"]
+__all__ = [
+    "ratelimit",
+    "RateLimitExceeded",
+    "Backend",
+    "InProcessBackend",
+    "SQLiteBackend",
+]
 
 # Use monotonic time if available, otherwise fall back to the system clock.
 now = time.monotonic if hasattr(time, "monotonic") else time.time
 
+# Guards against waking up a hair before a permit becomes available.
+_MIN_DELAY = 0.001
+
+# Headers that report the server's quota, from the IETF draft standard
+# and the common de facto one.
+_REMAINING_HEADERS = ("RateLimit-Remaining", "X-RateLimit-Remaining")
+_RESET_HEADERS = ("RateLimit-Reset", "X-RateLimit-Reset")
+
+# Reset times beyond this many seconds are Unix timestamps (2001-09-09).
+_MIN_EPOCH_TIME = 10**9
+
 
 def _get_host_and_port(base_url):
     parsed_url = utils.urlparse.urlparse(base_url)
     return parsed_url.hostname, parsed_url.port
 
 
+def _get_header(response, names):
+    headers = getattr(response, "headers", None)
+    for name in names:
+        value = getattr(headers, "get", utils.no_op)(name)
+        if isinstance(value, six.string_types):
+            try:
+                return float(value)
+            except ValueError:
+                pass
+    return None
+
+
+def _get_quota(response):
+    """
+    Returns the number of calls that the server allows and the number
+    of seconds until its quota resets, as reported by the response, or
+    :obj:`None` if the response doesn't report them.
+    """
+    if getattr(response, "status_code", None) == 429:
+        headers = getattr(response, "headers", None)
+        retry_after = getattr(headers, "get", utils.no_op)("Retry-After")
+        delay = utils.parse_retry_after(retry_after)
+        if delay is not None:
+            return 0, delay
+    remaining = _get_header(response, _REMAINING_HEADERS)
+    reset = _get_header(response, _RESET_HEADERS)
+    if remaining is None or reset is None:
+        return None
+    if reset > _MIN_EPOCH_TIME:
+        # The reset time is given as a Unix timestamp, rather than a
+        # number of seconds.
+        reset -= time.time()
+    return remaining, max(0, reset)
+
+
 class RateLimitExceeded(RuntimeError):
     """A request failed because it exceeded the client-side rate limit."""
 
@@ -30,46 +88,404 @@ class RateLimitExceeded(RuntimeError):
         )
 
 
+class Backend(object):
+    """
+    Stores the state of rate limiters.
+
+    A backend decides which limiters share their state: limiters that
+    use the same backend and key enforce a single limit together. To
+    share limits across processes or hosts (e.g., with a network store
+    like Redis), implement :py:meth:`update` as an atomic
+    read-modify-write of the store (e.g., with a transaction).
+    """
+
+    def update(self, key, func):
+        """
+        Atomically updates the state stored under the given key.
+
+        Args:
+            key (str): Identifies the limiter's state.
+            func (callable): Takes the current state, a JSON-compatible
+                :class:`dict` that is empty if no state is stored yet,
+                and modifies it in place.
+
+        Returns:
+            The return value of ``func``.
+        """
+        raise NotImplementedError
+
+
+class InProcessBackend(Backend):
+    """Keeps the state in memory, shared by the threads of a process."""
+
+    def __init__(self):
+        self._states = {}
+        self._lock = threading.RLock()
+
+    def update(self, key, func):
+        with self._lock:
+            return func(self._states.setdefault(key, {}))
+
+
+class SQLiteBackend(Backend):
+    """
+    Keeps the state in a SQLite database, shared by the processes on a
+    host (e.g., the workers of a web server).
+
+    Note:
+        Since the processes share the state, the limiters' clock must
+        be the same for all of them. The default clock,
+        :py:func:`time.monotonic`, is shared by all processes on a host,
+        but it starts over when the host reboots, while the database
+        keeps the state. Limiters discard any state that was saved at a
+        later time than their clock reads now, so a reboot resets the
+        limits instead of making callers wait on stale timestamps.
+
+    Args:
+        path (str): The path of the database file, which is created if
+            it doesn't exist.
+        timeout (float, optional): How many seconds to wait for another
+            process to finish updating the state.
+    """
+
+    _TABLE = "uplink_ratelimit"
+
+    def __init__(self, path, timeout=5.0):
+        self._path = path
+        self._timeout = timeout
+        self._local = threading.local()
+
+    def _get_connection(self):
+        # SQLite connections can't be shared across threads, nor used by
+        # a child process after a fork (e.g., by a preloading server's
+        # workers), so each thread of each process opens its own.
+        pid, connection = getattr(self._local, "connection", (None, None))
+        if pid != os.getpid():
+            # Imported here to keep it out of `import uplink`.
+            import sqlite3
+
+            connection = sqlite3.connect(
+                self._path, timeout=self._timeout, isolation_level=None
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS %s "
+                "(key TEXT PRIMARY KEY, state TEXT NOT NULL)" % self._TABLE
+            )
+            self._local.connection = (os.getpid(), connection)
+        return connection
+
+    def update(self, key, func):
+        connection = self._get_connection()
+        # Lock the database for writing before reading the state, so
+        # that no other process can update it in between.
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT state FROM %s WHERE key = ?" % self._TABLE, (key,)
+            ).fetchone()
+            state = {} if row is None else json.loads(row[0])
+            result = func(state)
+            connection.execute(
+                "INSERT OR REPLACE INTO %s (key, state) VALUES (?, ?)"
+                % self._TABLE,
+                (key, json.dumps(state)),
+            )
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        return result
+
+
 class Limiter(object):
-    _last_reset = _num_calls = None
+    """
+    Hands out permits to make calls at a constrained rate.
+
+    Subclasses implement a specific rate limiting algorithm, keeping
+    their state in a :class:`~uplink.ratelimit.Backend`.
 
-    def __init__(self, max_calls, period, clock):
+    Args:
+        max_calls (int): The maximum number of calls within a period.
+        period (float): The duration of each period in seconds.
+        clock (callable): Returns the current time in seconds.
+        backend (:class:`~uplink.ratelimit.Backend`, optional): Stores
+            the limiter's state. Defaults to a new
+            :class:`~uplink.ratelimit.InProcessBackend`.
+        key (str, optional): Identifies the limiter's state in the
+            backend.
+    """
+
+    def __init__(self, max_calls, period, clock, backend=None, key=""):
         self._max_calls = max_calls
         self._period = period
         self._clock = clock
-        self._lock = threading.RLock()
-        self._reset()
+        self._backend = InProcessBackend() if backend is None else backend
+        self._key = key
 
-    @property
-    def period_remaining(self):
-        return self._period - (self._clock() - self._last_reset)
+    def acquire(self):
+        """
+        Takes a permit to make a call, if one is available.
 
-    @contextlib.contextmanager
-    def check(self):
-        with self._lock:
-            if self.period_remaining <= 0:
-                self._reset()
-            yield self._max_calls > self._num_calls
-            self._num_calls += 1
+        Returns:
+            ``0`` if a permit was taken, otherwise the number of seconds
+            until the next permit becomes available.
+        """
+        return self._backend.update(self._key, self._acquire_now)
+
+    def _now(self, state):
+        now = self._clock()
+        if state.get("saved_at", now) > now:
+            # The clock went back since the state was saved (e.g., the
+            # monotonic clock started over after a reboot), so the
+            # state's timestamps don't mean anything anymore.
+            state.clear()
+        state["saved_at"] = now
+        return now
+
+    def _acquire_now(self, state):
+        now = self._now(state)
+        reserved_until = state.get("reserved_until")
+        if reserved_until is not None and reserved_until > now:
+            # Wait behind the callers that reserved a permit.
+            return reserved_until - now
+        return self._take(state, now)
+
+    def reserve(self):
+        """
+        Takes the next permit, even if it only becomes available in the
+        future.
+
+        Callers get permits in the order that they call this method,
+        so each caller can sleep until its own permit is available,
+        rather than waking up to compete for the next one.
+
+        Returns:
+            The number of seconds until the permit can be used.
+        """
+        return self._backend.update(self._key, self._reserve_now)
+
+    def _reserve_now(self, state):
+        now = self._now(state)
+        when = max(now, state.get("reserved_until", now))
+        delay = self._take(state, when)
+        while delay > 0:
+            # Round up tiny delays, which are just floating-point
+            # error, so that the loop always makes progress.
+            when += max(delay, _MIN_DELAY)
+            delay = self._take(state, when)
+        state["reserved_until"] = when
+        return when - now
 
-    def _reset(self):
-        self._num_calls = 0
-        self._last_reset = self._clock()
+    def update_quota(self, remaining, reset_after):
+        """
+        Adjusts the limiter to the quota that the server reports.
+
+        Until the quota resets, the limiter hands out at most
+        ``remaining`` permits, instead of following its own algorithm.
+
+        Args:
+            remaining (int): The number of calls that the server allows
+                until the quota resets.
+            reset_after (float): The number of seconds until the quota
+                resets.
+        """
+        self._backend.update(
+            self._key,
+            functools.partial(self._update_quota_now, remaining, reset_after),
+        )
+
+    def _update_quota_now(self, remaining, reset_after, state):
+        now = self._now(state)
+        state["quota_remaining"] = max(0, int(remaining))
+        state["quota_reset"] = now + reset_after
+
+    def quota_delay(self):
+        """
+        Returns the number of seconds until the server's quota resets,
+        if it is exhausted, otherwise ``0``.
+        """
+        return self._backend.update(self._key, self._quota_delay_now)
+
+    def _quota_delay_now(self, state):
+        now = self._now(state)
+        reset = state.get("quota_reset")
+        if reset is None or reset <= now or state["quota_remaining"] > 0:
+            return 0
+        return reset - now
+
+    def _take(self, state, now):
+        reset = state.get("quota_reset")
+        if reset is None:
+            return self._acquire(state, now)
+        if reset <= now:
+            # The server's quota has reset, but we don't know the new
+            # one yet.
+            del state["quota_reset"], state["quota_remaining"]
+            return self._acquire(state, now)
+        if state["quota_remaining"] > 0:
+            state["quota_remaining"] -= 1
+            return 0
+        return reset - now
+
+    def _acquire(self, state, now):  # pragma: no cover
+        raise NotImplementedError
+
+
+class FixedWindowLimiter(Limiter):
+    """
+    Allows up to ``max_calls`` calls in each consecutive period.
+
+    This is the simplest algorithm, but it allows up to twice the
+    number of calls around the boundary between two periods.
+    """
+
+    def _acquire(self, state, now):
+        elapsed = now - state.setdefault("window_start", now)
+        if elapsed >= self._period:
+            state["window_start"], state["calls"] = now, 0
+            elapsed = 0
+        calls = state.get("calls", 0)
+        if calls < self._max_calls:
+            state["calls"] = calls + 1
+            return 0
+        return self._period - elapsed
+
+
+class SlidingLogLimiter(Limiter):
+    """
+    Allows up to ``max_calls`` calls within any span of ``period``
+    seconds, by keeping the time of each recent call.
+
+    This is exact, but it keeps a timestamp for each of the last
+    ``max_calls`` calls.
+    """
+
+    def _acquire(self, state, now):
+        log = state.setdefault("log", [])
+        del log[: bisect.bisect_right(log, now - self._period)]
+        if len(log) < self._max_calls:
+            log.append(now)
+            return 0
+        return log[0] + self._period - now
+
+
+class SlidingWindowLimiter(Limiter):
+    """
+    Approximates a sliding log with two counters: the number of calls
+    in the current period, and in the previous period weighted by how
+    much of it overlaps the sliding window.
+    """
+
+    def _acquire(self, state, now):
+        start = state.setdefault("window_start", now)
+        current, previous = state.get("current", 0), state.get("previous", 0)
+        periods = int((now - start) // self._period)
+        if periods > 0:
+            previous = current if periods == 1 else 0
+            current = 0
+            start += periods * self._period
+            state.update(window_start=start, current=0, previous=previous)
+        elapsed = now - start
+        weight = (self._period - elapsed) / self._period
+        if previous * weight + current < self._max_calls:
+            state["current"] = current + 1
+            return 0
+        available = self._max_calls - current
+        if available <= 0 or not previous:
+            # Wait for the next period.
+            return self._period - elapsed
+        # Wait until enough of the previous period slides out.
+        overlap = self._period * (1 - available / float(previous))
+        return max(overlap - elapsed, 0) or _MIN_DELAY
+
+
+class TokenBucketLimiter(Limiter):
+    """
+    Refills a bucket with ``max_calls`` tokens every period, at a
+    steady rate, and takes a token for each call.
+
+    Args:
+        burst (int, optional): The size of the bucket, i.e., the
+            number of calls that can be made at once after the client
+            has been idle. Defaults to ``1``, which spaces calls evenly.
+    """
+
+    def __init__(self, max_calls, period, clock, burst=1, **kwargs):
+        super(TokenBucketLimiter, self).__init__(
+            max_calls, period, clock, **kwargs
+        )
+        self._rate = max_calls / float(period)
+        self._capacity = max(1, burst)
+
+    def _acquire(self, state, now):
+        elapsed = now - state.get("last_refill", now)
+        tokens = state.get("tokens", self._capacity) + elapsed * self._rate
+        tokens = min(self._capacity, tokens)
+        state["last_refill"] = now
+        if tokens >= 1:
+            state["tokens"] = tokens - 1
+            return 0
+        state["tokens"] = tokens
+        return (1 - tokens) / self._rate
+
+
+class GcraLimiter(Limiter):
+    """
+    Implements the Generic Cell Rate Algorithm, which behaves like a
+    token bucket but only keeps the theoretical arrival time of the
+    next call.
+
+    Args:
+        burst (int, optional): The number of calls that can be made at
+            once after the client has been idle. Defaults to ``1``,
+            which spaces calls evenly.
+    """
+
+    def __init__(self, max_calls, period, clock, burst=1, **kwargs):
+        super(GcraLimiter, self).__init__(max_calls, period, clock, **kwargs)
+        self._interval = period / float(max_calls)
+        self._tolerance = self._interval * (max(1, burst) - 1)
+
+    def _acquire(self, state, now):
+        arrival = max(state.get("arrival", now), now)
+        delay = arrival - self._tolerance - now
+        if delay > 0:
+            return delay
+        state["arrival"] = arrival + self._interval
+        return 0
 
 
 class RateLimiterTemplate(RequestTemplate):
-    def __init__(self, limiter, create_limit_reached_exception):
+    def __init__(self, limiter, create_limit_reached_exception, adaptive=False):
         self._limiter = limiter
         self._create_limit_reached_exception = create_limit_reached_exception
+        self._adaptive = adaptive
+        self._has_reservation = False
 
     def before_request(self, request):
-        with self._limiter.check() as ok:
-            if ok:
-                return  # Fallback to default behavior
-            elif self._create_limit_reached_exception is not None:
+        if self._create_limit_reached_exception is not None:
+            if self._limiter.acquire() > 0:
                 raise self._create_limit_reached_exception()
-            else:
-                return transitions.sleep(self._limiter.period_remaining)
+            return  # Fallback to default behavior
+        if self._has_reservation:
+            # Woke up from waiting for the reserved permit, but the
+            # server may have since asked us to back off.
+            delay = self._limiter.quota_delay() if self._adaptive else 0
+            if delay > 0:
+                return transitions.sleep(delay)
+            self._has_reservation = False
+            return
+        delay = self._limiter.reserve()
+        if delay <= 0:
+            return
+        self._has_reservation = True
+        return transitions.sleep(delay)
+
+    def after_response(self, request, response):
+        quota = _get_quota(response) if self._adaptive else None
+        if quota is not None:
+            self._limiter.update_quota(*quota)
+        return  # Fallback to default behavior
 
 
 # noinspection PyPep8Naming
@@ -86,9 +502,46 @@ class ratelimit(decorators.MethodAnnotation):
         capped separately for each group.
 
     By default, when the limit is reached, the client will wait until
-    the current period is over before executing any subsequent
-    requests. If you'd prefer the client to raise an exception when the
-    limit is exceeded, set the ``raise_on_limit`` argument.
+    the next call is allowed before executing any subsequent
+    requests. Waiting requests are sent in the order they were made:
+    each reserves the next permit and sleeps until exactly when it
+    becomes available, so a non-blocking client (e.g.,
+    :class:`~uplink.AiohttpClient`) never blocks its event loop and
+    waiting requests don't wake up to compete for permits. If you'd
+    prefer the client to raise an exception when the limit is exceeded,
+    set the ``raise_on_limit`` argument.
+
+    The ``algorithm`` argument selects how calls are counted:
+
+    - :attr:`FIXED_WINDOW` (default): counts calls in consecutive
+      periods, so up to twice the limit can be made around the boundary
+      between two periods.
+    - :attr:`SLIDING_LOG`: allows up to ``calls`` within any span of
+      ``period`` seconds.
+    - :attr:`SLIDING_WINDOW`: approximates the sliding log with two
+      counters.
+    - :attr:`TOKEN_BUCKET` and :attr:`GCRA`: space calls evenly at a
+      rate of ``calls / period``, allowing up to ``burst`` calls at
+      once after the client has been idle.
+
+    By default, each decorator keeps its own count of calls in memory.
+    To enforce a limit across processes (e.g., the workers of a web
+    server on the same host), pass a shared
+    :class:`~uplink.ratelimit.Backend` with the ``backend`` argument,
+    such as a :class:`~uplink.ratelimit.SQLiteBackend`. Rate limits
+    stored in the same backend with the same ``calls``, ``period``,
+    ``algorithm``, and group share a single count.
+
+    Many servers report their actual quota in response headers. With
+    ``adaptive=True``, the client reads the ``RateLimit-Remaining`` and
+    ``RateLimit-Reset`` headers (or their ``X-RateLimit-*``
+    equivalents), and the ``Retry-After`` header of a
+    ``429 Too Many Requests`` response. Until the server's quota
+    resets, the client makes at most the remaining number of calls,
+    instead of following ``calls`` and ``period``, which serve only as
+    the limit until the first response arrives. When combined with
+    :class:`~uplink.retry`, place :class:`@ratelimit <uplink.ratelimit>`
+    below it, so that the limit sees every response.
 
     Args:
         calls (int): The maximum number of allowed calls that the
@@ -99,10 +552,25 @@ class ratelimit(decorators.MethodAnnotation):
             a :class:`bool`. If :obj:`True`, a
             :class:`~uplink.ratelimit.RateLimitExceeded` exception is
             raised.
+        algorithm (optional): The rate limiting algorithm, given as a
+            :class:`~uplink.ratelimit.Limiter` subclass.
+        burst (int, optional): For :attr:`TOKEN_BUCKET` and
+            :attr:`GCRA`, the number of calls that can be made at once.
+            Defaults to ``1``.
+        backend (:class:`~uplink.ratelimit.Backend`, optional): Where
+            to store the count of calls.
+        adaptive (bool, optional): If :obj:`True`, the client follows
+            the quota that the server reports in its responses.
     """
 
     BY_HOST_AND_PORT = _get_host_and_port
 
+    FIXED_WINDOW = FixedWindowLimiter
+    SLIDING_LOG = SlidingLogLimiter
+    SLIDING_WINDOW = SlidingWindowLimiter
+    TOKEN_BUCKET = TokenBucketLimiter
+    GCRA = GcraLimiter
+
     def __init__(
         self,
         calls=15,
@@ -110,10 +578,18 @@ class ratelimit(decorators.MethodAnnotation):
         raise_on_limit=False,
         group_by=BY_HOST_AND_PORT,
         clock=now,
+        algorithm=FIXED_WINDOW,
+        burst=None,
+        backend=None,
+        adaptive=False,
     ):
         self._max_calls = max(1, min(sys.maxsize, math.floor(calls)))
         self._period = period
         self._clock = clock
+        self._algorithm = algorithm
+        self._algorithm_options = {} if burst is None else {"burst": burst}
+        self._backend = InProcessBackend() if backend is None else backend
+        self._adaptive = adaptive
         self._limiter_cache = {}
         self._group_by = utils.no_op if group_by is None else group_by
 
@@ -133,14 +609,31 @@ class ratelimit(decorators.MethodAnnotation):
         try:
             return self._limiter_cache[key]
         except KeyError:
-            return self._limiter_cache.setdefault(
-                key, Limiter(self._max_calls, self._period, self._clock)
-            )
+            limiter = self._create_limiter(key)
+            return self._limiter_cache.setdefault(key, limiter)
+
+    def _create_limiter(self, group):
+        key = "%s:%s:%s:%r" % (
+            self._algorithm.__name__,
+            self._max_calls,
+            self._period,
+            group,
+        )
+        return self._algorithm(
+            self._max_calls,
+            self._period,
+            self._clock,
+            backend=self._backend,
+            key=key,
+            **self._algorithm_options
+        )
 
     def modify_request(self, request_builder):
         limiter = self._get_limiter_for_request(request_builder)
         request_builder.add_request_template(
-            RateLimiterTemplate(limiter, self._create_limit_reached_exception)
+            RateLimiterTemplate(
+                limiter, self._create_limit_reached_exception, self._adaptive
+            )
         )
 
     def _create_rate_limit_exceeded(self):
@@ -2,10 +2,13 @@
 import random
 import sys
 
+# Local imports
+from uplink import utils
+
 # Constants
 MAX_VALUE = sys.maxsize / 2
 
-__all__ = ["jittered", "exponential", "fixed"]
+__all__ = ["jittered", "exponential", "fixed", "from_response"]
 
 
 def jittered(base=2, multiplier=1, minimum=0, maximum=MAX_VALUE):
@@ -50,3 +53,44 @@ def fixed(seconds):
             yield seconds
 
     return wait_iterator
+
+
+# noinspection PyPep8Naming
+class from_response(object):
+    """
+    Waits for as long as the server asks with the ``Retry-After``
+    header (given either in seconds or as an HTTP-date) of a ``429 Too
+    Many Requests`` or ``503 Service Unavailable`` response.
+
+    If the server doesn't specify a delay (e.g., the request raised an
+    exception), waits using the ``fallback`` backoff instead.
+
+    If the server asks for a longer delay than the retry's ``stop``
+    condition allows (e.g., :class:`~uplink.retry.stop.after_delay`),
+    the request stops being retried, rather than waiting longer.
+
+    Args:
+        fallback (:obj:`callable`, optional): The backoff to use when
+            the server doesn't specify a delay. Defaults to
+            :func:`jittered`.
+        status_codes (tuple, optional): The response status codes whose
+            ``Retry-After`` header is honored.
+    """
+
+    def __init__(self, fallback=None, status_codes=(429, 503)):
+        self._fallback = jittered() if fallback is None else fallback
+        self._status_codes = status_codes
+
+    def __call__(self, *args):
+        return self._fallback(*args)
+
+    def get_delay(self, response):
+        """
+        Returns the number of seconds that the response asks the client
+        to wait before retrying, or :obj:`None`.
+        """
+        if getattr(response, "status_code", None) not in self._status_codes:
+            return None
+        headers = getattr(response, "headers", None)
+        retry_after = getattr(headers, "get", utils.no_op)("Retry-After")
+        return utils.parse_retry_after(retry_after)
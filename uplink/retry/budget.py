@@ -0,0 +1,73 @@
+# Standard library imports
+import collections
+import threading
+
+# Local imports
+from uplink.ratelimit import now
+
+__all__ = ["RetryBudget"]
+
+# The number of slots that the budget's window is divided into.
+_SLOTS = 10
+
+
+class RetryBudget(object):
+    """
+    Limits retries to a fraction of recent requests, so that retries
+    can't multiply the load on a server exactly when it is struggling.
+
+    A retry is allowed only while the number of retries within the last
+    ``ttl`` seconds is at most ``ratio`` times the number of requests
+    within that time, plus a floor of ``min_retries_per_second`` that
+    lets clients with little traffic still retry.
+
+    Share a budget by passing it to one or more
+    :class:`~uplink.retry` decorators (e.g., by decorating a consumer
+    class). The budget is thread-safe, so it can be shared across
+    threads and coroutines.
+
+    Args:
+        ratio (float): The maximum number of retries per request.
+        min_retries_per_second (float): The number of retries that are
+            allowed regardless of the number of requests.
+        ttl (float): For how many seconds requests and retries count
+            against the budget.
+        clock (callable, optional): Returns the current time in seconds.
+    """
+
+    def __init__(self, ratio=0.2, min_retries_per_second=10, ttl=10, clock=now):
+        self._ratio = ratio
+        self._min_retries = min_retries_per_second * ttl
+        self._slot_duration = ttl / float(_SLOTS)
+        self._clock = clock
+        self._slots = collections.deque()
+        self._lock = threading.Lock()
+
+    def _get_current_slot(self):
+        index = int(self._clock() // self._slot_duration)
+        while self._slots and self._slots[0][0] <= index - _SLOTS:
+            self._slots.popleft()
+        if not self._slots or self._slots[-1][0] != index:
+            self._slots.append([index, 0, 0])
+        return self._slots[-1]
+
+    def deposit(self):
+        """Records a request, which adds to the budget for retries."""
+        with self._lock:
+            self._get_current_slot()[1] += 1
+
+    def withdraw(self):
+        """
+        Records a retry, if the budget allows it.
+
+        Returns:
+            :obj:`True` if the retry is allowed, otherwise :obj:`False`.
+        """
+        with self._lock:
+            slot = self._get_current_slot()
+            requests = sum(s[1] for s in self._slots)
+            retries = sum(s[2] for s in self._slots)
+            if retries >= self._ratio * requests + self._min_retries:
+                return False
+            slot[2] += 1
+            return True
@@ -1,5 +1,5 @@
 # Local imports
-from uplink import decorators
+from uplink import decorators, utils
 from uplink.clients.io import RequestTemplate, transitions
 from uplink.retry import (
     when as when_mod,
@@ -12,31 +12,46 @@ __all__ = ["retry"]
 
 
 class RetryTemplate(RequestTemplate):
-    def __init__(self, backoff, retry_condition):
+    def __init__(self, backoff, retry_condition, budget=None):
         self._backoff = backoff
         self._backoff_iterator = None
         self._condition = retry_condition
+        self._budget = budget
+        self._is_retry = False
         self._reset()
 
-    def _next_delay(self):
+    def _next_delay(self, response=None):
         try:
-            delay = next(self._backoff_iterator)
+            # Pass the failed response along, in case the server
+            # specified how long to wait.
+            delay = self._backoff_iterator.send(response)
         except StopIteration:
             # Fallback to the default behavior
             pass
         else:
-            return transitions.sleep(delay)
+            if self._budget is None or self._budget.withdraw():
+                self._is_retry = True
+                return transitions.sleep(delay)
 
     def _reset(self):
         self._backoff_iterator = self._backoff()
+        next(self._backoff_iterator)
+        self._is_retry = False
+
+    def _record_attempt(self):
+        # Only the original request adds to the retry budget.
+        if self._budget is not None and not self._is_retry:
+            self._budget.deposit()
 
     def after_response(self, request, response):
+        self._record_attempt()
         if self._condition.should_retry_after_response(response):
-            return self._next_delay()
+            return self._next_delay(response)
         else:
             self._reset()
 
     def after_exception(self, request, exc_type, exc_val, exc_tb):
+        self._record_attempt()
         if self._condition.should_retry_after_exception(
             exc_type, exc_val, exc_tb
         ):
@@ -89,7 +104,15 @@ class retry(decorators.MethodAnnotation):
             predicates that decide when to stop retrying a request.
         backoff (:obj:`callable`, optional): A function that creates
             an iterator over the ordered sequence of timeouts between
-            retries. If not specified, exponential backoff is used.
+            retries. If not specified, exponential backoff is used. To
+            wait for as long as the server asks with the
+            ``Retry-After`` header, use
+            :class:`~uplink.retry.backoff.from_response`.
+        budget (:class:`~uplink.retry.RetryBudget`, optional): Limits
+            retries to a fraction of recent requests, so that retries
+            don't overload a struggling server. Once the budget is
+            spent, the request stops being retried, and the last
+            response or exception is returned.
     """
 
     _DEFAULT_PREDICATE = when_mod.raises(Exception)
@@ -101,6 +124,7 @@ class retry(decorators.MethodAnnotation):
         on_exception=None,
         stop=None,
         backoff=None,
+        budget=None,
     ):
         if stop is not None:
             self._stop = stop
@@ -118,6 +142,7 @@ class retry(decorators.MethodAnnotation):
             self._predicate = self._DEFAULT_PREDICATE
 
         self._backoff = backoff_mod.jittered() if backoff is None else backoff
+        self._budget = budget
 
     BASE_CLIENT_EXCEPTION = ClientExceptionProxy(
         lambda ex: ex.BaseClientException
@@ -134,16 +159,27 @@ class retry(decorators.MethodAnnotation):
 
     def _create_template(self, request_builder):
         return RetryTemplate(
-            self._backoff_iterator, self._predicate(request_builder)
+            self._backoff_iterator,
+            self._predicate(request_builder),
+            self._budget,
         )
 
     def _backoff_iterator(self):
         stop_gen = self._stop()
-        for delay in self._backoff():
+        delays = self._backoff()
+        get_delay = getattr(self._backoff, "get_delay", utils.no_op)
+        response = yield
+        while True:
+            delay = get_delay(response)
+            if delay is None:
+                try:
+                    delay = next(delays)
+                except StopIteration:
+                    return
             next(stop_gen)
             if stop_gen.send(delay):
-                break
-            yield delay
+                return
+            response = yield delay
 
     stop = stop_mod
     backoff = backoff_mod
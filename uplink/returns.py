@@ -68,9 +68,24 @@ class _ReturnsBase(decorators.MethodAnnotation):
         if converter is not None:
             # Found a converter that can handle the return type.
             request_builder.return_type = return_type.with_strategy(
-                self._make_strategy(converter)
+                self._get_strategy(converter)
             )
 
+    __strategies = None
+
+    def _get_strategy(self, converter):
+        # Converters are resolved once per request definition, so reuse
+        # the strategy built around the same converter.
+        if self.__strategies is None:
+            self.__strategies = {}
+        try:
+            return self.__strategies[converter]
+        except TypeError:
+            return self._make_strategy(converter)
+        except KeyError:
+            strategy = self._make_strategy(converter)
+            return self.__strategies.setdefault(converter, strategy)
+
 
 class JsonStrategy(object):
     # TODO: Consider moving this under json decorator
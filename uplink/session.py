@@ -16,9 +16,27 @@ class Session(object):
         self.__params = None
         self.__headers = None
         self.__context = None
+        self.__calls = {}
 
     def create(self, consumer, definition):
-        return self.__builder.build(definition, consumer)
+        """
+        Returns a callable that executes the given request definition
+        for the consumer instance.
+
+        The callable is built on first use and reused afterwards, until
+        the session's configuration changes.
+        """
+        try:
+            return self.__calls[definition]
+        except KeyError:
+            call = self.__builder.build(definition, consumer)
+            return self.__calls.setdefault(definition, call)
+
+    def _invalidate(self):
+        # Callables capture the session's configuration when they are
+        # built, so they need to be rebuilt once that configuration
+        # changes.
+        self.__calls.clear()
 
     @property
     def base_url(self):
@@ -27,6 +45,11 @@ class Session(object):
         """
         return self.__builder.base_url
 
+    @base_url.setter
+    def base_url(self, base_url):
+        self.__builder.base_url = base_url
+        self._invalidate()
+
     @property
     def headers(self):
         """
@@ -68,6 +91,31 @@ class Session(object):
     @auth.setter
     def auth(self, auth):
         self.__builder.auth = auth
+        self._invalidate()
+
+    @property
+    def timing_sink(self):
+        """
+        A callable that receives the
+        :class:`~uplink.instrumentation.CallTimings` of each request
+        sent from this consumer instance, once the request finishes.
+
+        Timing is disabled when this property is :obj:`None`, which is
+        the default.
+
+        Example usage:
+
+        .. code-block:: python
+
+            github = GitHub(BASE_URL)
+            github.session.timing_sink = lambda timings: print(timings)
+        """
+        return self.__builder.timing_sink
+
+    @timing_sink.setter
+    def timing_sink(self, sink):
+        self.__builder.timing_sink = sink
+        self._invalidate()
 
     def inject(self, hook, *more_hooks):
         """
@@ -76,3 +124,4 @@ class Session(object):
         :class:`~uplink.error_handler`) to the session.
         """
         self.__builder.add_hook(hook, *more_hooks)
+        self._invalidate()
@@ -1,6 +1,15 @@
 # Standard library imports
 import collections
+import email.utils
+import functools
+import importlib
 import inspect
+import re
+import sys
+import time
+
+# Third-party imports
+import six
 
 try:
     # Python 3.2+
@@ -21,7 +30,6 @@ except ImportError:  # pragma: no cover
             args.append(arg_spec.keywords)
         return Signature(args, {}, None)
 
-
 else:  # pragma: no cover
 
     def get_call_args(f, *args, **kwargs):
@@ -77,6 +85,84 @@ Signature = collections.namedtuple(
 Request = collections.namedtuple("Request", "method uri info return_type")
 
 
+def _get_defaults(parameters):
+    var_positional = var_keyword = None
+    defaults = {}
+    for p in parameters:
+        if p.default is not p.empty:
+            defaults[p.name] = p.default
+        elif p.kind is p.VAR_POSITIONAL:
+            var_positional = p.name
+            defaults[p.name] = ()
+        elif p.kind is p.VAR_KEYWORD:
+            var_keyword = p.name
+    return var_positional, var_keyword, defaults
+
+
+def compile_call_args(f):
+    """
+    Returns a function that accepts the same arguments as ``f`` and
+    returns the same mapping as :py:func:`get_call_args`.
+
+    Unlike :py:func:`get_call_args`, the signature of ``f`` is
+    inspected only once, here. Calls that the fast path can't bind
+    (e.g., missing or unexpected arguments) defer to
+    :py:func:`get_call_args`, which raises the appropriate error.
+    """
+    try:
+        parameters = list(signature(f).parameters.values())
+    except ImportError:  # pragma: no cover
+        # Python 2.7
+        return functools.partial(get_call_args, f)
+    if any(p.kind is p.POSITIONAL_ONLY for p in parameters):
+        return functools.partial(get_call_args, f)
+
+    names = tuple(p.name for p in parameters)
+    positional = tuple(
+        p.name for p in parameters if p.kind is p.POSITIONAL_OR_KEYWORD
+    )
+    keywords = frozenset(
+        p.name
+        for p in parameters
+        if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+    )
+    var_positional, var_keyword, defaults = _get_defaults(parameters)
+    max_positional = len(positional)
+
+    def bind(*args, **kwargs):
+        bound = dict(zip(positional, args))
+        if len(args) > max_positional:
+            if var_positional is None:
+                return get_call_args(f, *args, **kwargs)
+            bound[var_positional] = args[max_positional:]
+        if kwargs:
+            extra = {}
+            for name in kwargs:
+                if name in keywords:
+                    if name in bound:
+                        return get_call_args(f, *args, **kwargs)
+                    bound[name] = kwargs[name]
+                elif var_keyword is not None:
+                    extra[name] = kwargs[name]
+                else:
+                    return get_call_args(f, *args, **kwargs)
+            if var_keyword is not None:
+                bound[var_keyword] = extra
+        call_args = collections.OrderedDict()
+        for name in names:
+            if name in bound:
+                call_args[name] = bound[name]
+            elif name in defaults:
+                call_args[name] = defaults[name]
+            elif name == var_keyword:
+                call_args[name] = {}
+            else:
+                return get_call_args(f, *args, **kwargs)
+        return call_args
+
+    return bind
+
+
 def is_subclass(cls, class_info):
     return inspect.isclass(cls) and issubclass(cls, class_info)
 
@@ -85,6 +171,68 @@ def no_op(*_, **__):
     pass
 
 
+def parse_retry_after(value):
+    """
+    Returns the number of seconds to wait that a ``Retry-After`` header
+    specifies, either as a number of seconds or as an HTTP-date, or
+    :obj:`None` if the value is invalid.
+    """
+    if not isinstance(value, six.string_types):
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        date = email.utils.parsedate_tz(value)
+        if date is None:
+            return None
+        return max(0.0, email.utils.mktime_tz(date) - time.time())
+
+
+def is_imported(module_name):
+    return module_name in sys.modules
+
+
+class _ModuleProxy(object):
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, item):
+        return getattr(importlib.import_module(self._name), item)
+
+
+class LazyModule(object):
+    """
+    A class attribute that refers to an optional module, without
+    importing the module until one of its attributes is accessed.
+
+    The attribute is :obj:`None` if the module is not installed.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._proxy = None
+
+    def _find_module(self):
+        try:
+            from importlib.util import find_spec
+        except ImportError:  # pragma: no cover
+            # Python 2.7
+            try:
+                importlib.import_module(self._name)
+            except ImportError:
+                return False
+            return True
+        return find_spec(self._name) is not None
+
+    def __get__(self, instance, owner):
+        module = sys.modules.get(self._name)
+        if module is not None:
+            return module
+        if self._proxy is None:
+            self._proxy = self._find_module() and _ModuleProxy(self._name)
+        return self._proxy or None
+
+
 class URIBuilder(object):
     @staticmethod
     def variables(uri):
@@ -104,3 +252,111 @@ class URIBuilder(object):
 
     def build(self):
         return self._uri.expand()
+
+
+class URITemplate(object):
+    """
+    A URI template that is parsed once, when the template is created,
+    and can be expanded many times.
+
+    Templates whose expressions are all simple string (e.g.,
+    ``{var}``) or path segment (e.g., ``{/var}``) expansions of a
+    single variable are expanded directly. Any other template (or a
+    variable value that isn't a string or number) is handled by the
+    full RFC 6570 implementation of :py:mod:`uritemplate`.
+    """
+
+    _EXPRESSION = re.compile("{([^}]+)}")
+    _SIMPLE_EXPRESSION = re.compile(r"^(/?)(\w+)$")
+    _SCALARS = (str, int, float)
+
+    def __init__(self, uri):
+        uri = uri or ""
+        parts = self._EXPRESSION.split(uri)
+        self._uri = uri
+        self._template = None
+        self._expressions = []
+        self._tail = parts[-1]
+        for i in range(1, len(parts), 2):
+            match = self._SIMPLE_EXPRESSION.match(parts[i])
+            if match is None:
+                self._expressions = None
+                break
+            operator, name = match.groups()
+            self._expressions.append((parts[i - 1], operator, name))
+
+    @property
+    def template(self):
+        if self._template is None:
+            self._template = uritemplate.URITemplate(self._uri)
+        return self._template
+
+    @property
+    def variable_names(self):
+        if self._expressions is None:
+            return self.template.variable_names
+        return set(name for _, _, name in self._expressions)
+
+    def expand(self, variables):
+        if self._expressions is None:
+            return self.template.expand(variables)
+        expanded = []
+        for literal, operator, name in self._expressions:
+            expanded.append(literal)
+            value = variables.get(name)
+            if value is None:
+                continue
+            if not isinstance(value, self._SCALARS):
+                return self.template.expand(variables)
+            expanded.append(operator + urlparse.quote(str(value), safe=""))
+        expanded.append(self._tail)
+        return "".join(expanded)
+
+    def __str__(self):
+        return self._uri
+
+
+class URLJoiner(object):
+    """
+    Joins relative URLs with a base URL, like
+    :py:func:`urlparse.urljoin`, but parses the base URL only once.
+
+    Relative URLs that need more than concatenation to be resolved
+    (e.g., with dot segments, a scheme, or a fragment) fall back to
+    :py:func:`urlparse.urljoin`.
+    """
+
+    _SCHEMES = ("http", "https")
+    _RESERVED = re.compile(r"[:;#]|//|(^|/)\.\.?(/|$)")
+
+    def __init__(self, base_url):
+        self._base_url = base_url
+        self._root = self._directory = None
+        if base_url:
+            parts = urlparse.urlsplit(base_url)
+            path = parts.path
+            if (
+                parts.scheme in self._SCHEMES
+                and parts.netloc
+                and not self._RESERVED.search(path)
+            ):
+                self._root = urlparse.urlunsplit(
+                    (parts.scheme, parts.netloc, "", "", "")
+                )
+                self._directory = path[: path.rfind("/") + 1] or "/"
+
+    def __call__(self, url):
+        if self._root is not None and url:
+            path, separator, query = url.partition("?")
+            # `urljoin` drops an empty query string, so defer to it in
+            # that case.
+            if (
+                path
+                and not self._RESERVED.search(path)
+                and "#" not in query
+                and (query or not separator)
+            ):
+                if path.startswith("/"):
+                    return self._root + url
+                return self._root + self._directory + url
+        return urlparse.urljoin(self._base_url, url)